@@ -0,0 +1,62 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Microbenchmarks for ``utilities.list_to_filter``.
+
+Run from the repository root with ``python -m benchmarks.bench_filters``.
+"""
+
+import timeit
+from datetime import date, timedelta
+
+from pandas import Series
+
+from spgci import utilities
+
+N = 100_000
+
+cases = {
+    "int series": Series(range(N)),
+    "str series": Series([f"PCAAS{i:05d}" for i in range(N)]),
+    "date series": Series(
+        [date(2000, 1, 1) + timedelta(days=i % 9000) for i in range(N)]
+    ),
+    "str list": [f"PCAAS{i:05d}" for i in range(N)],
+    "short str list": ["PCAAS00", "PCAAT00", "AAGXJ00"],
+}
+
+
+def main() -> None:
+    for name, items in cases.items():
+        number = 10 if len(items) > 100 else 10_000
+        utilities._cached_in_filter.cache_clear()
+        cold = timeit.timeit(
+            lambda: (
+                utilities._cached_in_filter.cache_clear(),
+                utilities.list_to_filter("symbol", items),
+            ),
+            number=number,
+        )
+        warm = timeit.timeit(
+            lambda: utilities.list_to_filter("symbol", items), number=number
+        )
+        print(
+            f"{name:>16}: cold {cold / number * 1e3:8.3f} ms  "
+            f"warm {warm / number * 1e3:8.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark stripping html from Insights article pulls.
+
+Run from the repository root with ``python -m benchmarks.bench_html_strip``.
+"""
+
+import html
+import os
+import random
+import time
+
+from pandas import DataFrame
+
+from spgci.utilities import strip_html_columns
+
+N_ARTICLES = 5_000
+COLUMNS = ["headline", "body", "lead", "summary"]
+
+WORDS = (
+    "crude Brent WTI OPEC refinery margin barrel cargo tanker freight diesel "
+    "gasoline naphtha Rotterdam Singapore Houston spread backwardation contango"
+).split()
+
+
+def paragraph() -> str:
+    words = []
+    for _ in range(random.randint(30, 90)):
+        word = random.choice(WORDS)
+        roll = random.random()
+        if roll < 0.04:
+            word = f"<strong>{word}</strong>"
+        elif roll < 0.06:
+            word = f'<a href="https://www.spglobal.com/commodityinsights/{word}">{word}</a>'
+        elif roll < 0.09:
+            word = f"{word}&nbsp;&ndash;" if roll < 0.065 else f"{word}&#39;s"
+        elif roll < 0.1:
+            word = f"{word} &amp; co"
+        words.append(word)
+    return f"<p>{' '.join(words)}</p>\n"
+
+
+def articles() -> DataFrame:
+    random.seed(0)
+    rows = []
+    for i in range(N_ARTICLES):
+        body = "".join(paragraph() for _ in range(random.randint(4, 30)))
+        rows.append(
+            {
+                "headline": f"<b>{random.choice(WORDS)}</b> prices &amp; spreads {i}",
+                "body": body,
+                "lead": body[:600],
+                "summary": None if i % 5 == 0 else body[:300],
+            }
+        )
+    return DataFrame(rows)
+
+
+def legacy(df: DataFrame) -> DataFrame:
+    for column in COLUMNS:
+        df[column] = df[column].str.replace(r"<.*?>", " ", regex=True)
+        df[column] = df[column].apply(
+            lambda s: html.unescape(str(s)).replace("\n", " ")
+        )
+    return df
+
+
+def timed(fn, df: DataFrame) -> float:
+    start = time.perf_counter()
+    fn(df.copy())
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    df = articles()
+    size = sum(df[c].dropna().str.len().sum() for c in COLUMNS) / 1e6
+    print(f"{N_ARTICLES} articles, {size:.1f} MB of text")
+    print(f"  legacy str.replace + apply  {timed(legacy, df) * 1e3:8.1f} ms")
+    print(
+        f"  strip_html_columns          {timed(lambda d: strip_html_columns(d, COLUMNS), df) * 1e3:8.1f} ms"
+    )
+
+    cpus = os.cpu_count() or 1
+    if cpus > 1:
+        processes = min(cpus, 8)
+        strip_html_columns(df.head(1).copy(), COLUMNS, processes)  # start the pool
+        run = lambda d: strip_html_columns(d, COLUMNS, processes)  # noqa: E731
+        print(
+            f"  strip_html_columns x{processes} procs  {timed(run, df) * 1e3:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
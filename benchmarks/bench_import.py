@@ -0,0 +1,75 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark the time and memory ``import spgci`` costs a fresh interpreter.
+
+Run from the repository root with ``python -m benchmarks.bench_import``. Each case
+runs in its own process; the interpreter start-up alone is reported as the baseline.
+Pass ``--check`` to exit non-zero when ``import spgci`` loads pandas again.
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+
+RUNS = 7
+
+CASES = {
+    "python (baseline)": "pass",
+    "import spgci": "import spgci",
+    "spgci.MarketData": "import spgci; spgci.MarketData",
+    "spgci.AmericasGas": "import spgci; spgci.AmericasGas",
+    "every client": "import spgci; [getattr(spgci, n) for n in spgci.__all__]",
+}
+
+PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform == "darwin":
+    rss //= 1024
+loaded = "pandas" in sys.modules
+print(json.dumps({{"seconds": elapsed, "rss_kb": rss, "pandas": loaded}}))
+"""
+
+
+def measure(code: str) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE.format(code=code)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main() -> None:
+    check = "--check" in sys.argv
+    print(f"median of {RUNS} fresh interpreters")
+    for name, code in CASES.items():
+        runs = [measure(code) for _ in range(RUNS)]
+        seconds = statistics.median(r["seconds"] for r in runs)
+        rss = statistics.median(r["rss_kb"] for r in runs) / 1024
+        pandas = " (pandas loaded)" if runs[0]["pandas"] else ""
+        print(f"  {name:<20} {seconds * 1e3:8.1f} ms  {rss:7.1f} MB RSS{pandas}")
+        if check and name == "import spgci" and runs[0]["pandas"]:
+            sys.exit("import spgci loaded pandas")
+
+
+if __name__ == "__main__":
+    main()
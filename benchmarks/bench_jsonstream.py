@@ -0,0 +1,89 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark turning one large JSON page into a DataFrame.
+
+Run from the repository root with ``python -m benchmarks.bench_jsonstream``. The body
+mimics a ``MarketData`` history page of 10,000 rows; the peak of memory allocated
+while parsing is measured with ``tracemalloc`` on top of the raw body.
+"""
+
+import io
+import json
+import time
+import tracemalloc
+
+import requests
+from pandas import DataFrame
+
+import spgci.config as config
+from spgci.jsonstream import read_frame
+
+N_ROWS = 200_000
+
+
+def body() -> bytes:
+    results = [
+        {
+            "symbol": f"PCA{i % 5000:05d}",
+            "assessDate": f"2026-{1 + i % 12:02d}-{1 + i % 28:02d}T00:00:00",
+            "bate": "c",
+            "value": 60 + (i % 997) / 10,
+            "modDate": "2026-10-01T12:30:00.000",
+            "isCorrected": "N",
+        }
+        for i in range(N_ROWS)
+    ]
+    return json.dumps({"metadata": {"totalPages": 1}, "results": results}).encode()
+
+
+def response(raw: bytes) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.raw = io.BytesIO(raw)
+    resp.headers["transfer-encoding"] = "chunked"
+    return resp
+
+
+def whole(resp: requests.Response) -> DataFrame:
+    return DataFrame(resp.json()["results"])
+
+
+def measure(name: str, raw: bytes, fn) -> None:
+    start = time.perf_counter()
+    df = fn(response(raw))
+    elapsed = time.perf_counter() - start
+    # traced separately, tracemalloc slows the parse down
+    tracemalloc.start()
+    fn(response(raw))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"  {name:<12} {elapsed * 1e3:8.1f} ms  peak {peak / 2**20:7.1f} MB"
+        f"  ({len(df):,} rows)"
+    )
+
+
+def main() -> None:
+    raw = body()
+    print(f"{N_ROWS:,} records, {len(raw) / 2**20:.1f} MB body")
+    measure("resp.json()", raw, whole)
+    # streaming is opt-in
+    config.stream_json_bytes = 1 << 20
+    measure("read_frame", raw, read_frame)
+
+
+if __name__ == "__main__":
+    main()
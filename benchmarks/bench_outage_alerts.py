@@ -0,0 +1,122 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark flattening refinery outage alerts into a DataFrame.
+
+Run from the repository root with ``python -m benchmarks.bench_outage_alerts``. The
+body mimics years of ``WorldRefineryData.get_outage_alerts`` results: 40,000 outages
+with five alerts each. The previous ``json_normalize`` path, with dates parsed
+without a format, is timed against ``WorldRefineryData._outage_alerts_to_df``, first
+end to end and then for the flattening of already parsed records alone.
+"""
+
+import io
+import json
+import time
+
+import requests
+from pandas import DataFrame, json_normalize, to_datetime
+from pandas.testing import assert_frame_equal
+
+from spgci.wrd import WorldRefineryData
+
+N_OUTAGES = 40_000
+N_ALERTS = 5
+
+
+def body() -> bytes:
+    results = []
+    for i in range(N_OUTAGES):
+        day = f"20{20 + i % 6}-{1 + i % 12:02d}-{1 + i % 28:02d}"
+        results.append(
+            {
+                "outageId": i,
+                "refineryId": 1000 + i % 800,
+                "operatorname": f"Operator {i % 300}",
+                "countryName": f"Country {i % 90}",
+                "cityName": f"City {i % 700}",
+                "latitude": 10 + (i % 500) / 10,
+                "longitude": -50 + (i % 900) / 10,
+                "createdDate": f"{day}T08:15:00Z",
+                "alerts": [
+                    {
+                        "alertId": i * N_ALERTS + a,
+                        "processUnit": f"Unit {a}",
+                        "capacityOffline": 10.0 + a,
+                        "planningStatus": "Planned" if a % 2 else "Unplanned",
+                        "startDate": f"{day}T00:00:00",
+                        "endDate": f"{day}T23:00:00",
+                        "modifiedDate": f"{day}T09:{a:02d}:00Z",
+                    }
+                    for a in range(N_ALERTS)
+                ],
+            }
+        )
+    return json.dumps({"metadata": {"count": N_OUTAGES}, "results": results}).encode()
+
+
+def response(raw: bytes) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.raw = io.BytesIO(raw)
+    resp.headers["content-length"] = str(len(raw))
+    return resp
+
+
+def normalize(resp: requests.Response) -> DataFrame:
+    # the implementation replaced by the vectorised flattening
+    df = json_normalize(
+        resp.json()["results"],
+        meta=WorldRefineryData._alert_meta,
+        record_path="alerts",
+    )
+    df["createdDate"] = to_datetime(df["createdDate"], utc=True)
+    df["modifiedDate"] = to_datetime(df["modifiedDate"], utc=True)
+    df["startDate"] = to_datetime(df["startDate"])
+    df["endDate"] = to_datetime(df["endDate"])
+    return df
+
+
+def measure(name: str, raw: bytes, fn) -> DataFrame:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        df = fn(response(raw))
+        best = min(best, time.perf_counter() - start)
+    print(f"  {name:<22} {best * 1e3:8.1f} ms  ({len(df):,} rows)")
+    return df
+
+
+def main() -> None:
+    raw = body()
+    meta = WorldRefineryData._alert_meta
+    print(f"{N_OUTAGES * N_ALERTS:,} alerts, {len(raw) / 2**20:.1f} MB body")
+    old = measure("json_normalize", raw, normalize)
+    new = measure("_outage_alerts_to_df", raw, WorldRefineryData._outage_alerts_to_df)
+    # numeric outage fields used to come out as object columns
+    assert_frame_equal(old, new, check_dtype=False)
+
+    outages = json.loads(raw)["results"]
+    for name, flatten in (
+        ("json_normalize", lambda: json_normalize(outages, "alerts", meta)),
+        ("_flatten_alerts", lambda: WorldRefineryData._flatten_alerts(outages)),
+    ):
+        start = time.perf_counter()
+        flatten()
+        print(f"  {name:<22} {(time.perf_counter() - start) * 1e3:8.1f} ms  flatten")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark building Scenario Manager payloads for 1,000 cases.
+
+Run from the repository root with ``python -m benchmarks.bench_rsm_payload``.
+"""
+
+import random
+import time
+
+import numpy as np
+from pandas import DataFrame
+
+from spgci import rsm
+from spgci.rsm import Rsm, RsmCase
+
+N_CASES = 1_000
+N_CRUDES = 250
+N_PRODUCTS = 60
+
+
+def defaults() -> DataFrame:
+    rows = []
+    for i in range(N_CRUDES):
+        crude = f"Crude {i}"
+        rows.append(("percentage", crude, 100 / 8 if i < 8 else 0.0))
+        rows.append(("crudePricing", crude, 60 + i % 30))
+        rows.append(("transportationCosts", crude, np.nan if i % 17 == 0 else 2.5))
+    for i in range(N_PRODUCTS):
+        product = f"Product {i}"
+        rows.append(("productPrice", product, 90 + i))
+        rows.append(("premiumsDiscounts", product, np.inf if i % 23 == 0 else -1.0))
+        rows.append(("transportationCosts", product, 3.0))
+    for unit in ("aps", "vdu", "fcc", "reformer", "alky"):
+        rows.append(("capacityAndUtilization", unit, 100.0))
+    return DataFrame(rows, columns=["category", "asset", "defaultValue"])
+
+
+def cases() -> list:
+    random.seed(0)
+    base = RsmCase(defaults())
+    variants = []
+    for i in range(N_CASES):
+        slate = {f"Crude {c}": 10.0 for c in random.sample(range(N_CRUDES), 10)}
+        variants.append(
+            base.copy(name=f"Case {i}")
+            .set_crude_slate(slate)
+            .set_product("Product 1", 100 + i % 50)
+        )
+    return variants
+
+
+def build(variants: list) -> float:
+    start = time.perf_counter()
+    for index, case in enumerate(variants):
+        Rsm()._build_scenario_case(case, index)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    variants = cases()
+    for case in variants:
+        case.df  # fold pending edits so only payload construction is timed
+
+    rsm._SECTIONS_CACHE.clear()
+    cold = build(variants)
+    warm = build(variants)
+    print(f"{N_CASES} cases: cold {cold * 1e3:8.1f} ms  cached {warm * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -24,44 +24,109 @@ Getting Started
 \n
 """
 
-from .market_data import MarketData
-from .forward_curves import ForwardCurves
-from .ewindow_md import EWindowMarketData
-from .wos import WorldOilSupply
-from .wrd import WorldRefineryData
-from .oil_demand import GlobalOilDemand
-from .api_client import get_token
-from .epf import EnergyPriceForecast
-from .insights import Insights
-from .na_gas import NANaturalGasAnalytics
-from .crude_supply_risk import CrudeAnalytics
-from .giem import GlobalIntegratedEnergyModel
-from .lng_analytics import LNGGlobalAnalytics
-from .arbflow import Arbflow
-from .structured_heards import StructuredHeards
-from .weather import Weather
-from .chemicals import Chemicals
-from .eu_gas_analytics import EUGasAnalytics
-from .oil_ngl_analytics import OilNGLAnalytics
-from .integrated_energy_scenarios import IntegratedEnergyScenarios
-from .agriculture_and_food import AgriAndFood
-from .americas_gas import AmericasGas
-from .eu_power import EUPower
-from .gas_long_term_supply_and_demand import GasLongTermSupplyAndDemand
-from .scenario_manager import ScenarioManager
-from .utilities import parallel
-from .smart_heards import SmartHeards
-from .rsm import Rsm
-from .cet_economic_outlooks import CetEconomicOutlooks
-from .cet_market_outlooks import CetMarketOutlooks
-from .global_eac_analytics import GlobalEacAnalytics
-from .metals import Metals
-
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
 from .config import username, password, set_credentials, version
 
 __version__ = version
 
+#: public names and the module defining them, imported on first access so that
+#: ``import spgci`` does not load every dataset client (and pandas) up front
+_LAZY = {
+    "MarketData": ".market_data",
+    "ForwardCurves": ".forward_curves",
+    "EWindowMarketData": ".ewindow_md",
+    "WorldOilSupply": ".wos",
+    "WorldRefineryData": ".wrd",
+    "GlobalOilDemand": ".oil_demand",
+    "get_token": ".api_client",
+    "EnergyPriceForecast": ".epf",
+    "Insights": ".insights",
+    "NANaturalGasAnalytics": ".na_gas",
+    "CrudeAnalytics": ".crude_supply_risk",
+    "GlobalIntegratedEnergyModel": ".giem",
+    "LNGGlobalAnalytics": ".lng_analytics",
+    "Arbflow": ".arbflow",
+    "StructuredHeards": ".structured_heards",
+    "Weather": ".weather",
+    "Chemicals": ".chemicals",
+    "EUGasAnalytics": ".eu_gas_analytics",
+    "OilNGLAnalytics": ".oil_ngl_analytics",
+    "IntegratedEnergyScenarios": ".integrated_energy_scenarios",
+    "AgriAndFood": ".agriculture_and_food",
+    "AmericasGas": ".americas_gas",
+    "EUPower": ".eu_power",
+    "GasLongTermSupplyAndDemand": ".gas_long_term_supply_and_demand",
+    "ScenarioManager": ".scenario_manager",
+    "parallel": ".utilities",
+    "SmartHeards": ".smart_heards",
+    "Rsm": ".rsm",
+    "CetEconomicOutlooks": ".cet_economic_outlooks",
+    "CetMarketOutlooks": ".cet_market_outlooks",
+    "GlobalEacAnalytics": ".global_eac_analytics",
+    "Metals": ".metals",
+}
+
+if TYPE_CHECKING:
+    from .market_data import MarketData
+    from .forward_curves import ForwardCurves
+    from .ewindow_md import EWindowMarketData
+    from .wos import WorldOilSupply
+    from .wrd import WorldRefineryData
+    from .oil_demand import GlobalOilDemand
+    from .api_client import get_token
+    from .epf import EnergyPriceForecast
+    from .insights import Insights
+    from .na_gas import NANaturalGasAnalytics
+    from .crude_supply_risk import CrudeAnalytics
+    from .giem import GlobalIntegratedEnergyModel
+    from .lng_analytics import LNGGlobalAnalytics
+    from .arbflow import Arbflow
+    from .structured_heards import StructuredHeards
+    from .weather import Weather
+    from .chemicals import Chemicals
+    from .eu_gas_analytics import EUGasAnalytics
+    from .oil_ngl_analytics import OilNGLAnalytics
+    from .integrated_energy_scenarios import IntegratedEnergyScenarios
+    from .agriculture_and_food import AgriAndFood
+    from .americas_gas import AmericasGas
+    from .eu_power import EUPower
+    from .gas_long_term_supply_and_demand import GasLongTermSupplyAndDemand
+    from .scenario_manager import ScenarioManager
+    from .utilities import parallel
+    from .smart_heards import SmartHeards
+    from .rsm import Rsm
+    from .cet_economic_outlooks import CetEconomicOutlooks
+    from .cet_market_outlooks import CetMarketOutlooks
+    from .global_eac_analytics import GlobalEacAnalytics
+    from .metals import Metals
+
+
+def __getattr__(name: str) -> Any:
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = _LAZY.get(name)
+    if module is None:
+        # submodules, e.g. ``ci.utilities`` or ``ci.memo``
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as exc:
+            if exc.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     "MarketData",
@@ -98,5 +163,5 @@ __all__ = [
     "CetEconomicOutlooks",
     "CetMarketOutlooks",
     "GlobalEacAnalytics",
-    "Metals"
+    "Metals",
 ]
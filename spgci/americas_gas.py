@@ -16,6 +16,8 @@ from __future__ import annotations
 from typing import List, Optional, Union
 from requests import Response
 from spgci.api_client import get_data
+from spgci.facets import unique_values
+from spgci.jsonstream import read_frame
 from spgci.utilities import list_to_filter
 from pandas import DataFrame, Series
 from datetime import date, datetime
@@ -117,8 +119,7 @@ class AmericasGas:
             params["filter"] = build_filter_expression_with_strategy(filters, strategy="platts")
 
         def to_df(resp: Response):
-            j = resp.json()
-            df = pd.json_normalize(j["aggResultValue"])
+            df = read_frame(resp, "aggResultValue", pd.json_normalize)
             columns_dt = ["lastModifiedDate", "flowDate", "forecastDate", "postingDatetime",
             "createDate", "measurementDate", "effectiveDate", "endDate",
             "validFrom", "validTo", "dateEffective", "dateRetire", "dateIssued",
@@ -131,7 +132,12 @@ class AmericasGas:
                     df[c] = pd.to_datetime(df[c], utc=True, format="ISO8601", errors="coerce")
             return df
 
-        return get_data(path, params, to_df, paginate=True)
+        return unique_values(
+            path,
+            columns,
+            params.get("filter"),
+            lambda: get_data(path, params, to_df, paginate=True),
+        )
     
     def get_reference_data_geography(
         self,
@@ -16,19 +16,67 @@
 
 import threading
 import warnings
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import ContextVar, copy_context
+from concurrent.futures import (
+    CancelledError,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from functools import partial
 from time import sleep
-from typing import Any, Callable, Dict, NamedTuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from urllib.parse import parse_qsl, quote, urlencode, urlparse
 
 import pandas as pd
 import requests
 import spgci.config
+import spgci.deadline
 from pandas import DataFrame
-from spgci.auth import get_token
-from spgci.exceptions import AuthError, DailyLimitError, PerSecondLimitError
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_fixed
-from tqdm import tqdm
+from spgci.auth import credential_key, get_token, token_manager
+from spgci.exceptions import (
+    AuthError,
+    DailyLimitError,
+    DeadlineExceededError,
+    PaginationError,
+    PerSecondLimitError,
+)
+from spgci.compression import accept_encoding, observe
+from spgci.hedge import hedger
+from spgci.jsonstream import read_frame
+from spgci.memo import get_memo
+from spgci.quota import get_coordinator
+from spgci.scheduler import Priority, explicit_priority, priority, scheduler
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception_type,
+    stop_any,
+    stop_after_attempt,
+    wait_fixed,
+)
+
+
+def _stop_past_deadline(wait: float) -> Callable[[RetryCallState], bool]:
+    """Don't retry when the wait before the next attempt would use up the deadline."""
+
+    def stop(retry_state: RetryCallState) -> bool:
+        left = spgci.deadline.remaining()
+        return left is not None and left <= wait
+
+    return stop
+
 
 _auth_retry = retry(
     retry=retry_if_exception_type(AuthError),
@@ -40,14 +88,14 @@ _throttle_retry = retry(
     retry=retry_if_exception_type(PerSecondLimitError),
     reraise=True,
     wait=wait_fixed(1),
-    stop=stop_after_attempt(5),
+    stop=stop_any(stop_after_attempt(5), _stop_past_deadline(1)),
 )
 
 _timeout_retry = retry(
     retry=retry_if_exception_type(requests.exceptions.Timeout),
     reraise=True,
     wait=wait_fixed(1),
-    stop=stop_after_attempt(3),
+    stop=stop_any(stop_after_attempt(3), _stop_past_deadline(1)),
 )
 
 
@@ -60,8 +108,7 @@ class Paginator(NamedTuple):
 
 
 def _to_df(resp: requests.Response) -> DataFrame:
-    j = resp.json()
-    return DataFrame(j["results"])
+    return read_frame(resp, "results")
 
 
 def _convert_to_df(resp: requests.Response) -> DataFrame:
@@ -90,6 +137,121 @@ def _paginate(resp: requests.Response) -> Paginator:
 _session = requests.Session()
 _token_lock = threading.Lock()
 
+#: set once a page of the paginated call this request belongs to has failed
+_cancel_token: "ContextVar[Optional[threading.Event]]" = ContextVar(
+    "spgci_cancel_token", default=None
+)
+
+
+def _raise_if_cancelled() -> None:
+    """Stop a request whose paginated call already failed, before it spends quota."""
+    token = _cancel_token.get()
+    if token is not None and token.is_set():
+        raise CancelledError()
+
+
+def _raise_if_stopped() -> None:
+    """Stop a request that was cancelled or whose ``spgci.deadline`` has passed."""
+    _raise_if_cancelled()
+    spgci.deadline.check()
+
+
+R = TypeVar("R")
+
+
+class _SingleFlight:
+    """
+    Collapse concurrent calls that share a key into a single execution.
+
+    The first caller for a key runs the function; callers arriving while it is
+    still running block on the same result (or exception) instead of repeating it.
+    Nothing is retained once the call completes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, "Future[Any]"] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], R]) -> Tuple[R, bool]:
+        """Run ``fn`` once per in-flight ``key``. Returns ``(result, shared)``."""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = Future()
+                self._calls[key] = future
+
+        if not leader:
+            try:
+                return future.result(timeout=spgci.deadline.remaining()), True
+            except FuturesTimeoutError:
+                if spgci.deadline.remaining() != 0:
+                    raise
+                raise DeadlineExceededError(
+                    "Deadline exceeded waiting for an identical request"
+                ) from None
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+
+_inflight = _SingleFlight()
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable, order-independent representation of request params."""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
+
+
+def _fn_key(fn: Callable[..., Any]) -> Hashable:
+    """
+    Identify a response converter so equivalent ``partial`` objects and bound
+    methods created per call still compare equal.
+    """
+    if isinstance(fn, partial):
+        return (_fn_key(fn.func), _freeze(fn.args), _freeze(fn.keywords))
+    fn = getattr(fn, "__func__", fn)
+    code = getattr(fn, "__code__", None)
+    if code is None:
+        return fn
+    cells = []
+    for cell in getattr(fn, "__closure__", None) or ():
+        try:
+            contents = cell.cell_contents
+            hash(contents)
+        except (ValueError, TypeError):
+            contents = id(cell)
+        cells.append(contents)
+    return (code, tuple(cells))
+
+
+def _share(result: R) -> R:
+    """Give a caller that joined an in-flight request its own copy of a DataFrame."""
+    if not isinstance(result, DataFrame):
+        return result
+    copied = result.copy()
+    preview_rows = getattr(result, "_preview_rows", None)
+    if preview_rows is not None:
+        copied._preview_rows = preview_rows
+    return copied  # type: ignore[return-value]
+
 
 def _clear_config_token_best_effort() -> None:
     """
@@ -114,76 +276,113 @@ def _clear_config_token_best_effort() -> None:
         return
 
 
-def _get_token_threadsafe(force_refresh: bool = False) -> str:
+def _get_token_threadsafe(
+    force_refresh: bool = False, stale: Union[str, None] = None
+) -> str:
     """
-    Thread-safe token acquisition with single-flight refresh.
-    - If a token is already available in config and not force_refresh, use it.
-    - Otherwise, lock and refresh once, so N threads don't stampede auth.
+    Thread-safe token acquisition.
+    - A token set through ``config.set_token`` or ``SPGCI_TOKEN`` is used as is.
+    - Otherwise the shared ``token_manager`` supplies one, refreshing it ahead of expiry.
+    - ``force_refresh`` replaces the rejected ``stale`` token once, so N threads
+      hitting a 401 together don't stampede auth.
     """
     if not force_refresh:
         t = spgci.config.get_token()
         if t is not None:
             return t
+    else:
+        with _token_lock:
+            if stale is not None and spgci.config.get_token() == stale:
+                _clear_config_token_best_effort()
+
+    return token_manager.get(
+        spgci.config.username,
+        spgci.config.password,
+        spgci.config.base_url,
+        stale=stale if force_refresh else None,
+    )
 
-    with _token_lock:
-        if not force_refresh:
-            t = spgci.config.get_token()
-            if t is not None:
-                return t
-
-        # Clear cached auth token and any config token we can, then fetch fresh
-        get_token.cache_clear()
-        _clear_config_token_best_effort()
 
-        return spgci.auth.get_token(
-            spgci.config.username,
-            spgci.config.password,
-            spgci.config.base_url,
-        )
+def _request_timeout_seconds() -> float:
+    """
+    Default timeout is 60 seconds, less when a ``spgci.deadline`` is closer
+    """
+    return spgci.deadline.cap(float(getattr(spgci.config, "timeout", 60)))
 
 
-def _request_timeout_seconds() -> float:
+def _get(
+    url: str,
+    params: Dict[Any, Any],
+    session: requests.Session,
+) -> requests.Response:
     """
-    Default timeout is 60 seconds
+    GET with retries. Concurrent identical requests (same url, params and
+    credentials) share one HTTP round trip unless ``config.single_flight`` is
+    disabled.
     """
-    return float(getattr(spgci.config, "timeout", 60))
+    if not spgci.config.single_flight:
+        return _get_once(url, params, session)
+
+    response, _ = _inflight.do(
+        ("GET", url, _freeze(params), credential_key()),
+        lambda: _get_once(url, params, session),
+    )
+    return response
 
 
 @_auth_retry
 @_throttle_retry
 @_timeout_retry
-def _get(
+def _get_once(
     url: str,
     params: Dict[Any, Any],
     session: requests.Session,
 ) -> requests.Response:
-    headers = {"User-Agent": f"spgci-py/{spgci.config.version}"}
+    headers = {
+        "User-Agent": f"spgci-py/{spgci.config.version}",
+        "Accept-Encoding": accept_encoding(),
+    }
 
     token = _get_token_threadsafe(force_refresh=False)
     headers["Authorization"] = f"Bearer {token}"
 
+    _raise_if_stopped()
+    quota = get_coordinator()
+
     # should remove at some point..
     sleep(spgci.config.sleep_time)
 
-    response: requests.Response = session.get(
-        url=url,
-        params=params,
-        headers=headers,
-        verify=spgci.config.verify_ssl,
-        proxies=spgci.config.proxies,
-        auth=spgci.config.auth,
-        timeout=_request_timeout_seconds(),  # NEW: 60s default
-    )
+    with scheduler.slot():
+        # waiting for a slot can take a while, check again
+        _raise_if_stopped()
+        # quota is only spent once the request has won its place in the queue
+        if quota is not None:
+            quota.acquire()
+        response: requests.Response = session.get(
+            url=url,
+            params=params,
+            headers=headers,
+            verify=spgci.config.verify_ssl,
+            proxies=spgci.config.proxies,
+            auth=spgci.config.auth,
+            timeout=_request_timeout_seconds(),  # NEW: 60s default
+        )
+
+    if quota is not None:
+        quota.observe(response)
+    observe(response)
 
     # If 401/403, refresh token once (single-flight) and retry via _auth_retry
     if response.status_code in [401, 403]:
-        _get_token_threadsafe(force_refresh=True)
+        _get_token_threadsafe(force_refresh=True, stale=token)
         raise AuthError("Unauthorized (token refreshed); retrying request")
 
     # if 429 check if more requests can be made today.
     if response.status_code == 429:
         rl = int(response.headers.get("x-ratelimit-remaining-day", 0))
         if rl > 0:
+            if quota is not None:
+                quota.penalize()
             raise PerSecondLimitError("Per Second Rate Limit Reached")
         else:
             raise DailyLimitError("Daily Rate Limit Reached")
@@ -195,6 +394,79 @@ def _get(
     return response
 
 
+@_auth_retry
+@_throttle_retry
+@_timeout_retry
+def _get_stream(
+    url: str,
+    params: Dict[Any, Any],
+    session: requests.Session,
+    headers: Union[Dict[str, str], None] = None,
+) -> requests.Response:
+    """
+    GET whose body is left unread, for the caller to consume with ``iter_content``.
+
+    Never shared between callers. Besides 200, a 206 answer to a ``Range`` header
+    and the 416 returned once the range starts past the end are passed through.
+    """
+    request_headers = {
+        "User-Agent": f"spgci-py/{spgci.config.version}",
+        "Accept-Encoding": accept_encoding(),
+    }
+    request_headers.update(headers or {})
+
+    token = _get_token_threadsafe(force_refresh=False)
+    request_headers["Authorization"] = f"Bearer {token}"
+
+    _raise_if_stopped()
+    quota = get_coordinator()
+
+    # should remove at some point..
+    sleep(spgci.config.sleep_time)
+
+    with scheduler.slot():
+        _raise_if_stopped()
+        # quota is only spent once the request has won its place in the queue
+        if quota is not None:
+            quota.acquire()
+        response: requests.Response = session.get(
+            url=url,
+            params=params,
+            headers=request_headers,
+            verify=spgci.config.verify_ssl,
+            proxies=spgci.config.proxies,
+            auth=spgci.config.auth,
+            timeout=_request_timeout_seconds(),
+            stream=True,
+        )
+
+    if quota is not None:
+        quota.observe(response)
+
+    if response.status_code in (200, 206, 416):
+        return response
+
+    # reading the (small) error body gives the connection back to the pool
+    text = response.text
+
+    if response.status_code in [401, 403]:
+        _get_token_threadsafe(force_refresh=True, stale=token)
+        raise AuthError("Unauthorized (token refreshed); retrying request")
+
+    if response.status_code == 429:
+        rl = int(response.headers.get("x-ratelimit-remaining-day", 0))
+        if rl > 0:
+            if quota is not None:
+                quota.penalize()
+            raise PerSecondLimitError("Per Second Rate Limit Reached")
+        else:
+            raise DailyLimitError("Daily Rate Limit Reached")
+
+    print(text)
+    response.raise_for_status()
+    return response
+
+
 @_auth_retry
 @_throttle_retry
 @_timeout_retry
@@ -205,6 +477,7 @@ def _post(
 ) -> requests.Response:
     headers = {
         "User-Agent": f"spgci-py/{spgci.config.version}",
+        "Accept-Encoding": accept_encoding(),
         "Content-Type": "application/json",
         "accept": "application/json",
     }
@@ -212,26 +485,40 @@ def _post(
     token = _get_token_threadsafe(force_refresh=False)
     headers["Authorization"] = f"Bearer {token}"
 
+    _raise_if_stopped()
+    quota = get_coordinator()
+
     # should remove at some point..
     sleep(spgci.config.sleep_time)
 
-    response: requests.Response = session.post(
-        url=url,
-        json=body,
-        headers=headers,
-        verify=spgci.config.verify_ssl,
-        proxies=spgci.config.proxies,
-        auth=spgci.config.auth,
-        timeout=_request_timeout_seconds(),  # NEW: 60s default
-    )
+    with scheduler.slot():
+        _raise_if_stopped()
+        # quota is only spent once the request has won its place in the queue
+        if quota is not None:
+            quota.acquire()
+        response: requests.Response = session.post(
+            url=url,
+            json=body,
+            headers=headers,
+            verify=spgci.config.verify_ssl,
+            proxies=spgci.config.proxies,
+            auth=spgci.config.auth,
+            timeout=_request_timeout_seconds(),  # NEW: 60s default
+        )
+
+    if quota is not None:
+        quota.observe(response)
+    observe(response)
 
     if response.status_code in [401, 403]:
-        _get_token_threadsafe(force_refresh=True)
+        _get_token_threadsafe(force_refresh=True, stale=token)
         raise AuthError("Unauthorized (token refreshed); retrying request")
 
     if response.status_code == 429:
         rl = int(response.headers.get("x-ratelimit-remaining-day", 0))
         if rl > 0:
+            if quota is not None:
+                quota.penalize()
             raise PerSecondLimitError("Per Second Rate Limit Reached")
         else:
             raise DailyLimitError("Daily Rate Limit Reached")
@@ -249,8 +536,45 @@ def _fetch_page_worker(
     params: Dict[Any, Any],
     pagination: Paginator,
     df_fn: Callable[[requests.Response], DataFrame],
+    level: Priority = Priority.BULK,
+    cancel: Optional[threading.Event] = None,
 ) -> tuple[int, DataFrame]:
     """Worker function executed in threads to safely fetch a single page."""
+    if cancel is not None:
+        # runs in a copy of the caller's context, so this only reaches this page
+        _cancel_token.set(cancel)
+    with priority(level):
+        return _fetch_page(page_num, url, params, pagination, df_fn)
+
+
+def _streams() -> bool:
+    """Whether pages are fetched unread, for large JSON bodies to be parsed as they
+    download, see ``spgci.jsonstream``"""
+    return spgci.config.stream_json_bytes > 0
+
+
+def _get_page(url: str, params: Dict[Any, Any]) -> requests.Response:
+    """GET one page, hedged when ``config.hedge_percentile`` is set."""
+    # a streamed body can only be read once, so it is never shared with another call
+    streamed = _streams()
+    if not spgci.config.hedge_percentile:
+        if streamed:
+            return _get_stream(url, params, _session)
+        return _get(url, params=params, session=_session)
+    send = _get_stream if streamed else _get_once
+    # a hedge repeats the request on purpose, it must not join the first one in flight
+    return hedger.call(
+        lambda: send(url, params, _session), discard=lambda resp: resp.close()
+    )
+
+
+def _fetch_page(
+    page_num: int,
+    url: str,
+    params: Dict[Any, Any],
+    pagination: Paginator,
+    df_fn: Callable[[requests.Response], DataFrame],
+) -> tuple[int, DataFrame]:
     local_params = params.copy()
 
     if pagination.pg_type == "odata":
@@ -258,12 +582,16 @@ def _fetch_page_worker(
         qs = dict(parse_qsl(parsed.query))
         qs[pagination.key] = str((page_num - 1) * int(qs["pageSize"]))
         parsed = parsed._replace(query=urlencode(qs, quote_via=quote))
-        resp = _get(url=parsed.geturl(), params={}, session=_session)
+        resp = _get_page(url=parsed.geturl(), params={})
     else:
         local_params[pagination.key] = page_num
-        resp = _get(url, params=local_params, session=_session)
+        resp = _get_page(url, params=local_params)
 
-    return page_num, df_fn(resp)
+    # a sibling page failed while this one was on the wire, drop it
+    _raise_if_cancelled()
+    df = df_fn(resp)
+    observe(resp)
+    return page_num, df
 
 
 def get_data(
@@ -273,11 +601,44 @@ def get_data(
     paginate_fn: Callable[[requests.Response], Paginator] = _paginate,
     raw: bool = False,
     paginate: bool = False,
+    timeout_total: Optional[float] = None,
+) -> Union[DataFrame, requests.Response]:
+    # every page and retry of the call shares ``timeout_total``, see ``spgci.deadline``
+    with spgci.deadline.within(timeout_total):
+        if not spgci.config.single_flight:
+            return _get_data(path, params, df_fn, paginate_fn, raw, paginate)
+
+        key = (
+            "get_data",
+            f"{spgci.config.base_url}/{path}",
+            _freeze(params),
+            _fn_key(df_fn),
+            _fn_key(paginate_fn),
+            raw,
+            paginate,
+            credential_key(),
+        )
+        result, shared = _inflight.do(
+            key, lambda: _get_data(path, params, df_fn, paginate_fn, raw, paginate)
+        )
+        return _share(result) if shared else result
+
+
+def _get_data(
+    path: str,
+    params: Dict[Any, Any],
+    df_fn: Callable[[requests.Response], DataFrame],
+    paginate_fn: Callable[[requests.Response], Paginator],
+    raw: bool,
+    paginate: bool,
 ) -> Union[DataFrame, requests.Response]:
     url = f"{spgci.config.base_url}/{path}"
 
     # Fetch first page synchronously to determine if more pages exist.
-    response = _get(url, params=params, session=_session)
+    if raw or not _streams():
+        response = _get(url, params=params, session=_session)
+    else:
+        response = _get_stream(url, params, _session)
 
     if raw:
         if paginate:
@@ -288,9 +649,14 @@ def get_data(
 
     content_type = response.headers.get("content-type", "").lower()
     if "application/json" not in content_type and not content_type.startswith("text/"):
+        # read it now, the response may be shared with concurrent identical calls
+        response.content
+        observe(response)
         return response
 
     df: DataFrame = df_fn(response)
+    # converters reading ``resp.json()`` leave the measuring to us
+    observe(response)
     pagination = paginate_fn(response)
 
     if not pagination.has_more_pages:
@@ -316,11 +682,29 @@ def get_data(
     page_results: Dict[int, DataFrame] = {}
     pages_to_fetch = list(range(2, tp + 1))
     workers = spgci.config.parallelism
+    # remaining pages are bulk work unless the caller chose a priority
+    level = explicit_priority()
+    level = Priority.BULK if level is None else level
+
+    # progress bars are only needed here, keep tqdm out of ``import spgci``
+    from tqdm import tqdm
 
-    with ThreadPoolExecutor(max_workers=workers) as executor:
+    # set on the first failed page: queued pages are skipped and pages in flight
+    # drop their results instead of spending more quota
+    cancel = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
         future_to_page = {
             executor.submit(
-                _fetch_page_worker, page, url, params, pagination, df_fn
+                copy_context().run,
+                _fetch_page_worker,
+                page,
+                url,
+                params,
+                pagination,
+                df_fn,
+                level,
+                cancel,
             ): page
             for page in pages_to_fetch
         }
@@ -331,8 +715,17 @@ def get_data(
             initial=1,
             total=tp,
         ):
-            page_num, page_df = future.result()
+            try:
+                page_num, page_df = future.result()
+            except Exception as exc:
+                cancel.set()
+                raise PaginationError.wrap(
+                    future_to_page[future], tp, {1: df, **page_results}, exc
+                ) from exc
             page_results[page_num] = page_df
+    finally:
+        # after a failure, don't wait for pages still on the wire
+        executor.shutdown(wait=not cancel.is_set(), cancel_futures=True)
 
     sorted_dfs = [df] + [page_results[p] for p in sorted(page_results.keys())]
     final_df = pd.concat(objs=sorted_dfs, ignore_index=True)
@@ -349,9 +742,18 @@ def post_data(
     body: Dict[Any, Any],
     df_fn: Callable[[requests.Response], DataFrame] = _convert_to_df,
     raw: bool = False,
+    memo: bool = False,
+    timeout_total: Optional[float] = None,
 ) -> Union[DataFrame, requests.Response]:
     url = f"{spgci.config.base_url}/{path}"
-    response = _post(url, body=body, session=_session)
+    with spgci.deadline.within(timeout_total):
+        if memo:
+            # only for side-effect free endpoints, see ``spgci.memo``
+            response = get_memo().fetch(
+                url, body, partial(_post, url, body=body, session=_session)
+            )
+        else:
+            response = _post(url, body=body, session=_session)
 
     if raw:
         return response
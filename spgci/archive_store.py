@@ -0,0 +1,685 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Keep every vintage of an archived forecast locally and query how it was revised.
+
+The archive endpoints (``EnergyPriceForecast.get_prices_shortterm_archive`` and
+``get_prices_longterm_archive``, ``GlobalIntegratedEnergyModel.get_demand_archive``,
+``GlobalOilDemand.get_demand_archive`` and ``WorldOilSupply.get_production_archive``)
+return one vintage per call. :meth:`ArchiveVintageStore.sync` lists the vintages of an
+:class:`ArchiveSource`, downloads the ones not stored yet concurrently and keeps them
+in a SQLite file as deltas: a vintage only stores the values that differ from the
+vintage before it. Snapshots, comparisons and revision histories are then answered
+without going back to the API.
+
+>>> store = ArchiveVintageStore("archives.db")
+>>> oil = ArchiveSource.epf("short", category="Oil", delivery_region="Singapore")
+>>> store.sync(oil)
+>>> store.revisions(oil, priceSymbol="AAPKA00", year=2027)
+>>> store.compare(oil, "2025-06-01", "2026-06-01")
+"""
+
+import json
+import sqlite3
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import copy_context
+from datetime import date, datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+import pandas as pd
+import spgci.config as config
+from pandas import DataFrame
+from spgci.memo import canonical
+from spgci.scheduler import Priority, explicit_priority, priority
+
+#: columns describing the vintage itself rather than a forecast point
+_VINTAGE_METADATA = (
+    "modifiedDate",
+    "lastModifiedDate",
+    "scenarioId",
+    "scenarioName",
+    "scenarioTermId",
+    "scenarioTermName",
+)
+
+VintageLike = Union[date, datetime, str, int]
+
+
+def _json(value: Any) -> str:
+    return json.dumps(canonical(value), separators=(",", ":"), default=str)
+
+
+def _ordinal(value: Any) -> str:
+    """Text form of a vintage's ``order_by`` value that sorts like the value."""
+    value = canonical(value)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return f"{value:030.6f}"
+    return pd.Timestamp(value).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _plain(value: Any) -> Optional[float]:
+    """Stored form of a forecast value, ``None`` for missing values."""
+    if value is None or (isinstance(value, float) and value != value):
+        return None
+    return float(value)
+
+
+def _restore_dates(df: DataFrame, column: str) -> DataFrame:
+    """Vintage dates are stored as ISO text, read them back as timestamps."""
+    if column in df.columns and pd.api.types.is_string_dtype(df[column]):
+        df[column] = pd.to_datetime(df[column])
+    return df
+
+
+class ArchiveSource(NamedTuple):
+    """
+    How to list and download the vintages of one archive endpoint.
+
+    Build one with :meth:`epf`, :meth:`giem`, :meth:`oil_demand` or :meth:`wos`, or
+    directly for other endpoints.
+
+    Attributes
+    ----------
+    name : str
+        Identifies the archive and its filters in the store.
+    list_vintages : callable
+        Returns a DataFrame with a row per vintage.
+    fetch : callable
+        Returns every row of the vintage described by a row of ``list_vintages``.
+    vintage_columns : tuple of str
+        Columns of ``list_vintages`` identifying a vintage.
+    order_by : str
+        Column of ``list_vintages`` ordering the vintages, oldest first.
+    stream_columns : tuple of str
+        Vintages with the same values here revise one another, e.g. per category.
+    value_column : str
+        Column of the fetched rows holding the forecast value.
+    key_columns : tuple of str, optional
+        Columns identifying a forecast point, by default every fetched column but
+        the value and the vintage's own metadata such as ``modifiedDate``.
+    """
+
+    name: str
+    list_vintages: Callable[[], DataFrame]
+    fetch: Callable[[Dict[str, Any]], DataFrame]
+    vintage_columns: Tuple[str, ...]
+    order_by: str
+    stream_columns: Tuple[str, ...] = ()
+    value_column: str = "value"
+    key_columns: Optional[Tuple[str, ...]] = None
+
+    @classmethod
+    def epf(
+        cls,
+        term: Literal["short", "long"],
+        category: Optional[Union[str, List[str]]] = None,
+        *,
+        client: Any = None,
+        **filters: Any,
+    ) -> "ArchiveSource":
+        """
+        Short- or long-term ``EnergyPriceForecast`` archives, one stream per category.
+
+        ``filters`` are passed to ``get_prices_shortterm_archive`` or
+        ``get_prices_longterm_archive``, e.g. ``delivery_region=...``.
+        """
+        if client is None:
+            from spgci.epf import EnergyPriceForecast
+
+            client = EnergyPriceForecast()
+        method = (
+            client.get_prices_shortterm_archive
+            if term == "short"
+            else client.get_prices_longterm_archive
+        )
+
+        def fetch(vintage: Dict[str, Any]) -> DataFrame:
+            return method(
+                modified_date=vintage["modifiedDate"],
+                category_id=vintage["categoryId"],
+                paginate=True,
+                **filters,
+            )
+
+        return cls(
+            name=f"epf/{term}-term {_json([category, filters])}",
+            list_vintages=lambda: client.get_archive_dates(
+                term_type=term, category=category
+            ),
+            fetch=fetch,
+            vintage_columns=("categoryId", "modifiedDate"),
+            order_by="modifiedDate",
+            stream_columns=("categoryId",),
+        )
+
+    @classmethod
+    def _scenarios(
+        cls,
+        name: str,
+        client: Any,
+        method: str,
+        ref_type: Any,
+        filters: Dict[str, Any],
+    ) -> "ArchiveSource":
+        def fetch(vintage: Dict[str, Any]) -> DataFrame:
+            return getattr(client, method)(
+                scenario_id=vintage["scenarioId"], paginate=True, **filters
+            )
+
+        return cls(
+            name=f"{name} {_json(filters)}",
+            list_vintages=lambda: client.get_reference_data(type=ref_type),
+            fetch=fetch,
+            vintage_columns=("scenarioId",),
+            order_by="scenarioId",
+        )
+
+    @classmethod
+    def giem(cls, *, client: Any = None, **filters: Any) -> "ArchiveSource":
+        """``GlobalIntegratedEnergyModel.get_demand_archive`` scenarios."""
+        from spgci.giem import GlobalIntegratedEnergyModel
+
+        client = client if client is not None else GlobalIntegratedEnergyModel()
+        return cls._scenarios(
+            "giem/demand",
+            client,
+            "get_demand_archive",
+            GlobalIntegratedEnergyModel.RefTypes.Scenarios,
+            filters,
+        )
+
+    @classmethod
+    def oil_demand(cls, *, client: Any = None, **filters: Any) -> "ArchiveSource":
+        """``GlobalOilDemand.get_demand_archive`` scenarios."""
+        from spgci.oil_demand import GlobalOilDemand
+
+        client = client if client is not None else GlobalOilDemand()
+        return cls._scenarios(
+            "oil-demand/demand",
+            client,
+            "get_demand_archive",
+            GlobalOilDemand.RefTypes.Scenarios,
+            filters,
+        )
+
+    @classmethod
+    def wos(
+        cls, scenario_term_id: int = 1, *, client: Any = None, **filters: Any
+    ) -> "ArchiveSource":
+        """``WorldOilSupply.get_production_archive`` scenarios of one term."""
+        from spgci.wos import WorldOilSupply
+
+        client = client if client is not None else WorldOilSupply()
+        return cls._scenarios(
+            "wos/production",
+            client,
+            "get_production_archive",
+            WorldOilSupply.RefTypes.ScenarioList,
+            {"scenario_term_id": scenario_term_id, **filters},
+        )
+
+
+class ArchiveVintageStore:
+    """
+    Local store of archive vintages, kept as deltas between consecutive vintages.
+
+    Parameters
+    ----------
+    path : str, optional
+        SQLite file holding the store, by default an in-memory database.
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self.path = path
+        # one connection guarded by a lock, so an in-memory store is shared by threads
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript(
+                "CREATE TABLE IF NOT EXISTS archive (name TEXT PRIMARY KEY,"
+                " key_columns TEXT NOT NULL, vintage_columns TEXT NOT NULL);"
+                "CREATE TABLE IF NOT EXISTS vintage (id INTEGER PRIMARY KEY,"
+                " archive TEXT NOT NULL, stream TEXT NOT NULL, ordinal TEXT NOT NULL,"
+                " label TEXT NOT NULL, rows INTEGER NOT NULL,"
+                " UNIQUE (archive, label));"
+                "CREATE INDEX IF NOT EXISTS vintage_order"
+                " ON vintage (archive, stream, ordinal);"
+                "CREATE TABLE IF NOT EXISTS point (id INTEGER PRIMARY KEY,"
+                " archive TEXT NOT NULL, stream TEXT NOT NULL, key TEXT NOT NULL,"
+                " UNIQUE (archive, stream, key));"
+                # a row only where the value differs from the previous vintage
+                "CREATE TABLE IF NOT EXISTS delta (point INTEGER NOT NULL,"
+                " vintage INTEGER NOT NULL, value REAL, removed INTEGER NOT NULL,"
+                " PRIMARY KEY (point, vintage)) WITHOUT ROWID;"
+                "CREATE INDEX IF NOT EXISTS delta_vintage ON delta (vintage);"
+            )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "ArchiveVintageStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def sync(
+        self,
+        source: ArchiveSource,
+        *,
+        latest: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        errors: Literal["raise", "skip"] = "raise",
+    ) -> int:
+        """
+        Download the vintages of ``source`` missing from the store.
+
+        Parameters
+        ----------
+        source : ArchiveSource
+            Archive to bring up to date.
+        latest : int, optional
+            Only consider the most recent vintages of each stream, by default all.
+        max_workers : int, optional
+            Vintages downloaded at once, by default ``config.parallelism``.
+        errors : {"raise", "skip"}, optional
+            Raise the first failed download, or warn and carry on without it.
+
+        Returns
+        -------
+        int
+            Number of vintages added.
+        """
+        listing = source.list_vintages()
+        if listing.empty:
+            return 0
+        listing = listing.drop_duplicates(list(source.vintage_columns))
+        listing = listing.sort_values(source.order_by, kind="stable")
+        if latest is not None:
+            by = list(source.stream_columns)
+            listing = (
+                listing.groupby(by, sort=False).tail(latest)
+                if by
+                else listing[-latest:]
+            )
+
+        with self._lock:
+            stored = {
+                label
+                for (label,) in self._conn.execute(
+                    "SELECT label FROM vintage WHERE archive = ?", (source.name,)
+                )
+            }
+        wanted = [
+            vintage
+            for vintage in listing.to_dict("records")
+            if self._label(source, vintage) not in stored
+        ]
+
+        added = 0
+        workers = max_workers or config.parallelism
+        level = explicit_priority()
+        with priority(Priority.BULK if level is None else level):
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(copy_context().run, source.fetch, vintage): vintage
+                    for vintage in wanted
+                }
+                try:
+                    for future in as_completed(futures):
+                        vintage = futures[future]
+                        try:
+                            rows = cast(DataFrame, future.result())
+                        except Exception as exc:
+                            if errors == "raise":
+                                raise
+                            label = self._label(source, vintage)
+                            warnings.warn(f"Fetching vintage {label} failed: {exc}")
+                            continue
+                        self.ingest(source, vintage, rows)
+                        added += 1
+                finally:
+                    for queued in futures:
+                        queued.cancel()
+        return added
+
+    @staticmethod
+    def _label(source: ArchiveSource, vintage: Dict[str, Any]) -> str:
+        return _json({c: vintage[c] for c in source.vintage_columns})
+
+    @staticmethod
+    def _key_columns(source: ArchiveSource, rows: DataFrame) -> List[str]:
+        if source.key_columns is not None:
+            return list(source.key_columns)
+        skip = {source.value_column, *source.vintage_columns, *_VINTAGE_METADATA}
+        return [c for c in rows.columns if c not in skip]
+
+    def ingest(
+        self, source: ArchiveSource, vintage: Dict[str, Any], rows: DataFrame
+    ) -> int:
+        """
+        Store the ``rows`` of one vintage, described by a row of ``list_vintages``.
+
+        The vintage may be older than vintages already stored: the deltas of the
+        vintage after it are rewritten. A vintage stored before is replaced, keeping
+        its id. Returns the number of deltas written.
+        """
+        label = self._label(source, vintage)
+        stream = _json([vintage[c] for c in source.stream_columns])
+        ordinal = _ordinal(vintage[source.order_by])
+
+        if rows.empty:
+            current: Dict[str, Optional[float]] = {}
+            key_columns: List[str] = []
+        else:
+            if source.value_column not in rows.columns:
+                raise ValueError(
+                    f"Vintage {label} has no {source.value_column!r} column:"
+                    f" {list(rows.columns)}"
+                )
+            key_columns = self._key_columns(source, rows)
+            keys = [
+                _json(k)
+                for k in rows[key_columns].astype(object).itertuples(index=False)
+            ]
+            if len(set(keys)) != len(keys):
+                raise ValueError(
+                    f"{key_columns} do not identify the rows of vintage {label},"
+                    " pass key_columns to the ArchiveSource"
+                )
+            current = dict(zip(keys, map(_plain, rows[source.value_column])))
+
+        with self._lock, self._conn:
+            conn = self._conn
+            if key_columns:
+                conn.execute(
+                    "INSERT OR IGNORE INTO archive VALUES (?, ?, ?)",
+                    (source.name, _json(key_columns), _json(source.vintage_columns)),
+                )
+            stored = conn.execute(
+                "SELECT id FROM vintage WHERE archive = ? AND label = ?",
+                (source.name, label),
+            ).fetchone()
+            if stored is not None:
+                self._unlink(source.name, stored[0])
+            conn.execute(
+                "INSERT INTO vintage (archive, stream, ordinal, label, rows)"
+                " VALUES (?, ?, ?, ?, ?) ON CONFLICT (archive, label) DO UPDATE SET"
+                " stream = excluded.stream, ordinal = excluded.ordinal,"
+                " rows = excluded.rows",
+                (source.name, stream, ordinal, label, len(current)),
+            )
+            vintage_id = conn.execute(
+                "SELECT id FROM vintage WHERE archive = ? AND label = ?",
+                (source.name, label),
+            ).fetchone()[0]
+            if not current:
+                # nothing published for this vintage, it is not part of the chain
+                return 0
+
+            before, after = self._neighbours(source.name, stream, ordinal)
+            base = self._values(before) if before is not None else {}
+            following = self._values(after) if after is not None else None
+
+            written = self._write(source.name, stream, vintage_id, base, current)
+            if after is not None and following is not None:
+                conn.execute("DELETE FROM delta WHERE vintage = ?", (after,))
+                self._write(source.name, stream, after, current, following)
+        return written
+
+    def _unlink(self, archive: str, vintage_id: int) -> None:
+        """Take a vintage out of its chain, rewriting the deltas of the next one."""
+        stream, ordinal, rows = self._conn.execute(
+            "SELECT stream, ordinal, rows FROM vintage WHERE id = ?", (vintage_id,)
+        ).fetchone()
+        after = self._neighbours(archive, stream, ordinal)[1] if rows else None
+        if after is not None:
+            following = self._values(after)
+            self._conn.execute("DELETE FROM delta WHERE vintage = ?", (after,))
+        self._conn.execute("DELETE FROM delta WHERE vintage = ?", (vintage_id,))
+        self._conn.execute("UPDATE vintage SET rows = 0 WHERE id = ?", (vintage_id,))
+        if after is not None:
+            before = self._neighbours(archive, stream, ordinal)[0]
+            base = self._values(before) if before is not None else {}
+            self._write(archive, stream, after, base, following)
+
+    def _neighbours(
+        self, archive: str, stream: str, ordinal: str
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """Ids of the non-empty vintages right before and after ``ordinal``."""
+        query = (
+            "SELECT id FROM vintage WHERE archive = ? AND stream = ? AND rows > 0"
+            " AND ordinal {} ? ORDER BY ordinal {} LIMIT 1"
+        )
+        args = (archive, stream, ordinal)
+        before = self._conn.execute(query.format("<", "DESC"), args).fetchone()
+        after = self._conn.execute(query.format(">", "ASC"), args).fetchone()
+        return (before[0] if before else None, after[0] if after else None)
+
+    def _values(self, vintage_id: int) -> Dict[str, Optional[float]]:
+        """Every value of a vintage, rebuilt from the deltas up to it."""
+        rows = self._conn.execute(
+            "SELECT p.key, d.value, d.removed FROM ("
+            " SELECT d.point, d.value, d.removed, ROW_NUMBER() OVER ("
+            "  PARTITION BY d.point ORDER BY v.ordinal DESC) AS newest"
+            " FROM delta AS d JOIN vintage AS v ON v.id = d.vintage"
+            " JOIN vintage AS t ON t.id = ?"
+            " WHERE v.archive = t.archive AND v.stream = t.stream"
+            " AND v.ordinal <= t.ordinal AND v.rows > 0"
+            ") AS d JOIN point AS p ON p.id = d.point"
+            " WHERE d.newest = 1 AND d.removed = 0",
+            (vintage_id,),
+        ).fetchall()
+        return {key: value for key, value, _ in rows}
+
+    def _write(
+        self,
+        archive: str,
+        stream: str,
+        vintage_id: int,
+        base: Dict[str, Optional[float]],
+        values: Dict[str, Optional[float]],
+    ) -> int:
+        changed = [(k, v) for k, v in values.items() if k not in base or base[k] != v]
+        removed = [k for k in base if k not in values]
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO point (archive, stream, key) VALUES (?, ?, ?)",
+            [(archive, stream, k) for k, _ in changed],
+        )
+        deltas = [(v, 0, archive, stream, k) for k, v in changed]
+        deltas += [(None, 1, archive, stream, k) for k in removed]
+        self._conn.executemany(
+            "INSERT INTO delta (point, vintage, value, removed)"
+            f" SELECT id, {int(vintage_id)}, ?, ? FROM point"
+            " WHERE archive = ? AND stream = ? AND key = ?",
+            deltas,
+        )
+        return len(deltas)
+
+    def _columns(self, source: ArchiveSource) -> Tuple[List[str], List[str]]:
+        row = self._conn.execute(
+            "SELECT key_columns, vintage_columns FROM archive WHERE name = ?",
+            (source.name,),
+        ).fetchone()
+        if row is None:
+            return [], list(source.vintage_columns)
+        return json.loads(row[0]), json.loads(row[1])
+
+    def vintages(self, source: ArchiveSource) -> DataFrame:
+        """Stored vintages, oldest first, with their row and delta counts."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT v.label, v.rows, COUNT(d.point) FROM vintage AS v"
+                " LEFT JOIN delta AS d ON d.vintage = v.id WHERE v.archive = ?"
+                " GROUP BY v.id ORDER BY v.stream, v.ordinal",
+                (source.name,),
+            ).fetchall()
+        records = [
+            {**json.loads(label), "rows": count, "deltas": deltas}
+            for label, count, deltas in rows
+        ]
+        df = DataFrame.from_records(
+            records, columns=[*source.vintage_columns, "rows", "deltas"]
+        )
+        return _restore_dates(df, source.order_by)
+
+    def _frame(
+        self,
+        source: ArchiveSource,
+        rows: List[Tuple[Any, ...]],
+        names: List[str],
+        where: Dict[str, Any],
+    ) -> DataFrame:
+        """Decode ``(key, label, *rest)`` rows into key, vintage and ``names`` columns."""
+        key_columns, vintage_columns = self._columns(source)
+        records = []
+        for key, label, *rest in rows:
+            record = dict(zip(key_columns, json.loads(key)))
+            record.update(json.loads(label))
+            record.update(zip(names, rest))
+            records.append(record)
+        df = DataFrame.from_records(
+            records, columns=[*key_columns, *vintage_columns, *names]
+        )
+        df = _restore_dates(df, source.order_by)
+        for column, value in where.items():
+            if column not in df.columns:
+                raise ValueError(f"{column!r} is not a key column: {key_columns}")
+            values = [value] if isinstance(value, (str, int, float)) else list(value)
+            df = df[df[column].isin(values)]
+        return df.reset_index(drop=True)
+
+    def snapshot(
+        self, source: ArchiveSource, as_of: Optional[VintageLike] = None, **where: Any
+    ) -> DataFrame:
+        """
+        The forecast as published in the latest vintage of each stream.
+
+        Parameters
+        ----------
+        source : ArchiveSource
+            Archive to read.
+        as_of : date or int, optional
+            Only consider vintages up to this ``order_by`` value, e.g. a
+            ``modifiedDate`` or ``scenarioId``, by default all.
+        where
+            Restrict key columns to a value or a list of values.
+        """
+        limit = "" if as_of is None else " AND ordinal <= ?"
+        args: List[Any] = [source.name] + ([] if as_of is None else [_ordinal(as_of)])
+        with self._lock:
+            # SQLite returns the other columns from the row holding the MAX()
+            chosen = self._conn.execute(
+                "SELECT id, label, MAX(ordinal) FROM vintage"
+                f" WHERE archive = ? AND rows > 0{limit} GROUP BY stream",
+                args,
+            ).fetchall()
+            rows = [
+                (key, label, value)
+                for vintage_id, label, _ in chosen
+                for key, value in self._values(vintage_id).items()
+            ]
+        return self._frame(source, rows, [source.value_column], where)
+
+    def compare(
+        self,
+        source: ArchiveSource,
+        before: VintageLike,
+        after: VintageLike,
+        **where: Any,
+    ) -> DataFrame:
+        """
+        Snapshots as of ``before`` and ``after`` side by side, with the change.
+
+        Points missing from one of them have a missing value on that side.
+        """
+        old = self.snapshot(source, before, **where)
+        new = self.snapshot(source, after, **where)
+        key_columns, vintage_columns = self._columns(source)
+        value = source.value_column
+        merged = old.merge(
+            new,
+            on=key_columns,
+            how="outer",
+            suffixes=("_before", "_after"),
+            sort=True,
+        )
+        merged["change"] = merged[f"{value}_after"] - merged[f"{value}_before"]
+        return merged
+
+    def revisions(self, source: ArchiveSource, **where: Any) -> DataFrame:
+        """
+        Every change to the matching points, oldest first.
+
+        One row per point and vintage in which its value was ``added``, ``revised``
+        or ``removed``, with the ``previous`` value and the ``change``. Vintages that
+        left a point unchanged do not appear.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT p.key, v.label, d.value, LAG(d.value) OVER w, d.removed,"
+                " LAG(d.removed) OVER w, ROW_NUMBER() OVER w"
+                " FROM delta AS d JOIN vintage AS v ON v.id = d.vintage"
+                " JOIN point AS p ON p.id = d.point WHERE p.archive = ?"
+                " WINDOW w AS (PARTITION BY d.point ORDER BY v.ordinal)"
+                " ORDER BY p.stream, p.key, v.ordinal",
+                (source.name,),
+            ).fetchall()
+
+        decoded = []
+        for key, label, value, previous, removed, was_removed, number in rows:
+            if removed:
+                status = "removed"
+            elif number == 1 or was_removed:
+                status, previous = "added", None
+            else:
+                status = "revised"
+            decoded.append((key, label, value, previous, status))
+        df = self._frame(
+            source, decoded, [source.value_column, "previous", "status"], where
+        )
+        df[source.value_column] = df[source.value_column].astype(float)
+        df["previous"] = df["previous"].astype(float)
+        df.insert(
+            len(df.columns) - 1, "change", df[source.value_column] - df["previous"]
+        )
+        return df
+
+    def forget(self, source: ArchiveSource) -> None:
+        """Delete every stored vintage of ``source``."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM delta WHERE vintage IN"
+                " (SELECT id FROM vintage WHERE archive = ?)",
+                (source.name,),
+            )
+            for table, column in (("point", "archive"), ("vintage", "archive")):
+                self._conn.execute(
+                    f"DELETE FROM {table} WHERE {column} = ?", (source.name,)
+                )
+            self._conn.execute("DELETE FROM archive WHERE name = ?", (source.name,))
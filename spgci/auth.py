@@ -12,7 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from functools import lru_cache
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, NamedTuple, Optional, Tuple
 import spgci.config as config
 import requests
 from requests.exceptions import HTTPError, SSLError
@@ -25,8 +31,199 @@ _throttle_retry = retry(
 )
 
 
-@lru_cache()
-@_throttle_retry
+class _Token(NamedTuple):
+    value: str
+    #: epoch seconds, ``None`` when the lifetime is unknown
+    expires_at: Optional[float]
+    #: epoch seconds after which a replacement is fetched in the background
+    refresh_at: Optional[float]
+
+    @classmethod
+    def issue(cls, value: str, expires_at: Optional[float]) -> "_Token":
+        if expires_at is None:
+            return cls(value, None, None)
+        # never refresh earlier than half way through the remaining lifetime
+        margin = min(float(config.token_refresh_margin), (expires_at - time.time()) / 2)
+        return cls(value, expires_at, expires_at - margin)
+
+
+def _jwt_expiry(token: str) -> Optional[float]:
+    """Read the ``exp`` claim of a JWT without verifying it."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class _FileLock:
+    """Exclusive advisory lock on ``<path>.lock``, shared between processes."""
+
+    def __init__(self, path: str) -> None:
+        self._path = f"{path}.lock"
+        self._fd = -1
+
+    def __enter__(self) -> "_FileLock":
+        self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+        if os.name == "nt":
+            import msvcrt
+
+            msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        if os.name == "nt":
+            import msvcrt
+
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+
+
+class TokenManager:
+    """
+    Caches access tokens per set of credentials and refreshes them before they expire.
+
+    Expiry is read from the JWT ``exp`` claim, falling back to ``expires_in`` from the
+    auth response. Once a token is within ``config.token_refresh_margin`` seconds of
+    expiring, callers keep receiving it while a background thread fetches the next one.
+    An expired token is refreshed synchronously.
+
+    Setting ``config.token_cache_path`` shares tokens between processes through that
+    file, guarded by a file lock, so a fleet of workers logs in once per token lifetime.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._refreshing_lock = threading.Lock()
+        self._tokens: Dict[Tuple[str, str, str], _Token] = {}
+        self._refreshing: Dict[Tuple[str, str, str], threading.Thread] = {}
+        self._cleared: Dict[Tuple[str, str, str], str] = {}
+
+    def get(
+        self,
+        username: str,
+        password: str,
+        url: str,
+        stale: Optional[str] = None,
+    ) -> str:
+        """
+        Return a valid token for the credentials.
+
+        Pass the token that was rejected as ``stale`` to force a refresh; concurrent
+        callers rejecting the same token trigger only one refresh.
+        """
+        key = (username, password, url)
+        token = self._tokens.get(key)
+        if token is not None and token.value != stale and not self._expired(token):
+            if self._expiring(token):
+                self._refresh_in_background(key)
+            return token.value
+
+        with self._lock:
+            token = self._tokens.get(key)
+            if token is not None and token.value != stale and not self._expired(token):
+                return token.value
+            # a cleared token is not picked back up from the shared cache file either
+            return self._refresh(key, stale or self._cleared.pop(key, None)).value
+
+    def clear(self) -> None:
+        """Forget every cached token so the next call for it logs in again."""
+        with self._lock:
+            self._cleared.update((k, t.value) for k, t in self._tokens.items())
+            self._tokens.clear()
+
+    @staticmethod
+    def _expired(token: _Token) -> bool:
+        return token.expires_at is not None and token.expires_at <= time.time()
+
+    @staticmethod
+    def _expiring(token: _Token) -> bool:
+        return token.refresh_at is not None and token.refresh_at <= time.time()
+
+    def _refresh_in_background(self, key: Tuple[str, str, str]) -> None:
+        with self._refreshing_lock:
+            if key in self._refreshing:
+                return
+            thread = threading.Thread(
+                target=self._background_refresh, args=(key,), daemon=True
+            )
+            self._refreshing[key] = thread
+        thread.start()
+
+    def _background_refresh(self, key: Tuple[str, str, str]) -> None:
+        try:
+            with self._lock:
+                token = self._tokens.get(key)
+                if token is None or self._expiring(token):
+                    self._refresh(key, None)
+        except Exception:
+            # the next foreground call refreshes synchronously once the token expires
+            pass
+        finally:
+            with self._refreshing_lock:
+                self._refreshing.pop(key, None)
+
+    def _refresh(self, key: Tuple[str, str, str], stale: Optional[str]) -> _Token:
+        """Fetch a token, preferring one another process already stored. Holds ``_lock``."""
+        path = config.token_cache_path
+        if not path:
+            token = _fetch_token(*key)
+        else:
+            with _FileLock(path):
+                token = self._read_shared(path, key)
+                if token is None or token.value == stale or self._expiring(token):
+                    token = _fetch_token(*key)
+                    self._write_shared(path, key, token)
+
+        self._tokens[key] = token
+        return token
+
+    @staticmethod
+    def _shared_key(key: Tuple[str, str, str]) -> str:
+        return hashlib.sha256("\0".join(key).encode()).hexdigest()
+
+    def _read_shared(self, path: str, key: Tuple[str, str, str]) -> Optional[_Token]:
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f).get(self._shared_key(key))
+        except (OSError, ValueError):
+            return None
+        if not entry:
+            return None
+        return _Token(entry["value"], entry.get("expires_at"), entry.get("refresh_at"))
+
+    def _write_shared(
+        self, path: str, key: Tuple[str, str, str], token: _Token
+    ) -> None:
+        try:
+            with open(path, encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            entries = {}
+        entries[self._shared_key(key)] = token._asdict()
+        # tokens are credentials, keep the file private to the current user
+        tmp = f"{path}.{os.getpid()}.tmp"
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+        os.replace(tmp, path)
+
+
+#: process-wide token cache used by the API client
+token_manager = TokenManager()
+
+
 def get_token(
     username: str = config.username,
     password: str = config.password,
@@ -39,7 +236,8 @@ def get_token(
 
     Can be called without arguments if environment variables are set.
 
-    Automatically caches token based on the arguments supplied.\n
+    Automatically caches token based on the arguments supplied and refreshes it
+    shortly before it expires.\n
 
     Parameters
     ----------
@@ -57,7 +255,30 @@ def get_token(
     str
         Access Token
     """
+    return token_manager.get(username, password, url)
+
 
+# ``get_token`` used to be an ``lru_cache``, keep ``get_token.cache_clear()`` working
+# for callers that use it to force a token refresh
+get_token.cache_clear = token_manager.clear  # type: ignore[attr-defined]
+
+
+def credential_key() -> str:
+    """
+    Hash identifying the credentials requests are made with right now.
+
+    Covers the username and the token set through ``config.set_token`` or
+    ``SPGCI_TOKEN``, or the password when tokens are fetched for the username, so
+    responses shared or memoised between calls never cross credentials.
+    """
+    token = config.get_token()
+    secret = ("token", token) if token is not None else ("password", config.password)
+    parts = (config.base_url, config.username) + secret
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+@_throttle_retry
+def _fetch_token(username: str, password: str, url: str) -> _Token:
     body = {
         "username": username,
         "password": password,
@@ -78,7 +299,12 @@ def get_token(
             auth=config.auth,
         )
         r.raise_for_status()
-        return r.json()["access_token"]
+        j = r.json()
+        token = j["access_token"]
+        expires_at = _jwt_expiry(token)
+        if expires_at is None and j.get("expires_in") is not None:
+            expires_at = time.time() + float(j["expires_in"])
+        return _Token.issue(token, expires_at)
     except SSLError as err:
         resp = err.response
         warnings.warn(
@@ -5,6 +5,8 @@ import pandas as pd
 from pandas import DataFrame, Series
 from requests import Response
 from spgci.api_client import get_data
+from spgci.facets import unique_values
+from spgci.jsonstream import read_frame
 from spgci.utilities import list_to_filter
 
 EconomicOutlooksDataset = Literal[
@@ -56,11 +58,16 @@ class CetEconomicOutlooks:
         params = {"GroupBy": group_by, "pageSize": 5000}
         if filter_exp is not None:
             params["filter"] = filter_exp
-        return get_data(
-            path=self._dataset_to_path[dataset],
-            params=params,
-            df_fn=self._convert_unique_values_to_df,
-            paginate=True,
+        return unique_values(
+            self._dataset_to_path[dataset],
+            columns,
+            filter_exp,
+            lambda: get_data(
+                path=self._dataset_to_path[dataset],
+                params=params,
+                df_fn=self._convert_unique_values_to_df,
+                paginate=True,
+            ),
         )
 
     def get_all_investments(
@@ -2038,7 +2045,7 @@ class CetEconomicOutlooks:
 
     @staticmethod
     def _normalize(resp: Response, key: str) -> DataFrame:
-        df = pd.json_normalize(resp.json()[key])
+        df = read_frame(resp, key, pd.json_normalize)
         for column in ["vintageAdditions", "vintageCapex", "vintage", "lastUpdated"]:
             if column in df.columns:
                 df[column] = pd.to_datetime(
@@ -16,6 +16,8 @@ from __future__ import annotations
 from typing import List, Optional, Union, Literal
 from requests import Response
 from spgci.api_client import get_data
+from spgci.facets import unique_values
+from spgci.jsonstream import read_frame
 from spgci.utilities import list_to_filter
 from pandas import DataFrame, Series
 from datetime import date, datetime
@@ -135,8 +137,7 @@ class Chemicals:
             params.update({"filter": filter_exp})
 
         def to_df(resp: Response):
-            j = resp.json()
-            df = pd.json_normalize(j["aggResultValue"])
+            df = read_frame(resp, "aggResultValue", pd.json_normalize)
             columns_dt = [
                 "vintageDate",
                 "reportForDate",
@@ -158,7 +159,12 @@ class Chemicals:
                     )
             return df
 
-        return get_data(path, params, to_df, paginate=True)
+        return unique_values(
+            path,
+            columns,
+            filter_exp,
+            lambda: get_data(path, params, to_df, paginate=True),
+        )
 
     def get_outages(
         self,
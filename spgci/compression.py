@@ -0,0 +1,159 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Negotiate compressed responses and measure what they save.
+
+Every request asks for the encodings the installed decoders can read, best first:
+``zstd`` (with the ``zstandard`` package and urllib3 2), ``br`` (with ``brotli`` or
+``brotlicffi``), then ``gzip`` and ``deflate``. Bodies are decompressed as they are
+read, also when they are streamed. Set ``config.accept_encoding`` to choose the
+encodings yourself, e.g. ``"identity"`` to turn compression off.
+
+The bytes received on the wire and the bytes they decoded to are recorded for each
+response:
+
+>>> import spgci as ci
+>>> ci.MarketData().get_assessments_by_mdc_history(mdc="ET", paginate=True)
+>>> ci.compression.stats()
+{'requests': 12, 'wire_bytes': 3817210, 'decoded_bytes': 41022087, 'saved': 0.907,
+ 'by_encoding': {'gzip': {'requests': 12, 'wire_bytes': 3817210, ...}}}
+>>> ci.compression.recent()[-1]
+{'url': 'https://api.ci.spglobal.com/market-data/v3/value/history/mdc', ...}
+"""
+
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import spgci.config as config
+from requests import Response
+
+#: most compact first, servers are free to pick any of them
+_PREFERENCE = ("zstd", "br", "gzip", "deflate")
+#: responses kept for :func:`recent`
+_RECENT = 256
+
+
+def supported() -> Tuple[str, ...]:
+    """Content encodings urllib3 can decode with the packages installed."""
+    from urllib3.util.request import ACCEPT_ENCODING
+
+    available = {e.strip() for e in ACCEPT_ENCODING.split(",")}
+    return tuple(e for e in _PREFERENCE if e in available)
+
+
+def accept_encoding() -> str:
+    """Value of the ``Accept-Encoding`` header sent with API requests."""
+    return config.accept_encoding or ", ".join(supported())
+
+
+def _wire_bytes(resp: Response) -> Optional[int]:
+    # bytes pulled from the socket before decoding, see urllib3's HTTPResponse.tell
+    try:
+        read = resp.raw.tell()
+    except Exception:
+        return None
+    return read if isinstance(read, int) else None
+
+
+class TransferLog:
+    """Wire and decoded bytes of the responses read, in total and per encoding."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._recent: Deque[Dict[str, Any]] = deque(maxlen=_RECENT)
+        self._totals: Dict[str, Dict[str, int]] = {}
+
+    def observe(self, resp: Response, decoded: Optional[int] = None) -> None:
+        """
+        Record a response whose body has been read.
+
+        ``decoded`` defaults to the length of ``resp.content``; pass it for bodies
+        consumed with ``iter_content``. Each response is only counted once.
+        """
+        if getattr(resp, "_spgci_transfer", None) is not None:
+            return
+        if decoded is None:
+            content = getattr(resp, "_content", None)
+            if not isinstance(content, bytes):
+                return
+            decoded = len(content)
+        wire = _wire_bytes(resp)
+        if wire is None:
+            return
+
+        encoding = resp.headers.get("content-encoding", "identity").lower()
+        entry = {
+            "url": resp.url,
+            "encoding": encoding,
+            "wire_bytes": wire,
+            "decoded_bytes": decoded,
+        }
+        resp._spgci_transfer = entry  # type: ignore[attr-defined]
+        with self._lock:
+            self._recent.append(entry)
+            totals = self._totals.setdefault(
+                encoding, {"requests": 0, "wire_bytes": 0, "decoded_bytes": 0}
+            )
+            totals["requests"] += 1
+            totals["wire_bytes"] += wire
+            totals["decoded_bytes"] += decoded
+
+    def stats(self) -> Dict[str, Any]:
+        """Totals over every response, ``saved`` being the share of bytes not sent."""
+        with self._lock:
+            by_encoding = {e: dict(t) for e, t in self._totals.items()}
+        wire = sum(t["wire_bytes"] for t in by_encoding.values())
+        decoded = sum(t["decoded_bytes"] for t in by_encoding.values())
+        return {
+            "requests": sum(t["requests"] for t in by_encoding.values()),
+            "wire_bytes": wire,
+            "decoded_bytes": decoded,
+            "saved": round(1 - wire / decoded, 3) if decoded else 0.0,
+            "by_encoding": by_encoding,
+        }
+
+    def recent(self) -> List[Dict[str, Any]]:
+        """The last responses read, oldest first."""
+        with self._lock:
+            return [dict(entry) for entry in self._recent]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._recent.clear()
+            self._totals.clear()
+
+
+_log = TransferLog()
+
+
+def observe(resp: Response, decoded: Optional[int] = None) -> None:
+    """Record a response in the process-wide log, see :meth:`TransferLog.observe`."""
+    _log.observe(resp, decoded)
+
+
+def stats() -> Dict[str, Any]:
+    """Wire against decoded bytes of every response read so far."""
+    return _log.stats()
+
+
+def recent() -> List[Dict[str, Any]]:
+    """Wire and decoded bytes of the last responses read."""
+    return _log.recent()
+
+
+def reset() -> None:
+    """Clear the transfer log."""
+    _log.reset()
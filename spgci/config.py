@@ -16,11 +16,16 @@
 Configure SPGCI settings
 """
 
+from __future__ import annotations
+
 import os
-from typing import Dict, Union, Optional
-from requests.auth import AuthBase
+from typing import TYPE_CHECKING, Dict, Union, Optional
 import contextvars
 
+if TYPE_CHECKING:
+    # only annotates ``auth``, importing requests here would slow ``import spgci``
+    from requests.auth import AuthBase
+
 # from requests import _Auth
 
 #: Username to use with the SPGCI API
@@ -72,6 +77,58 @@ sleep_time = 0
 #: parallelism
 parallelism = 8
 
+#: concurrent identical GET requests share one in-flight HTTP call
+single_flight = True
+
+#: refresh access tokens this many seconds before they expire
+token_refresh_margin = 300
+
+#: file used to share access tokens between processes, disabled when empty
+token_cache_path: str = os.getenv("SPGCI_TOKEN_CACHE", "")
+
+#: requests per second shared by every client using the same credentials, 0 for no limit
+rate_limit_per_second: float = float(os.getenv("SPGCI_RATE_LIMIT_PER_SECOND", "0"))
+
+#: SQLite file coordinating rate limits between processes, see ``spgci.quota``
+quota_store: str = os.getenv("SPGCI_QUOTA_STORE", "")
+
+#: cap on concurrent HTTP requests across all threads, 0 for no cap, see ``spgci.scheduler``
+max_concurrent_requests = 0
+
+#: per-priority caps on concurrent HTTP requests, e.g. ``{"bulk": 6}``
+priority_concurrency: Dict[str, int] = {}
+
+#: seconds calculator POST results are reused for identical bodies, 0 to disable
+post_memo_ttl: float = float(os.getenv("SPGCI_POST_MEMO_TTL", "3600"))
+
+#: SQLite file persisting memoised POST results, in memory when empty, see ``spgci.memo``
+post_memo_path: str = os.getenv("SPGCI_POST_MEMO_PATH", "")
+
+#: seconds ``get_unique_values`` results are reused, 0 to disable, see ``spgci.facets``
+facet_ttl: float = float(os.getenv("SPGCI_FACET_TTL", "0"))
+
+#: percentile of recent page latencies after which a page is requested again, 0 to
+#: disable, see ``spgci.hedge``
+hedge_percentile: float = float(os.getenv("SPGCI_HEDGE_PERCENTILE", "0"))
+
+#: most hedged pages, as a fraction of the pages requested
+hedge_budget = 0.05
+
+#: ``Accept-Encoding`` of API requests, every encoding that can be decoded when empty,
+#: ``"identity"`` to turn compression off, see ``spgci.compression``
+accept_encoding: str = os.getenv("SPGCI_ACCEPT_ENCODING", "")
+
+#: JSON bodies from this many bytes are parsed as they download, 0 to disable, see
+#: ``spgci.jsonstream``. Off by default: a streamed body is read after the request's
+#: retries, and concurrent identical requests are not shared
+stream_json_bytes: int = int(os.getenv("SPGCI_STREAM_JSON_BYTES", "0"))
+
+#: records turned into a DataFrame at a time when a body is parsed as it downloads
+stream_json_rows = 5000
+
+#: processes used to strip html from large article pulls, 0 or 1 to stay in-process
+html_strip_processes = 0
+
 
 def set_credentials(un: str, pw: str, apikey: Optional[str] = "") -> None:
     """
@@ -0,0 +1,88 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Bound the total time SDK calls may take.
+
+Every request made inside a :func:`within` block, including each page of a paginated
+call and each retry, shares one budget. Request timeouts are cut to the time left,
+waits for a rate limit or a scheduler slot give up when they would outlast it, retries
+that could not finish in time are not attempted, and once the budget is spent requests
+raise ``DeadlineExceededError`` instead of being sent. A paginated call that runs out
+raises ``PaginationError`` with the pages fetched so far, so a latency sensitive caller
+can serve partial or cached data instead of hanging.
+
+>>> import spgci as ci
+>>> with ci.deadline.within(5):
+...     ci.MarketData().get_assessments_by_mdc_history(mdc="ET", paginate=True)
+
+Blocks nest, the earliest deadline wins. Threads started with ``copy_context`` such as
+the page workers and ``utilities.parallel`` inherit the deadline of their caller.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Iterator, Optional
+
+from spgci.exceptions import DeadlineExceededError
+
+#: ``time.monotonic()`` value after which no request may start
+_deadline: "ContextVar[Optional[float]]" = ContextVar("spgci_deadline", default=None)
+
+
+@contextmanager
+def within(
+    seconds: Optional[float] = None, *, at: Optional[datetime] = None
+) -> Iterator[None]:
+    """
+    Give the SDK calls made inside the block ``seconds`` in total, or until ``at``.
+
+    With neither set the block leaves any enclosing deadline as it is.
+    """
+    candidates = [] if _deadline.get() is None else [_deadline.get()]
+    if seconds is not None:
+        candidates.append(time.monotonic() + seconds)
+    if at is not None:
+        if at.tzinfo is None:
+            at = at.astimezone()
+        left = (at - datetime.now(timezone.utc)).total_seconds()
+        candidates.append(time.monotonic() + left)
+
+    token = _deadline.set(min(candidates) if candidates else None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left, ``None`` when no deadline is set."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def check() -> None:
+    """Raise ``DeadlineExceededError`` once the deadline has passed."""
+    if remaining() == 0:
+        raise DeadlineExceededError("Deadline exceeded before the request was sent")
+
+
+def cap(seconds: float) -> float:
+    """``seconds`` shortened to the time left, for timeouts and waits."""
+    left = remaining()
+    return seconds if left is None else min(seconds, left)
@@ -13,12 +13,30 @@
 # limitations under the License.
 
 from __future__ import annotations
-from typing import List, Literal, Optional, Union
+import threading
+import warnings
+from contextvars import copy_context
+from queue import Queue
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 from requests import Response
 from spgci.api_client import get_data
+from spgci.facets import unique_values
+from spgci.jsonstream import read_frame
+from spgci.scheduler import Priority, priority
 from spgci.utilities import list_to_filter
 from pandas import DataFrame, Series
-from datetime import date, datetime
+from datetime import date, datetime, timedelta, timezone
 import pandas as pd
 from packaging.version import parse
 
@@ -141,10 +159,14 @@ class EUGasAnalytics:
             params.update({"filter": filter_exp})
 
         def to_df(resp: Response):
-            j = resp.json()
-            return DataFrame(j["aggResultValue"])
+            return read_frame(resp, "aggResultValue")
 
-        return get_data(path, params, to_df, paginate=True)
+        return unique_values(
+            path,
+            columns,
+            filter_exp,
+            lambda: get_data(path, params, to_df, paginate=True),
+        )
 
 
 
@@ -2402,3 +2424,203 @@ class EUGasAnalytics:
             )
 
         return df
+
+    def tail(
+        self,
+        sources: Iterable[str] = ("hourly_nomination", "instant_flow"),
+        **kwargs: Any,
+    ) -> "EUGasFlowTail":
+        """
+        Follow new hourly nominations and instant flows as they are published.
+
+        Accepts the same keyword arguments as `EUGasFlowTail`.
+
+        Examples
+        --------
+        >>> with ci.EUGasAnalytics().tail(callback=on_rows, poll_interval=30):
+        ...     run_dispatch_model()
+        """
+        return EUGasFlowTail(sources, client=self, **kwargs)
+
+
+class EUGasFlowTail:
+    """
+    Push rows of hourly nominations and instant flows as soon as they change.
+
+    Every source keeps a `modifiedDate` watermark and is polled with
+    `modifiedDate >= watermark - lookback`, so rows published late or sharing
+    the watermark timestamp are not missed. Rows that were already delivered
+    are recognised by their content and dropped, so each new or revised row is
+    pushed exactly once. Polls run at interactive priority so they are not
+    queued behind bulk downloads.
+
+    New rows are passed as `(source, DataFrame)` to `callback` and/or put on
+    `queue`. The watermark only advances once delivery succeeded; a failing
+    poll is retried at the next interval.
+
+    Parameters
+    ----------
+    sources : Iterable[str]
+        Any of `"hourly_nomination"` and `"instant_flow"`.
+    callback : Callable[[str, DataFrame], None], optional
+        Called with each batch of new rows, from the polling thread.
+    queue : queue.Queue, optional
+        Receives each batch of new rows as a `(source, DataFrame)` tuple.
+    poll_interval : float, optional
+        Seconds between polls, by default 60.
+    since : datetime, optional
+        Initial watermark, by default the time the tail is created.
+    lookback : timedelta, optional
+        Window re-read before the watermark on every poll, by default
+        5 minutes.
+    filters : dict, optional
+        Keyword filters per source passed through to the `get_*` method, e.g.
+        `{"hourly_nomination": {"to_country": "Germany"}}`.
+    client : EUGasAnalytics, optional
+        Client used to poll, by default a new `EUGasAnalytics`.
+
+    Examples
+    --------
+    >>> rows = queue.Queue()
+    >>> with EUGasFlowTail(queue=rows, poll_interval=30):
+    ...     while True:
+    ...         source, df = rows.get()
+    """
+
+    _methods = {
+        "hourly_nomination": "get_hourly_nomination",
+        "instant_flow": "get_instant_flow",
+    }
+
+    def __init__(
+        self,
+        sources: Iterable[str] = ("hourly_nomination", "instant_flow"),
+        *,
+        callback: Optional[Callable[[str, DataFrame], None]] = None,
+        queue: Optional["Queue[Tuple[str, DataFrame]]"] = None,
+        poll_interval: float = 60.0,
+        since: Optional[datetime] = None,
+        lookback: timedelta = timedelta(minutes=5),
+        filters: Optional[Dict[str, Dict[str, Any]]] = None,
+        client: Optional[EUGasAnalytics] = None,
+        page_size: int = 5000,
+    ):
+        self.sources = list(sources)
+        unknown = [s for s in self.sources if s not in self._methods]
+        if unknown:
+            valid = ", ".join(self._methods)
+            raise ValueError(f"Unknown source(s) {unknown}, expected any of {valid}")
+
+        self.callback = callback
+        self.queue = queue
+        self.poll_interval = poll_interval
+        self.lookback = pd.Timedelta(lookback)
+        self.filters = filters or {}
+        self.page_size = page_size
+        self._client = client if client is not None else EUGasAnalytics()
+
+        start = pd.Timestamp(since if since is not None else datetime.now(timezone.utc))
+        start = start.tz_localize("UTC") if start.tzinfo is None else start
+        self._watermarks: Dict[str, pd.Timestamp] = {s: start for s in self.sources}
+        # content hashes of rows delivered inside the lookback window
+        self._seen: Dict[str, Dict[int, pd.Timestamp]] = {s: {} for s in self.sources}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._poller: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "EUGasFlowTail":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    @property
+    def watermarks(self) -> Dict[str, pd.Timestamp]:
+        """Latest `modifiedDate` delivered per source."""
+        with self._lock:
+            return dict(self._watermarks)
+
+    def start(self) -> None:
+        """Poll in a background thread until `stop` is called."""
+        with self._lock:
+            if self._poller is not None:
+                return
+            self._stop.clear()
+            self._poller = threading.Thread(
+                target=copy_context().run, args=(self._poll_loop,), daemon=True
+            )
+            self._poller.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop polling, waiting for a poll in progress to finish."""
+        self._stop.set()
+        with self._lock:
+            poller, self._poller = self._poller, None
+        if poller is not None and poller is not threading.current_thread():
+            poller.join(timeout)
+
+    def poll(self) -> Dict[str, DataFrame]:
+        """
+        Poll every source once and deliver its new rows.
+
+        Returns
+        -------
+        dict[str, DataFrame]
+            New rows per source, empty frames when nothing changed.
+        """
+        with priority(Priority.INTERACTIVE):
+            return {source: self._poll_source(source) for source in self.sources}
+
+    def _poll_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception as exc:
+                warnings.warn(f"EU gas tail poll failed, retrying: {exc}")
+            self._stop.wait(self.poll_interval)
+
+    def _poll_source(self, source: str) -> DataFrame:
+        with self._lock:
+            since = self._watermarks[source] - self.lookback
+
+        fetch = getattr(self._client, self._methods[source])
+        df = cast(
+            DataFrame,
+            fetch(
+                modified_date_gte=since.isoformat(),
+                page_size=self.page_size,
+                paginate=True,
+                **self.filters.get(source, {}),
+            ),
+        )
+        if df.empty or "modifiedDate" not in df.columns:
+            return df.iloc[0:0]
+
+        hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        with self._lock:
+            seen = self._seen[source]
+            new = ~pd.Series(hashes).isin(seen.keys()).to_numpy()
+            # the same row may also appear twice when a page boundary moves
+            new &= ~pd.Series(hashes).duplicated().to_numpy()
+
+        rows = df[new].sort_values("modifiedDate", kind="stable", ignore_index=True)
+        if not rows.empty:
+            self._deliver(source, rows)
+
+        with self._lock:
+            for h, modified in zip(hashes[new].tolist(), df.loc[new, "modifiedDate"]):
+                seen[h] = modified
+            watermark = max(self._watermarks[source], df["modifiedDate"].max())
+            self._watermarks[source] = watermark
+            horizon = watermark - self.lookback
+            for h in [h for h, modified in seen.items() if modified < horizon]:
+                del seen[h]
+
+        return rows
+
+    def _deliver(self, source: str, rows: DataFrame) -> None:
+        if self.callback is not None:
+            self.callback(source, rows)
+        if self.queue is not None:
+            self.queue.put((source, rows))
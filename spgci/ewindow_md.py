@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 from spgci.api_client import get_data, Paginator
+from spgci.jsonstream import read_frame
 from typing import List, Union, Optional
 from requests import Response
 from spgci.utilities import list_to_filter
@@ -81,8 +82,7 @@ class EWindowMarketData:
 
     @staticmethod
     def _convert_agg_to_df(resp: Response) -> DataFrame:
-        j = resp.json()
-        df = DataFrame(j["aggResultValue"])
+        df = read_frame(resp, "aggResultValue")
 
         if len(df) > 0:
             df["max(order_date)"] = to_datetime(df["max(order_date)"])
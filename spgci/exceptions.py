@@ -12,6 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
 
 class AuthError(Exception):
     """
@@ -35,3 +40,121 @@ class DailyLimitError(Exception):
     """
 
     pass
+
+
+class PaginationError(Exception):
+    """
+    A page of a paginated request failed and the pages still pending were cancelled.
+
+    The error of the failed page is the ``__cause__``. ``pages`` holds the DataFrame
+    of every page that completed before it, keyed by page number, so the work done
+    can be reused, e.g. by fetching only the missing pages later.
+
+    Raised through :meth:`wrap`, the error is also an instance of the failed page's
+    error type, so ``except DailyLimitError`` or ``except requests.HTTPError`` still
+    catch it.
+    """
+
+    def __init__(
+        self,
+        failed_page: int,
+        total_pages: int,
+        pages: "Dict[int, DataFrame]",
+        error: BaseException,
+    ) -> None:
+        self.failed_page = failed_page
+        self.total_pages = total_pages
+        self.pages = pages
+        self.error = error
+        # not super(): in a subclass made by wrap() it is the original error's type
+        Exception.__init__(
+            self,
+            f"Page {failed_page} of {total_pages} failed ({error!r}). "
+            f"{len(pages)} pages completed: {_ranges(sorted(pages))}",
+        )
+
+    @classmethod
+    def wrap(
+        cls,
+        failed_page: int,
+        total_pages: int,
+        pages: "Dict[int, DataFrame]",
+        error: BaseException,
+    ) -> "PaginationError":
+        """A ``PaginationError`` that is also an instance of ``type(error)``."""
+        try:
+            kind = _with_error_type(type(error))
+            wrapped = kind.__new__(kind)
+        except TypeError:
+            # the error type cannot be subclassed, keep the plain error
+            return cls(failed_page, total_pages, pages, error)
+        # attributes of the original error, e.g. ``response`` of an HTTPError
+        wrapped.__dict__.update(vars(error))
+        cls.__init__(wrapped, failed_page, total_pages, pages, error)
+        return wrapped
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # the classes made by wrap() cannot be imported by name, make them again
+        error_type = type(self).__dict__.get("_error_type")
+        kind = None if error_type is not None else type(self)
+        return (_restore, (kind, error_type, self.args), self.__dict__)
+
+    @property
+    def missing_pages(self) -> List[int]:
+        """Pages that were not fetched, in order."""
+        return [p for p in range(1, self.total_pages + 1) if p not in self.pages]
+
+    def partial(self) -> "DataFrame":
+        """The completed pages concatenated in page order."""
+        import pandas as pd
+
+        return pd.concat([self.pages[p] for p in sorted(self.pages)], ignore_index=True)
+
+
+_ERROR_TYPES: "Dict[type, Type[PaginationError]]" = {}
+
+
+def _with_error_type(error_type: type) -> "Type[PaginationError]":
+    """Subclass of ``PaginationError`` and ``error_type``, made once per type."""
+    if issubclass(error_type, PaginationError):
+        return error_type
+    if error_type not in _ERROR_TYPES:
+        _ERROR_TYPES[error_type] = type(
+            f"PaginationError[{error_type.__name__}]",
+            (PaginationError, error_type),
+            {"__module__": __name__, "_error_type": error_type},
+        )
+    return _ERROR_TYPES[error_type]
+
+
+def _restore(
+    kind: "Optional[Type[PaginationError]]",
+    error_type: Optional[type],
+    args: Tuple[Any, ...],
+) -> PaginationError:
+    """Unpickle a ``PaginationError``, its attributes are restored afterwards."""
+    if kind is None:
+        kind = _with_error_type(error_type)  # type: ignore[arg-type]
+    error = kind.__new__(kind)
+    Exception.__init__(error, *args)
+    return error
+
+
+def _ranges(pages: List[int]) -> str:
+    """``[1, 2, 3, 5]`` as ``"1-3, 5"``."""
+    spans: List[List[int]] = []
+    for page in pages:
+        if spans and page == spans[-1][1] + 1:
+            spans[-1][1] = page
+        else:
+            spans.append([page, page])
+    return ", ".join(f"{a}-{b}" if a != b else str(a) for a, b in spans) or "none"
+
+
+class DeadlineExceededError(TimeoutError):
+    """
+    The time budget set through ``spgci.deadline.within`` ran out before the request
+    could be sent.
+    """
+
+    pass
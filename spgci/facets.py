@@ -0,0 +1,367 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Cache the results of ``get_unique_values`` across every dataset client.
+
+Each ``get_unique_values`` call is a paginated GroupBy request. When
+``config.facet_ttl`` is set, results are kept for that many seconds per (dataset,
+columns, filter), and a call whose columns and filter are narrower than a cached result
+is answered from it locally: a filter that only restricts values further, or a subset
+of the grouped columns, never goes back to the API.
+
+Only filters made of ``AND``-ed equality and ``in (...)`` terms, as written by
+``build_filter_expression``, are compared this way. Any other filter is only reused
+by a call with the same filter text. A result with columns besides the grouped ones,
+such as counts, is only reused by the same call, since a narrower request would not
+return them as they are.
+
+>>> import spgci as ci
+>>> ci.config.facet_ttl = 900
+>>> ci.facets.prewarm([(ci.Weather(), "actual", ["market", "city", "location"])])
+>>> ci.Weather().get_unique_values(
+...     "actual", "city", filter_exp='market: "United States"'
+... )  # answered from the cache
+>>> ci.facets.stats()
+{'hits': 0, 'derived': 1, 'misses': 1}
+"""
+
+import re
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import copy_context
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import spgci.config as config
+from pandas import DataFrame
+from pandas.api.types import is_numeric_dtype, is_object_dtype, is_string_dtype
+from spgci.scheduler import Priority, explicit_priority, priority
+
+_NAME = r"[A-Za-z_][\w.]*"
+_LITERAL = r"\"[^\"]*\"|'(?:[^']|'')*'|-?\d+(?:\.\d+)?|true|false"
+_TERM = re.compile(
+    rf"\s*({_NAME})\s*(?:(?::|\s+eq\s+)\s*({_LITERAL})|\s+in\s*\(([^)]*)\))\s*",
+    re.IGNORECASE,
+)
+_AND = re.compile(r"and\s+", re.IGNORECASE)
+_VALUE = re.compile(rf"\s*({_LITERAL})\s*(?:,|$)", re.IGNORECASE)
+
+#: column -> allowed values of a filter; None when the filter could not be parsed
+Constraints = Optional[Dict[str, FrozenSet[Any]]]
+
+
+def _literal(text: str) -> Any:
+    if text[0] == '"':
+        return text[1:-1]
+    if text[0] == "'":
+        return text[1:-1].replace("''", "'")
+    if text.lower() in ("true", "false"):
+        return text.lower() == "true"
+    return float(text) if "." in text else int(text)
+
+
+def _values(text: str) -> Optional[FrozenSet[Any]]:
+    values = []
+    pos = 0
+    while pos < len(text):
+        match = _VALUE.match(text, pos)
+        if match is None:
+            return None
+        values.append(_literal(match.group(1)))
+        pos = match.end()
+    return frozenset(values) if values else None
+
+
+def parse_filter(filter_exp: Optional[str]) -> Constraints:
+    """
+    Read a filter of ``AND``-ed ``col: value``, ``col eq value`` and
+    ``col in (...)`` terms into the values allowed for each column.
+
+    Returns ``None`` for any other filter.
+    """
+    constraints: Dict[str, FrozenSet[Any]] = {}
+    text = (filter_exp or "").strip()
+    pos = 0
+    while pos < len(text):
+        match = _TERM.match(text, pos)
+        if match is None:
+            return None
+        name, single, many = match.groups()
+        values = frozenset([_literal(single)]) if single is not None else _values(many)
+        if values is None:
+            return None
+        # a column filtered twice allows only values passing both
+        constraints[name] = constraints.get(name, values) & values
+        pos = match.end()
+        if pos < len(text):
+            joined = _AND.match(text, pos)
+            if joined is None:
+                return None
+            pos = joined.end()
+    return constraints
+
+
+def _columns(columns: Union[List[str], str, None]) -> Tuple[str, ...]:
+    if isinstance(columns, str):
+        columns = columns.split(",")
+    return tuple(c.strip() for c in columns or () if c.strip())
+
+
+class FacetKey(NamedTuple):
+    path: str
+    columns: Tuple[str, ...]
+    filter_exp: str
+
+
+class _Entry(NamedTuple):
+    df: DataFrame
+    constraints: Constraints
+    expires_at: float
+
+
+class FacetCatalogue:
+    """
+    ``get_unique_values`` results by path, grouped columns and filter.
+
+    The least recently used results are dropped past ``maxsize``. Hit counts are
+    reported by :meth:`stats`: ``hits`` for an exact match, ``derived`` for a call
+    answered from a wider result and ``misses`` for calls sent to the API.
+    """
+
+    def __init__(self, maxsize: int = 512) -> None:
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str, FacetKey], _Entry]" = OrderedDict()
+        self._stats = {"hits": 0, "derived": 0, "misses": 0}
+
+    @staticmethod
+    def _scope() -> Tuple[str, str]:
+        # entitlements differ between users, so do the values they see
+        return (config.base_url, config.username)
+
+    def get(
+        self,
+        path: str,
+        columns: Union[List[str], str, None],
+        filter_exp: Optional[str],
+        fetch: Callable[[], DataFrame],
+        ttl: Optional[float] = None,
+    ) -> DataFrame:
+        """Return the unique values of ``columns``, calling ``fetch`` on a miss."""
+        ttl = config.facet_ttl if ttl is None else ttl
+        if ttl <= 0:
+            return fetch()
+
+        key = FacetKey(path, _columns(columns), (filter_exp or "").strip())
+        constraints = parse_filter(key.filter_exp)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get((*self._scope(), key))
+            if entry is not None and entry.expires_at > now:
+                self._entries.move_to_end((*self._scope(), key))
+                self._stats["hits"] += 1
+                return entry.df.copy()
+            derived = self._derive(key, constraints, now)
+            self._stats["derived" if derived is not None else "misses"] += 1
+        if derived is not None:
+            return derived
+
+        df = fetch()
+        if isinstance(df, DataFrame):
+            self._store(key, constraints, df, now + ttl)
+        return df
+
+    def _derive(
+        self, key: FacetKey, constraints: Constraints, now: float
+    ) -> Optional[DataFrame]:
+        """Answer ``key`` from a cached wider result, if one covers it."""
+        scope = self._scope()
+        for (base_url, username, cached), entry in reversed(self._entries.items()):
+            if (
+                (base_url, username) != scope
+                or cached.path != key.path
+                or not key.columns
+                or entry.expires_at <= now
+                or not set(key.columns) <= set(cached.columns)
+                # a fresh request returns the grouped columns only
+                or set(entry.df.columns) != set(cached.columns)
+            ):
+                continue
+            if cached.filter_exp == key.filter_exp:
+                df: Optional[DataFrame] = entry.df
+            elif constraints is None or entry.constraints is None:
+                continue
+            else:
+                df = _narrow(entry.df, entry.constraints, constraints)
+                if df is None:
+                    continue
+            self._entries.move_to_end((base_url, username, cached))
+            return df[list(key.columns)].drop_duplicates().reset_index(drop=True)
+        return None
+
+    def _store(
+        self, key: FacetKey, constraints: Constraints, df: DataFrame, expires: float
+    ) -> None:
+        with self._lock:
+            scoped = (*self._scope(), key)
+            self._entries[scoped] = _Entry(df.copy(), constraints, expires)
+            self._entries.move_to_end(scoped)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def clear(self) -> None:
+        """Drop every cached result and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._stats = dict.fromkeys(self._stats, 0)
+
+
+def _narrow(
+    df: DataFrame,
+    cached: Dict[str, FrozenSet[Any]],
+    wanted: Dict[str, FrozenSet[Any]],
+) -> Optional[DataFrame]:
+    """
+    Rows of a result filtered by ``cached`` that also pass ``wanted``.
+
+    ``None`` when ``wanted`` is not narrower than ``cached`` or cannot be applied
+    to the cached columns exactly, e.g. to dates parsed by the client.
+    """
+    for column, allowed in cached.items():
+        if column not in wanted or not wanted[column] <= allowed:
+            return None
+
+    for column, values in wanted.items():
+        if values == cached.get(column):
+            continue
+        if column not in df.columns:
+            return None
+        series = df[column]
+        if all(isinstance(v, str) for v in values):
+            comparable = is_object_dtype(series.dtype) or is_string_dtype(series.dtype)
+        elif not any(isinstance(v, bool) for v in values):
+            comparable = is_numeric_dtype(series.dtype)
+        else:
+            comparable = False
+        if not comparable:
+            return None
+        df = df[series.isin(list(values))]
+    return df
+
+
+_catalogue = FacetCatalogue()
+
+
+def unique_values(
+    path: str,
+    columns: Union[List[str], str, None],
+    filter_exp: Optional[str],
+    fetch: Callable[[], DataFrame],
+) -> DataFrame:
+    """``get_unique_values`` through the shared catalogue, see the module docs."""
+    return _catalogue.get(path, columns, filter_exp, fetch)
+
+
+FacetSpec = Union[
+    Tuple[Any, str, Union[List[str], str]],
+    Tuple[Any, str, Union[List[str], str], Union[str, Dict[str, Any], None]],
+]
+
+
+def prewarm(
+    specs: Iterable[FacetSpec],
+    *,
+    max_workers: Optional[int] = None,
+    errors: Literal["raise", "skip"] = "raise",
+) -> List[Optional[DataFrame]]:
+    """
+    Load many ``get_unique_values`` results into the catalogue at once.
+
+    Parameters
+    ----------
+    specs : iterable of tuple
+        ``(client, dataset, columns)`` or ``(client, dataset, columns, filters)``,
+        where ``filters`` is a ``filter_exp`` string or a dict of keyword filters for
+        clients such as ``AmericasGas``. Prefer the widest columns and filters the
+        application needs: narrower calls are then answered from them.
+    max_workers : int, optional
+        Requests in flight at once, by default ``config.parallelism``.
+    errors : {"raise", "skip"}, optional
+        Raise the first failure, or warn and return ``None`` in its place.
+
+    Returns
+    -------
+    list of DataFrame
+        The results, in the order of ``specs``.
+    """
+    specs = list(specs)
+
+    def load(spec: FacetSpec) -> DataFrame:
+        client, dataset, columns, *rest = spec
+        filters = rest[0] if rest else None
+        if isinstance(filters, dict):
+            return client.get_unique_values(dataset, columns, **filters)
+        return client.get_unique_values(dataset, columns, filter_exp=filters)
+
+    results: List[Optional[DataFrame]] = [None] * len(specs)
+    workers = max_workers or config.parallelism
+    level = explicit_priority()
+    with priority(Priority.BULK if level is None else level):
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(copy_context().run, load, spec): position
+                for position, spec in enumerate(specs)
+            }
+            try:
+                for future in as_completed(futures):
+                    position = futures[future]
+                    try:
+                        results[position] = future.result()
+                    except Exception as exc:
+                        if errors == "raise":
+                            raise
+                        warnings.warn(f"Prewarming {specs[position][:3]} failed: {exc}")
+            finally:
+                for queued in futures:
+                    queued.cancel()
+    return results
+
+
+def stats() -> Dict[str, int]:
+    """Exact hit, derived hit and miss counts of the catalogue."""
+    return _catalogue.stats()
+
+
+def clear() -> None:
+    """Empty the catalogue."""
+    _catalogue.clear()
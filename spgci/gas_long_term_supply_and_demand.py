@@ -16,6 +16,8 @@ from __future__ import annotations
 from typing import List, Optional, Union, Literal
 from requests import Response
 from spgci.api_client import get_data
+from spgci.facets import unique_values
+from spgci.jsonstream import read_frame
 from spgci.utilities import list_to_filter
 from pandas import DataFrame, Series
 from datetime import date, datetime
@@ -95,10 +97,14 @@ class GasLongTermSupplyAndDemand:
             params.update({"filter": filter_exp})
 
         def to_df(resp: Response):
-            j = resp.json()
-            return DataFrame(j["aggResultValue"])
+            return read_frame(resp, "aggResultValue")
 
-        return get_data(path, params, to_df, paginate=True)
+        return unique_values(
+            path,
+            columns,
+            filter_exp,
+            lambda: get_data(path, params, to_df, paginate=True),
+        )
 
 
     def get_greater_china(
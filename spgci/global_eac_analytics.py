@@ -8,6 +8,8 @@ from pandas import DataFrame, Series
 from requests import Response
 
 from spgci.api_client import get_data
+from spgci.facets import unique_values
+from spgci.jsonstream import read_frame
 from spgci.utilities import list_to_filter
 
 
@@ -65,11 +67,16 @@ class GlobalEacAnalytics:
         if filter_exp is not None:
             params["filter"] = filter_exp
 
-        return get_data(
-            path=self._dataset_to_path[dataset],
-            params=params,
-            df_fn=self._convert_unique_values_to_df,
-            paginate=True,
+        return unique_values(
+            self._dataset_to_path[dataset],
+            columns,
+            filter_exp,
+            lambda: get_data(
+                path=self._dataset_to_path[dataset],
+                params=params,
+                df_fn=self._convert_unique_values_to_df,
+                paginate=True,
+            ),
         )
 
     def get_outlooks(
@@ -578,7 +585,7 @@ class GlobalEacAnalytics:
 
     @staticmethod
     def _normalize(resp: Response, key: str) -> DataFrame:
-        df = pd.json_normalize(resp.json()[key])
+        df = read_frame(resp, key, pd.json_normalize)
         date_columns = [
             "vintage",
             "issueDate",
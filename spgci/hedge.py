@@ -0,0 +1,172 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Hedge slow pages of paginated requests.
+
+A paginated call takes as long as its slowest page. With hedging enabled, a page that
+has not answered within ``config.hedge_percentile`` of recent page latencies is
+requested a second time and whichever copy answers first is used.
+
+Hedges are only sent while they fit in ``config.hedge_budget`` (a fraction of the
+pages requested), while the shared rate limit has no backlog and while the day's
+budget is not nearly spent, see ``spgci.quota``.
+
+>>> import spgci as ci
+>>> ci.config.hedge_percentile = 95
+>>> ci.MarketData().get_assessments_by_mdc_history(mdc="ET", paginate=True)
+>>> ci.hedge.stats()
+{'requests': 120, 'hedged': 4, 'won': 3, 'delay': 2.7}
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from functools import partial
+from typing import Any, Callable, Deque, Dict, Optional, TypeVar
+
+import spgci.config as config
+from spgci.quota import get_coordinator
+
+R = TypeVar("R")
+
+#: latencies kept to estimate the percentile
+_WINDOW = 256
+#: no hedging until this many latencies were seen
+_MIN_SAMPLES = 20
+#: hedges never spend the last requests of the daily budget
+_DAILY_RESERVE = 100
+
+
+def _discard(discard: Callable[[Any], Any], future: "Future[Any]") -> None:
+    if not future.cancelled() and future.exception() is None:
+        discard(future.result())
+
+
+class Hedger:
+    """Sends a second copy of slow requests and keeps the first answer."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._latencies: Deque[float] = deque(maxlen=_WINDOW)
+        self._stats = {"requests": 0, "hedged": 0, "won": 0}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def delay(self) -> Optional[float]:
+        """Seconds after which a request is hedged, ``None`` while disabled."""
+        percentile = config.hedge_percentile
+        with self._lock:
+            if not percentile or len(self._latencies) < _MIN_SAMPLES:
+                return None
+            ordered = sorted(self._latencies)
+        rank = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+        return ordered[rank]
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # each page may have its own request and a hedge in flight
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(4, 2 * config.parallelism),
+                    thread_name_prefix="spgci-hedge",
+                )
+            return self._executor
+
+    def _may_hedge(self) -> bool:
+        with self._lock:
+            if self._stats["hedged"] >= config.hedge_budget * self._stats["requests"]:
+                return False
+        quota = get_coordinator()
+        if quota is None:
+            return True
+        usage = quota.usage()
+        if usage["queued_seconds"] > 0:
+            # a hedge would only queue behind the requests already waiting
+            return False
+        remaining = usage["remaining_day"]
+        return remaining is None or remaining > _DAILY_RESERVE
+
+    def _timed(self, send: Callable[[], R]) -> R:
+        start = time.monotonic()
+        result = send()
+        with self._lock:
+            self._latencies.append(time.monotonic() - start)
+        return result
+
+    def call(
+        self, send: Callable[[], R], discard: Optional[Callable[[R], Any]] = None
+    ) -> R:
+        """
+        Return ``send()``, hedged by a second ``send()`` when it is slow.
+
+        ``discard`` is called with the answer that arrived second, if any, e.g. to
+        close a response whose body was never read.
+        """
+        with self._lock:
+            self._stats["requests"] += 1
+        delay = self.delay()
+        if delay is None:
+            return self._timed(send)
+
+        pool = self._pool()
+        primary = pool.submit(copy_context().run, self._timed, send)
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._may_hedge():
+            return primary.result()
+
+        with self._lock:
+            self._stats["hedged"] += 1
+        hedge = pool.submit(copy_context().run, self._timed, send)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        with self._lock:
+                            self._stats["won"] += 1
+                    if discard is not None:
+                        loser = primary if future is hedge else hedge
+                        loser.add_done_callback(partial(_discard, discard))
+                    return future.result()
+        # both failed, report the original request's error
+        return primary.result()
+
+    def stats(self) -> Dict[str, Any]:
+        """Requests seen, hedges sent, hedges that answered first and current delay."""
+        delay = self.delay()
+        with self._lock:
+            return {**self._stats, "delay": delay}
+
+    def reset(self) -> None:
+        """Forget the latencies and counters."""
+        with self._lock:
+            self._latencies.clear()
+            self._stats = dict.fromkeys(self._stats, 0)
+
+
+#: process-wide hedger used for pages of paginated requests
+hedger = Hedger()
+
+
+def stats() -> Dict[str, Any]:
+    """Hedging counters of the API client."""
+    return hedger.stats()
+
+
+def reset() -> None:
+    """Clear the hedging counters and latency history."""
+    hedger.reset()
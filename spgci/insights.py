@@ -13,9 +13,11 @@
 # limitations under the License.
 
 from __future__ import annotations
-from .api_client import get_data, Paginator
-from .utilities import list_to_filter
-from typing import Union, Optional
+from .api_client import get_data, Paginator, _get_stream, _session
+from .compression import observe
+from .scheduler import Priority, explicit_priority, priority
+from .utilities import list_to_filter, strip_html_columns
+from typing import Any, Callable, Dict, Literal, Mapping, Union, Optional
 from pandas import DataFrame, Series, to_datetime, json_normalize  # type: ignore
 import pandas as pd
 from packaging.version import parse
@@ -23,8 +25,40 @@ from requests import Response
 from datetime import datetime
 from enum import Enum
 from functools import partial
-import html
 from urllib.parse import unquote
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import copy_context
+import hashlib
+import json
+import os
+import threading
+import warnings
+import spgci.config
+
+
+_CONTENT_EXTENSIONS = {
+    "application/pdf": ".pdf",
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": ".xlsx",
+    "application/vnd.ms-excel": ".xls",
+    "text/csv": ".csv",
+    "application/json": ".json",
+}
+
+#: downloaded contents recorded by ``Insights.download_contents``, one JSON line each
+_MANIFEST = ".spgci-contents.jsonl"
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(partial(fh.read, 1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _content_encoded(response: Response) -> bool:
+    encoding = response.headers.get("content-encoding", "identity")
+    return encoding.strip().lower() != "identity"
 
 
 class Insights:
@@ -42,6 +76,7 @@ class Insights:
    ``get_heards`` get heards, assessments summaries, market information summaries and tenders.\n
     ``get_subscriber_notes`` get subscriber notes.\n
     ``get_content`` get insights by ID.\n
+    ``download_contents`` download many documents by ID to a folder.\n
     ``get_packages`` get package content from the /v2/search/packages endpoint.\n
 
     """
@@ -108,18 +143,7 @@ class Insights:
                 df["updatedDate"] = to_datetime(df["updatedDate"], utc=True)
 
         if strip_html:
-            if "headline" in df.columns:
-                df["headline"] = df["headline"].str.replace(r"<.*?>", " ", regex=True)  # type: ignore
-                df["headline"] = df["headline"].apply(lambda s: html.unescape(str(s)).replace("\n", " "))  # type: ignore
-            if "body" in df.columns:
-                df["body"] = df["body"].str.replace(r"<.*?>", " ", regex=True)  # type: ignore
-                df["body"] = df["body"].apply(lambda s: html.unescape(str(s)).replace("\n", " "))  # type: ignore
-            if "lead" in df.columns:
-                df["lead"] = df["lead"].str.replace(r"<.*?>", " ", regex=True)  # type: ignore
-                df["lead"] = df["lead"].apply(lambda s: html.unescape(str(s)).replace("\n", " "))  # type: ignore
-            if "summary" in df.columns:
-                df["summary"] = df["summary"].str.replace(r"<.*?>", " ", regex=True)  # type: ignore
-                df["summary"] = df["summary"].apply(lambda s: html.unescape(str(s)).replace("\n", " "))  # type: ignore
+            strip_html_columns(df, ["headline", "body", "lead", "summary"])
 
         return df
 
@@ -130,6 +154,46 @@ class Insights:
 
         return df
 
+    @staticmethod
+    def _content_filename(id: str, headers: Mapping[str, str]) -> str:
+        """File name from ``content-disposition``, else the content ID and an extension."""
+        cd = headers.get("content-disposition", "")
+        filename = None
+
+        if "filename*=" in cd:
+            try:
+                filename_star = cd.split("filename*=", 1)[1].split(";", 1)[0].strip()
+                # RFC 5987 format: UTF-8''encoded_name.ext
+                if "''" in filename_star:
+                    filename = unquote(filename_star.split("''", 1)[1].strip('"'))
+                else:
+                    filename = unquote(filename_star.strip('"'))
+            except Exception:
+                filename = None
+
+        if filename is None and "filename=" in cd:
+            try:
+                filename = (
+                    cd.split("filename=", 1)[1]
+                    .split(";", 1)[0]
+                    .strip()
+                    .strip('"')
+                    .strip("'")
+                )
+            except Exception:
+                filename = None
+
+        # never let the server pick the directory
+        filename = os.path.basename((filename or "").replace("\\", "/"))
+        if filename not in ("", ".", ".."):
+            return filename
+
+        content_type = headers.get("content-type", "").lower()
+        for mime, ext in _CONTENT_EXTENSIONS.items():
+            if mime in content_type:
+                return f"{id}{ext}"
+        return id
+
     def get_heards(
         self,
         *,
@@ -1095,45 +1159,11 @@ class Insights:
 
         # if a non-JSON response was returned (e.g. PDF/Excel), allow optional download.
         if isinstance(result, Response):
-            content_type = result.headers.get("content-type", "").lower()
             if download:
-                cd = result.headers.get("content-disposition", "")
-                filename = None
-
-                if "filename*=" in cd:
-                    try:
-                        filename_star = cd.split("filename*=", 1)[1].split(";", 1)[0].strip()
-                        # RFC 5987 format: UTF-8''encoded_name.ext
-                        if "''" in filename_star:
-                            filename = unquote(filename_star.split("''", 1)[1].strip('"'))
-                        else:
-                            filename = unquote(filename_star.strip('"'))
-                    except Exception:
-                        filename = None
-
-                if filename is None and "filename=" in cd:
-                    try:
-                        filename = cd.split("filename=", 1)[1].split(";", 1)[0].strip().strip('"').strip("'")
-                    except Exception:
-                        filename = None
-
-                ext_map = {
-                    "application/pdf": ".pdf",
-                    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": ".xlsx",
-                    "application/vnd.ms-excel": ".xls",
-                    "text/csv": ".csv",
-                }
-
-                inferred_ext = ""
-                for mime, ext in ext_map.items():
-                    if mime in content_type:
-                        inferred_ext = ext
-                        break
-
                 if isinstance(download, str) and download.strip() != "":
                     filepath = download
                 else:
-                    filepath = filename or f"{id}{inferred_ext}"
+                    filepath = self._content_filename(id, result.headers)
 
                 with open(filepath, "wb") as fh:
                     fh.write(result.content)
@@ -1145,6 +1175,235 @@ class Insights:
 
         return result
     
+    def download_contents(
+        self,
+        ids: Union[list[str], "Series[str]", DataFrame],
+        directory: str = ".",
+        *,
+        verify: Literal["size", "hash"] = "size",
+        max_workers: Optional[int] = None,
+        chunk_size: int = 1 << 20,
+        errors: Literal["raise", "skip"] = "raise",
+    ) -> DataFrame:
+        """
+        Download many documents to ``directory``, streaming each one to disk.
+
+        Downloads run concurrently through the client's usual rate limiting, as
+        ``Priority.BULK`` unless the caller chose a priority. Completed files are
+        recorded in a manifest in ``directory``, so calling again with the same IDs
+        only fetches what is missing. An interrupted download is kept as
+        ``<id>.part`` and resumed with a ``Range`` request on the next call.
+
+        Parameters
+        ----------
+        ids : Union[list[str], Series[str], DataFrame]
+            content IDs, or a DataFrame with an ``id`` column such as the result of
+            ``get_packages`` or ``get_stories``
+        directory : str, optional
+            folder the documents are written to, created if missing, by default ``"."``
+        verify : {"size", "hash"}, optional
+            how a file already in the manifest is checked before it is skipped,
+            against its recorded size or its recorded SHA-256, by default ``"size"``
+        max_workers : int, optional
+            downloads in flight at once, by default ``config.parallelism``
+        chunk_size : int, optional
+            bytes read from the network per write, by default 1 MiB
+        errors : {"raise", "skip"}, optional
+            raise the first failure, or warn and carry on with the other IDs, by
+            default ``"raise"``
+
+        Returns
+        -------
+        DataFrame
+            one row per ID with the ``path`` written, ``status`` (``downloaded``,
+            ``resumed``, ``skipped`` or ``failed``), ``size`` and ``sha256``
+
+        Examples
+        --------
+        **Archive a month of reports**
+        >>> ni = ci.Insights()
+        >>> packages = ni.get_packages(
+        ...     updated_date_gte=datetime(2026, 3, 1), paginate=True
+        ... )
+        >>> ni.download_contents(packages, "reports/2026-03")
+        """
+        if isinstance(ids, DataFrame):
+            ids = ids["id"]
+        unique = list(dict.fromkeys(str(i) for i in ids))
+        os.makedirs(directory, exist_ok=True)
+
+        manifest_path = os.path.join(directory, _MANIFEST)
+        manifest: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(manifest_path):
+            with open(manifest_path, encoding="utf-8") as fh:
+                for line in fh:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # a line cut short by a crash
+                        continue
+                    manifest[record["id"]] = record
+
+        lock = threading.Lock()
+        # file names taken by other IDs, so two documents never share a file
+        owners = {record["file"]: id for id, record in manifest.items()}
+
+        def claim(id: str, filename: str) -> str:
+            with lock:
+                if owners.setdefault(filename, id) != id:
+                    filename = f"{id}_{filename}"
+                    owners[filename] = id
+            return filename
+
+        def record(id: str, filename: str, size: int, sha256: str) -> None:
+            line = json.dumps(
+                {"id": id, "file": filename, "size": size, "sha256": sha256}
+            )
+            with lock, open(manifest_path, "a", encoding="utf-8") as fh:
+                fh.write(line + "\n")
+
+        def fetch(id: str) -> Dict[str, Any]:
+            known = manifest.get(id)
+            if known is not None:
+                path = os.path.join(directory, known["file"])
+                if os.path.exists(path) and (
+                    os.path.getsize(path) == known["size"]
+                    if verify == "size"
+                    else _sha256(path) == known["sha256"]
+                ):
+                    return {
+                        "id": id,
+                        "path": path,
+                        "status": "skipped",
+                        "size": known["size"],
+                        "sha256": known["sha256"],
+                    }
+            return self._download_content(
+                id, directory, known, verify, chunk_size, claim, record
+            )
+
+        results: Dict[str, Dict[str, Any]] = {}
+        workers = max_workers or spgci.config.parallelism
+        level = explicit_priority()
+        with priority(Priority.BULK if level is None else level):
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(copy_context().run, fetch, id): id for id in unique
+                }
+                try:
+                    for future in as_completed(futures):
+                        id = futures[future]
+                        try:
+                            results[id] = future.result()
+                        except Exception as exc:
+                            if errors == "raise":
+                                raise
+                            warnings.warn(f"Download of content {id} failed: {exc}")
+                            results[id] = {"id": id, "status": "failed"}
+                finally:
+                    for queued in futures:
+                        queued.cancel()
+
+        return DataFrame(
+            [results[id] for id in unique],
+            columns=["id", "path", "status", "size", "sha256"],
+        )
+
+    def _download_content(
+        self,
+        id: str,
+        directory: str,
+        known: Optional[Dict[str, Any]],
+        verify: str,
+        chunk_size: int,
+        claim: Callable[[str, str], str],
+        record: Callable[[str, str, int, str], None],
+    ) -> Dict[str, Any]:
+        """Stream one document to ``<id>.part``, resuming it if present."""
+        url = f"{spgci.config.base_url}/{self._path}/v2/content/{id}"
+        part = os.path.join(directory, f"{id}.part")
+        offset = os.path.getsize(part) if os.path.exists(part) else 0
+
+        # ranges and sizes are of the stored bytes, so ask for them uncompressed
+        headers = {"Accept-Encoding": "identity"}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+        response = _get_stream(url, {}, _session, headers)
+        encoded = _content_encoded(response)
+        # a part that is no longer a prefix of the document, or a range of
+        # compressed bytes sent despite ``identity``: start again
+        if response.status_code == 416 or (response.status_code == 206 and encoded):
+            response.close()
+            os.remove(part)
+            offset = 0
+            response = _get_stream(url, {}, _session, {"Accept-Encoding": "identity"})
+            encoded = _content_encoded(response)
+
+        with response:
+            filename = (
+                known["file"]
+                if known is not None
+                else claim(id, self._content_filename(id, response.headers))
+            )
+            path = os.path.join(directory, filename)
+            expected = response.headers.get("content-length")
+            resumed = response.status_code == 206
+
+            # an untracked file of the announced size, e.g. from ``get_content``
+            if (
+                known is None
+                and not resumed
+                and not encoded
+                and verify == "size"
+                and expected is not None
+                and os.path.exists(path)
+                and os.path.getsize(path) == int(expected)
+            ):
+                sha256 = _sha256(path)
+                record(id, filename, int(expected), sha256)
+                return {
+                    "id": id,
+                    "path": path,
+                    "status": "skipped",
+                    "size": int(expected),
+                    "sha256": sha256,
+                }
+
+            digest = hashlib.sha256()
+            if resumed:
+                with open(part, "rb") as fh:
+                    for chunk in iter(partial(fh.read, chunk_size), b""):
+                        digest.update(chunk)
+            else:
+                offset = 0
+
+            written = 0
+            with open(part, "ab" if resumed else "wb") as fh:
+                for chunk in response.iter_content(chunk_size):
+                    fh.write(chunk)
+                    digest.update(chunk)
+                    written += len(chunk)
+            # the announced length is of the bytes on the wire
+            received = response.raw.tell() if encoded else written
+            observe(response, written)
+
+        if expected is not None and received != int(expected):
+            raise IOError(
+                f"Content {id} ended after {received} of {expected} bytes, "
+                "download again to resume"
+            )
+
+        os.replace(part, path)
+        size = offset + written
+        record(id, filename, size, digest.hexdigest())
+        return {
+            "id": id,
+            "path": path,
+            "status": "resumed" if resumed else "downloaded",
+            "size": size,
+            "sha256": digest.hexdigest(),
+        }
+
     def get_packages(
         self,
         *,
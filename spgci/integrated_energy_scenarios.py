@@ -20,6 +20,8 @@ from packaging.version import parse
 from requests import Response
 from .utilities import list_to_filter
 from .api_client import get_data
+from .facets import unique_values
+from .jsonstream import read_frame
 import pandas as pd
 
 
@@ -129,8 +131,7 @@ class IntegratedEnergyScenarios:
             params.update({"filter": filter_exp})
 
         def to_df(resp: Response):
-            j = resp.json()
-            df = pd.json_normalize(j["aggResultValue"])
+            df = read_frame(resp, "aggResultValue", pd.json_normalize)
             columns_dt = ["modifiedDate"]
             for c in columns_dt:
                 if c in df.columns:
@@ -139,7 +140,12 @@ class IntegratedEnergyScenarios:
                     )
             return df
 
-        return get_data(path, params, to_df, paginate=True)
+        return unique_values(
+            path,
+            columns,
+            filter_exp,
+            lambda: get_data(path, params, to_df, paginate=True),
+        )
 
     def get_coal_market(
         self,
@@ -0,0 +1,219 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Parse large JSON responses as they download.
+
+``resp.json()`` keeps the whole body and then a complete tree of Python objects in
+memory before a DataFrame is built. For bodies of ``config.stream_json_bytes`` or
+more, :func:`read_frame` instead decodes the records of one array as the bytes
+arrive and turns every ``config.stream_json_rows`` of them into a DataFrame, so only
+one chunk of records is held as Python objects at a time.
+
+The other members of the body, such as ``metadata``, stay readable through
+``resp.json()`` afterwards for the pagination functions.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import spgci.config as config
+from pandas import DataFrame, concat
+from requests import Response
+from spgci.compression import observe
+
+_WHITESPACE = " \t\n\r"
+_SPACE = re.compile(r"[ \t\n\r]*")
+#: bytes read from the socket at a time
+_CHUNK_SIZE = 1 << 16
+
+
+class _Reader:
+    """Walks one JSON document, decoding values from a stream of byte chunks."""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+        self._text = codecs.getincrementaldecoder("utf-8-sig")()
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+
+    def _more(self) -> bool:
+        chunk = next(self._chunks, None)
+        text = self._text.decode(chunk or b"", final=chunk is None)
+        # drop what was parsed already, only the current value is kept around
+        self._buf = self._buf[self._pos :] + text
+        self._pos = 0
+        return chunk is not None
+
+    def peek(self) -> str:
+        """Next character that is not whitespace, ``""`` at the end."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._more():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON body, found {found!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._more():
+                    raise
+                continue
+            # a number ending with the buffer may continue in the next chunk
+            if end == len(self._buf) and self._more():
+                continue
+            self._pos = end
+            return value
+
+    def items(self) -> Iterator[Any]:
+        """Values of the array starting at the current position."""
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        decode = self._decoder.raw_decode
+        while True:
+            buf, pos = self._buf, self._pos
+            # decode every value whose separator has arrived, then read on
+            while True:
+                try:
+                    value, end = decode(buf, _SPACE.match(buf, pos).end())
+                except json.JSONDecodeError:
+                    break
+                sep = _SPACE.match(buf, end).end()
+                if sep == len(buf):
+                    break
+                if buf[sep] not in ",]":
+                    raise ValueError(f"Expected ',' in JSON array, found {buf[sep]!r}")
+                yield value
+                pos = sep + 1
+                if buf[sep] == "]":
+                    self._pos = pos
+                    return
+            self._pos = pos
+            if not self._more():
+                raise ValueError("JSON body ended inside an array")
+
+
+def iter_records(
+    chunks: Iterator[bytes], key: str, envelope: Dict[str, Any]
+) -> Iterator[Any]:
+    """
+    Items of the ``key`` array of a JSON object read from ``chunks``.
+
+    The object's other members are decoded into ``envelope``. A body that is an
+    array itself yields its items. Raises ``KeyError`` when the object has no
+    ``key``, like ``resp.json()[key]``.
+    """
+    reader = _Reader(chunks)
+    if reader.peek() == "[":
+        yield from reader.items()
+        return
+
+    found = False
+    reader.expect("{")
+    while reader.peek() != "}":
+        if envelope or found:
+            reader.expect(",")
+        name = reader.value()
+        reader.expect(":")
+        if name == key and reader.peek() == "[":
+            found = True
+            yield from reader.items()
+        else:
+            envelope[name] = reader.value()
+    if not found:
+        raise KeyError(key)
+
+
+def _large(resp: Response) -> bool:
+    threshold = config.stream_json_bytes
+    if threshold <= 0:
+        return False
+    length = resp.headers.get("content-length")
+    if length is None:
+        # sent in chunks, the size is only known once it has all arrived
+        return "chunked" in resp.headers.get("transfer-encoding", "").lower()
+    return int(length) >= threshold
+
+
+def read_frame(
+    resp: Response,
+    key: str = "results",
+    to_frame: Callable[[List[Any]], DataFrame] = DataFrame,
+    chunk_rows: Optional[int] = None,
+) -> DataFrame:
+    """
+    ``to_frame(resp.json()[key])``, parsed incrementally for large bodies.
+
+    Parameters
+    ----------
+    resp : Response
+        Response of a GET, ideally sent with ``stream=True`` so the body is read
+        while it is parsed.
+    key : str, optional
+        Member of the body holding the records, by default ``"results"``.
+    to_frame : callable, optional
+        Builds a DataFrame from a list of records, e.g. ``pd.json_normalize``. It is
+        called once per chunk of records, so it must not depend on the other chunks.
+    chunk_rows : int, optional
+        Records per chunk, by default ``config.stream_json_rows``.
+    """
+    if not _large(resp):
+        j = resp.json()
+        observe(resp)
+        return to_frame(j[key])
+
+    rows = chunk_rows or config.stream_json_rows
+    envelope: Dict[str, Any] = {}
+    frames: List[DataFrame] = []
+    chunk: List[Any] = []
+    decoded = 0
+
+    def chunks() -> Iterator[bytes]:
+        nonlocal decoded
+        for piece in resp.iter_content(_CHUNK_SIZE):
+            decoded += len(piece)
+            yield piece
+
+    for record in iter_records(chunks(), key, envelope):
+        chunk.append(record)
+        if len(chunk) >= rows:
+            frames.append(to_frame(chunk))
+            chunk = []
+    if chunk or not frames:
+        frames.append(to_frame(chunk))
+
+    observe(resp, decoded)
+    # the records are gone, keep the rest of the body for ``resp.json()``
+    resp._content = json.dumps(envelope).encode()
+    resp.encoding = "utf-8"
+    if len(frames) == 1:
+        return frames[0]
+    return concat(frames, ignore_index=True)
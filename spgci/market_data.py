@@ -15,11 +15,13 @@
 from __future__ import annotations
 from spgci.utilities import list_to_filter
 from spgci.api_client import get_data, Paginator, _nop_paginate
+from spgci.jsonstream import read_frame
 from typing import List, Optional, Union
 import pandas as pd
 from pandas import Series
 from requests import Response
 from datetime import date
+from functools import partial
 from enum import Enum
 
 
@@ -81,8 +83,9 @@ class MarketData:
 
     @staticmethod
     def _convert_to_df(resp: Response) -> pd.DataFrame:
-        j = resp.json()
-        df = pd.json_normalize(j["results"], record_path=["data"], meta="symbol")  # type: ignore
+        # symbols are flattened a chunk at a time as the body downloads
+        to_frame = partial(pd.json_normalize, record_path=["data"], meta="symbol")
+        df = read_frame(resp, "results", to_frame)  # type: ignore
 
         if len(df) > 0:
             df.columns = df.columns.str.replace("change.", "", regex=True)  # type: ignore
@@ -0,0 +1,292 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Reuse the results of calculator POST requests whose body has been sent before.
+
+Bodies are canonicalised (dataclasses expanded, keys sorted) and hashed, so two calls
+with the same inputs share one entry however their arguments were built. Only endpoints
+that opt in through ``post_data(..., memo=True)`` are memoised, e.g. the
+``ScenarioManager`` calculators when called with ``memo=True``.
+
+Entries live for ``config.post_memo_ttl`` seconds, in memory or in the SQLite file
+named by ``config.post_memo_path``.
+
+>>> import spgci as ci
+>>> ci.config.post_memo_path = "/shared/spgci-memo.db"
+>>> ci.ScenarioManager().calculate_eu_compliance_penalty(..., memo=True)
+>>> ci.memo.stats()
+{'hits': 0, 'misses': 1, 'expired': 0, 'stored': 1}
+"""
+
+import dataclasses
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+import requests
+import spgci.config as config
+from requests.structures import CaseInsensitiveDict
+from spgci.auth import credential_key
+
+
+class MemoEntry(NamedTuple):
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    expires_at: float
+
+
+def canonical(value: Any) -> Any:
+    """Convert a request body to plain JSON types in a stable form."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return canonical(dataclasses.asdict(value))
+    if isinstance(value, dict):
+        return {str(k): canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [canonical(v) for v in value]
+    if isinstance(value, Enum):
+        return canonical(value.value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if hasattr(value, "item") and callable(value.item):
+        # numpy scalars
+        return value.item()
+    return value
+
+
+def body_key(url: str, body: Any) -> str:
+    """Hash identifying a POST of ``body`` to ``url`` for the active credentials."""
+    payload = json.dumps(
+        [credential_key(), url, canonical(body)],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class MemoStore:
+    """Storage for memoised responses. Implement both methods to plug in another store."""
+
+    def get(self, key: str) -> Optional[MemoEntry]:
+        raise NotImplementedError
+
+    def set(self, key: str, entry: MemoEntry) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class MemoryMemoStore(MemoStore):
+    """Responses kept in this process, the least recently used dropped past ``maxsize``."""
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, MemoEntry]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[MemoEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: MemoEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteMemoStore(MemoStore):
+    """Responses kept in a SQLite file, shared by every process on the host."""
+
+    def __init__(self, path: str, timeout: float = 30) -> None:
+        self.path = path
+        self._timeout = timeout
+        self._local = threading.local()
+        self._connection().execute(
+            "CREATE TABLE IF NOT EXISTS memo (key TEXT PRIMARY KEY,"
+            " status INTEGER NOT NULL, headers TEXT NOT NULL, content BLOB NOT NULL,"
+            " expires REAL NOT NULL)"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path, timeout=self._timeout, isolation_level=None
+            )
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[MemoEntry]:
+        row = (
+            self._connection()
+            .execute(
+                "SELECT status, headers, content, expires FROM memo WHERE key = ?",
+                (key,),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        return MemoEntry(row[0], json.loads(row[1]), bytes(row[2]), row[3])
+
+    def set(self, key: str, entry: MemoEntry) -> None:
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO memo VALUES (?, ?, ?, ?, ?)",
+            (
+                key,
+                entry.status_code,
+                json.dumps(entry.headers),
+                entry.content,
+                entry.expires_at,
+            ),
+        )
+        # expired rows are otherwise only ever overwritten
+        conn.execute("DELETE FROM memo WHERE expires < ?", (time.time(),))
+
+    def clear(self) -> None:
+        self._connection().execute("DELETE FROM memo")
+
+
+class PostMemo:
+    """
+    Serves repeated POST requests from a :class:`MemoStore`.
+
+    Only successful responses are stored. Hit, miss and expiry counts are kept per
+    process and reported by :meth:`stats`.
+    """
+
+    def __init__(self, store: Optional[MemoStore] = None) -> None:
+        self.store = store if store is not None else MemoryMemoStore()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "stored": 0}
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    @staticmethod
+    def _response(url: str, entry: MemoEntry) -> requests.Response:
+        response = requests.Response()
+        response.status_code = entry.status_code
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response._content = entry.content
+        response.url = url
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+    def fetch(
+        self,
+        url: str,
+        body: Any,
+        send: Callable[[], requests.Response],
+        ttl: Optional[float] = None,
+    ) -> requests.Response:
+        """Return the stored response for ``body``, or ``send`` it and store the result."""
+        ttl = config.post_memo_ttl if ttl is None else ttl
+        if ttl <= 0:
+            return send()
+
+        key = body_key(url, body)
+        entry = self.store.get(key)
+        if entry is not None and entry.expires_at > time.time():
+            self._count("hits")
+            return self._response(url, entry)
+        self._count("expired" if entry is not None else "misses")
+
+        response = send()
+        if 200 <= response.status_code < 300:
+            self.store.set(
+                key,
+                MemoEntry(
+                    response.status_code,
+                    dict(response.headers),
+                    response.content,
+                    time.time() + ttl,
+                ),
+            )
+            self._count("stored")
+        return response
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def clear(self) -> None:
+        """Drop every stored response and reset the counters."""
+        self.store.clear()
+        with self._lock:
+            self._stats = dict.fromkeys(self._stats, 0)
+
+
+_lock = threading.Lock()
+#: memo installed through ``configure``
+_configured: Optional[PostMemo] = None
+#: memo derived from ``config``, rebuilt when ``config.post_memo_path`` changes
+_derived: Optional[Tuple[str, PostMemo]] = None
+
+
+def configure(store: Optional[MemoStore] = None) -> PostMemo:
+    """Install the process-wide memo, by default on ``config.post_memo_path``."""
+    global _configured
+    with _lock:
+        if store is None:
+            store = _store_from_config()
+        _configured = PostMemo(store)
+        return _configured
+
+
+def _store_from_config() -> MemoStore:
+    if config.post_memo_path:
+        return SQLiteMemoStore(config.post_memo_path)
+    return MemoryMemoStore()
+
+
+def get_memo() -> PostMemo:
+    """The active memo."""
+    global _derived
+    if _configured is not None:
+        return _configured
+    with _lock:
+        if _derived is None or _derived[0] != config.post_memo_path:
+            _derived = (config.post_memo_path, PostMemo(_store_from_config()))
+        return _derived[1]
+
+
+def stats() -> Dict[str, int]:
+    """Hit, miss, expiry and store counts of the active memo."""
+    return get_memo().stats()
+
+
+def clear() -> None:
+    """Empty the active memo."""
+    get_memo().clear()
@@ -2,6 +2,8 @@ from __future__ import annotations
 from typing import List, Optional, Union, Literal
 from requests import Response
 from spgci.api_client import get_data
+from spgci.facets import unique_values
+from spgci.jsonstream import read_frame
 from spgci.utilities import list_to_filter
 from pandas import DataFrame, Series
 from datetime import date, datetime
@@ -78,8 +80,7 @@ class Metals:
             params.update({"filter": filter_exp})
 
         def to_df(resp: Response) -> pd.DataFrame:
-            j = resp.json()
-            df = pd.json_normalize(j["aggResultValue"])
+            df = read_frame(resp, "aggResultValue", pd.json_normalize)
             columns_dt = ["reportForDate", "forecastPeriod", "forecastAsofdate"]
             for c in columns_dt:
                 if c in df.columns:
@@ -88,7 +89,12 @@ class Metals:
                     )
             return df
 
-        return get_data(path, params, to_df, paginate=True)
+        return unique_values(
+            path,
+            columns,
+            filter_exp,
+            lambda: get_data(path, params, to_df, paginate=True),
+        )
 
     def get_market_outlook(
         self,
@@ -0,0 +1,310 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Share rate limit budgets between threads, processes and hosts using the same credentials.
+
+Enable by setting ``config.rate_limit_per_second`` and/or ``config.quota_store``, or by
+calling :func:`configure` with a backend.
+
+>>> import spgci as ci
+>>> ci.config.rate_limit_per_second = 10
+>>> ci.config.quota_store = "/shared/spgci-quota.db"
+>>> ci.quota.usage()
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+import requests
+import spgci.config as config
+import spgci.deadline as deadline
+from spgci.exceptions import DailyLimitError, DeadlineExceededError
+
+T = TypeVar("T")
+
+
+class QuotaBackend:
+    """
+    Store holding quota state shared by every participating client.
+
+    Implement :meth:`transact` to plug in another store, e.g. Redis with ``WATCH``/``MULTI``
+    for workers spread over several hosts.
+    """
+
+    def transact(self, key: str, fn: Callable[[Dict[str, Any]], T]) -> T:
+        """
+        Atomically apply ``fn`` to the state stored under ``key``.
+
+        ``fn`` receives the current state (empty when unset), may mutate it in place and
+        its return value is passed back. No other ``transact`` on the same key may
+        interleave.
+        """
+        raise NotImplementedError
+
+
+class MemoryQuotaBackend(QuotaBackend):
+    """Quota state shared between the threads of this process only."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._states: Dict[str, Dict[str, Any]] = {}
+
+    def transact(self, key: str, fn: Callable[[Dict[str, Any]], T]) -> T:
+        with self._lock:
+            return fn(self._states.setdefault(key, {}))
+
+
+class SQLiteQuotaBackend(QuotaBackend):
+    """
+    Quota state in a SQLite file, shared by every process on the host.
+
+    SQLite locking is unreliable on network file systems, use a dedicated backend to
+    coordinate several hosts.
+    """
+
+    def __init__(self, path: str, timeout: float = 30) -> None:
+        self.path = path
+        self._timeout = timeout
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS quota (key TEXT PRIMARY KEY, state TEXT NOT NULL)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path, timeout=self._timeout, isolation_level=None
+            )
+            self._local.conn = conn
+        return conn
+
+    def transact(self, key: str, fn: Callable[[Dict[str, Any]], T]) -> T:
+        conn = self._connection()
+        # BEGIN IMMEDIATE takes the write lock up front so read-modify-write is atomic
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT state FROM quota WHERE key = ?", (key,)
+            ).fetchone()
+            state = json.loads(row[0]) if row else {}
+            result = fn(state)
+            conn.execute(
+                "INSERT OR REPLACE INTO quota (key, state) VALUES (?, ?)",
+                (key, json.dumps(state)),
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return result
+
+
+class QuotaCoordinator:
+    """
+    Hands out request slots against shared per-second and daily budgets.
+
+    Per-second slots are reserved first come, first served: each caller is given the
+    next free send time spaced ``1 / per_second`` apart, so concurrent workers share the
+    budget evenly instead of bursting into 429s. The daily budget is tracked from the
+    ``x-ratelimit-remaining-day`` response header and requests fail fast with
+    ``DailyLimitError`` once it is spent.
+
+    The server may reset or raise the budget at any time, not only at UTC midnight. A
+    higher header value is taken once no lower one has been seen for longer than a
+    request can take, and while the budget is spent one request per
+    ``probe_seconds`` is still sent to learn whether it was reset.
+    """
+
+    #: seconds between requests let through to check whether a spent budget was reset
+    probe_seconds = 60.0
+
+    def __init__(
+        self, backend: Optional[QuotaBackend] = None, per_second: Optional[float] = None
+    ) -> None:
+        self.backend = backend if backend is not None else MemoryQuotaBackend()
+        self._per_second = per_second
+
+    @property
+    def per_second(self) -> float:
+        if self._per_second is not None:
+            return self._per_second
+        return float(config.rate_limit_per_second)
+
+    @staticmethod
+    def key() -> str:
+        """Budgets are shared by everyone using the same username against the same host."""
+        ident = f"{config.username}@{config.base_url}"
+        return hashlib.sha256(ident.encode()).hexdigest()[:16]
+
+    @staticmethod
+    def _roll_day(state: Dict[str, Any]) -> None:
+        today = datetime.now(timezone.utc).date().isoformat()
+        if state.get("day") != today:
+            state.update(day=today, used=0, remaining_day=None)
+
+    def acquire(self) -> float:
+        """Block until this caller may send a request. Returns the seconds waited."""
+        interval = 1 / self.per_second if self.per_second > 0 else 0.0
+        now = time.time()
+        left = deadline.remaining()
+
+        def reserve(state: Dict[str, Any]) -> Optional[float]:
+            self._roll_day(state)
+            remaining = state.get("remaining_day")
+            if remaining is not None and remaining <= 0:
+                if now - state.get("probed_at", 0.0) < self.probe_seconds:
+                    return None
+                # let one request ask the server whether the budget was reset
+                state["probed_at"] = now
+            slot = max(now, state.get("next_slot", 0.0))
+            if left is not None and slot - now > left:
+                # leave the slot to a caller that can still use it
+                return float("inf")
+            state["next_slot"] = slot + interval
+            state["used"] += 1
+            if remaining is not None:
+                state["remaining_day"] = max(remaining - 1, 0)
+                if remaining == 1:
+                    state["probed_at"] = now
+            return slot
+
+        slot = self.backend.transact(self.key(), reserve)
+        if slot is None:
+            raise DailyLimitError("Daily Rate Limit Reached")
+        if slot == float("inf"):
+            raise DeadlineExceededError("Deadline exceeded waiting for the rate limit")
+
+        wait = max(0.0, slot - time.time())
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def observe(self, response: requests.Response) -> None:
+        """Record the daily budget the server reports."""
+        header = response.headers.get("x-ratelimit-remaining-day")
+        if header is None:
+            return
+        try:
+            remaining = int(header)
+        except ValueError:
+            return
+
+        now = time.time()
+        # a response can only arrive out of order within the request timeout
+        reorder = float(getattr(config, "timeout", 60))
+
+        def update(state: Dict[str, Any]) -> None:
+            self._roll_day(state)
+            current = state.get("remaining_day")
+            if current is None or remaining <= current:
+                if remaining <= 0 and (current is None or current > 0):
+                    # just spent, the first probe waits ``probe_seconds``
+                    state["probed_at"] = now
+                state["remaining_day"] = remaining
+                state["lowered_at"] = now
+            elif now - state.get("lowered_at", 0.0) > reorder:
+                # sent after the lowest value was seen: the server reset or raised it
+                state["remaining_day"] = remaining
+                state["lowered_at"] = now
+
+        self.backend.transact(self.key(), update)
+
+    def penalize(self, seconds: float = 1.0) -> None:
+        """Push every caller's next slot back after a per-second 429."""
+
+        def delay(state: Dict[str, Any]) -> None:
+            state["next_slot"] = max(state.get("next_slot", 0.0), time.time() + seconds)
+
+        self.backend.transact(self.key(), delay)
+
+    def usage(self) -> Dict[str, Any]:
+        """Current consumption for the active credentials."""
+
+        def read(state: Dict[str, Any]) -> Dict[str, Any]:
+            self._roll_day(state)
+            return dict(state)
+
+        state = self.backend.transact(self.key(), read)
+        return {
+            "day": state["day"],
+            "used_today": state["used"],
+            "remaining_day": state["remaining_day"],
+            "per_second": self.per_second,
+            "queued_seconds": max(0.0, state.get("next_slot", 0.0) - time.time()),
+        }
+
+
+_lock = threading.Lock()
+#: coordinator installed through ``configure``
+_configured: Optional[QuotaCoordinator] = None
+#: coordinator derived from ``config``, rebuilt when ``config.quota_store`` changes
+_derived: Optional[QuotaCoordinator] = None
+_derived_store = ""
+
+
+def _backend_from_config() -> QuotaBackend:
+    if config.quota_store:
+        return SQLiteQuotaBackend(config.quota_store)
+    return MemoryQuotaBackend()
+
+
+def configure(
+    backend: Optional[QuotaBackend] = None, per_second: Optional[float] = None
+) -> QuotaCoordinator:
+    """
+    Install the process-wide coordinator used by the API client.
+
+    Parameters
+    ----------
+    backend : QuotaBackend, optional
+        shared store, by default a ``SQLiteQuotaBackend`` on ``config.quota_store`` or an
+        in-process store when that is empty
+    per_second : float, optional
+        requests per second for all participants combined, by default
+        ``config.rate_limit_per_second``
+    """
+    global _configured
+    with _lock:
+        _configured = QuotaCoordinator(
+            backend if backend is not None else _backend_from_config(), per_second
+        )
+        return _configured
+
+
+def get_coordinator() -> Optional[QuotaCoordinator]:
+    """The active coordinator, or ``None`` when quota coordination is disabled."""
+    global _derived, _derived_store
+    if _configured is not None:
+        return _configured
+    if not config.quota_store and not config.rate_limit_per_second:
+        return None
+    with _lock:
+        if _derived is None or _derived_store != config.quota_store:
+            _derived = QuotaCoordinator(_backend_from_config())
+            _derived_store = config.quota_store
+        return _derived
+
+
+def usage() -> Dict[str, Any]:
+    """Current shared consumption, empty when quota coordination is disabled."""
+    coordinator = get_coordinator()
+    return coordinator.usage() if coordinator is not None else {}
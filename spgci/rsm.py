@@ -1,20 +1,75 @@
 from __future__ import annotations
 
-import math
+import copy
+import hashlib
+import itertools
+import pickle
+import random
 import re
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import wait as futures_wait
+from contextvars import copy_context
 from datetime import date, datetime
-from typing import Any, Dict, List, Optional, Union
-
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+import numpy as np
 import pandas as pd
 from pandas import DataFrame, Series
 from requests import Response
+from typing_extensions import Literal
 
-from spgci.api_client import get_data, post_data
+import spgci.config
+from spgci.api_client import Paginator, get_data, post_data
 from spgci.utilities import list_to_filter
 
 
 _VALID_NAME = re.compile(r"^[A-Za-z0-9 ]+$")
 
+#: payload sections of recently built cases, keyed on a hash of their rows
+_SECTIONS_CACHE: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_SECTIONS_CACHE_SIZE = 1024
+_SECTIONS_LOCK = threading.Lock()
+
+#: categories read when building a case payload
+_PAYLOAD_CATEGORIES = [
+    "capacityAndUtilization",
+    "percentage",
+    "crudePricing",
+    "transportationCosts",
+    "productPrice",
+    "premiumsDiscounts",
+]
+
+
+class _PayloadRows(NamedTuple):
+    """Payload rows of a case with their values converted in bulk."""
+
+    category: np.ndarray
+    asset: np.ndarray
+    raw: np.ndarray
+    value: List[float]
+
+
+_COMPLETED_STATES = {"completed", "complete", "succeeded", "success", "done"}
+_FAILED_STATES = {"failed", "failure", "error", "cancelled", "canceled"}
+
 
 class RsmCase:
     """
@@ -31,6 +86,11 @@ class RsmCase:
     product sections. The SDK performs that conversion when the scenario
     payload is built.
 
+    Edits are recorded against a `(category, asset)` index, so each setter is
+    a constant-time dictionary update. They are folded into the flat
+    DataFrame only when `df` is read, for example when `Rsm.run_scenario`
+    builds the payload.
+
     Notes
     -----
     - Adding a crude means setting its percentage above zero.
@@ -41,6 +101,7 @@ class RsmCase:
     - Setters are upserts. Existing rows are updated in place and missing rows
       are appended.
     - Setters return `self`, allowing calls to be chained.
+    - Use `set_many` to apply a whole mapping or DataFrame of overrides.
 
     Examples
     --------
@@ -75,10 +136,85 @@ class RsmCase:
                 f"numbers, and spaces. Offending character(s): {bad}"
             )
 
-        self.df = df.copy()
+        self.df = df
         self.name = name
         self.enabled = enabled
 
+    @property
+    def df(self) -> DataFrame:
+        """
+        The flat DataFrame with all edits applied.
+
+        Reading this property folds pending edits into the frame and returns
+        a copy, so edits to the returned frame do not reach the case. Apply
+        them through the setters or by assigning a new DataFrame.
+        """
+        return self._frame().copy()
+
+    @df.setter
+    def df(self, df: DataFrame) -> None:
+        self._df = df.copy()
+        self._overrides: Dict[Tuple[str, str], Any] = {}
+        self._positions: Dict[Tuple[str, str], List[int]] = {}
+        if {"category", "asset"}.issubset(self._df.columns):
+            for position, key in enumerate(
+                zip(self._df["category"], self._df["asset"])
+            ):
+                self._positions.setdefault(key, []).append(position)
+
+    def _frame(self) -> DataFrame:
+        """
+        The case's own frame with pending edits folded in. It backs the
+        `(category, asset)` row index and must not be modified.
+        """
+        if self._overrides:
+            self._flush()
+        return self._df
+
+    def _flush(self) -> None:
+        """
+        Apply pending edits: update existing rows, then append missing ones
+        with a single concat.
+        """
+        values = None
+        if "defaultValue" in self._df.columns:
+            values = self._df["defaultValue"].to_numpy(
+                dtype=object,
+                copy=True,
+            )
+
+        appended: List[Dict[str, Any]] = []
+
+        for key, value in self._overrides.items():
+            positions = self._positions.get(key)
+            if positions and values is not None:
+                values[positions] = value
+            else:
+                appended.append(
+                    {
+                        "category": key[0],
+                        "asset": key[1],
+                        "defaultValue": value,
+                    }
+                )
+
+        if values is not None:
+            self._df["defaultValue"] = Series(
+                values, index=self._df.index
+            ).infer_objects()
+
+        if appended:
+            start = len(self._df)
+            self._df = pd.concat(
+                [self._df, DataFrame(appended)],
+                ignore_index=True,
+            )
+            for offset, row in enumerate(appended):
+                key = (row["category"], row["asset"])
+                self._positions[key] = [start + offset]
+
+        self._overrides = {}
+
     def copy(self, name: Optional[str] = None) -> "RsmCase":
         """
         Clone this case.
@@ -87,7 +223,7 @@ class RsmCase:
         previously configured case.
         """
         return RsmCase(
-            self.df,
+            self._frame(),
             name=name if name is not None else self.name,
             enabled=self.enabled,
         )
@@ -106,29 +242,44 @@ class RsmCase:
         RsmCase
             This case, allowing calls to be chained.
         """
-        mask = (
-            (self.df["category"] == category)
-            & (self.df["asset"] == asset)
-        )
+        self._overrides[(category, asset)] = value
+        return self
 
-        if mask.any():
-            self.df.loc[mask, "defaultValue"] = value
-        else:
-            self.df = pd.concat(
-                [
-                    self.df,
-                    DataFrame(
-                        [
-                            {
-                                "category": category,
-                                "asset": asset,
-                                "defaultValue": value,
-                            }
-                        ]
-                    ),
-                ],
-                ignore_index=True,
+    def set_many(
+        self,
+        overrides: Union[Mapping[Tuple[str, str], float], DataFrame],
+    ) -> "RsmCase":
+        """
+        Upsert many values at once.
+
+        Parameters
+        ----------
+        overrides : Mapping[tuple[str, str], float] | DataFrame
+            Either a `{(category, asset): value}` mapping, or a DataFrame
+            with `category`, `asset` and `defaultValue` columns, such as a
+            filtered and edited slice of the default data.
+
+        Returns
+        -------
+        RsmCase
+            This case, allowing calls to be chained.
+
+        Examples
+        --------
+        >>> case.set_many({
+        ...     ("productPrice", "Diesel"): 140,
+        ...     ("productPrice", "Jet"): 135,
+        ... })
+        """
+        if isinstance(overrides, DataFrame):
+            self._overrides.update(
+                zip(
+                    zip(overrides["category"], overrides["asset"]),
+                    overrides["defaultValue"],
+                )
             )
+        else:
+            self._overrides.update(overrides)
 
         return self
 
@@ -142,15 +293,23 @@ class RsmCase:
 
         Returns `None` when the row does not exist.
         """
-        mask = (
-            (self.df["category"] == category)
-            & (self.df["asset"] == asset)
-        )
+        key = (category, asset)
 
-        if not mask.any():
+        if key in self._overrides:
+            return float(self._overrides[key])
+
+        positions = self._positions.get(key)
+        if not positions:
             return None
 
-        return float(self.df.loc[mask, "defaultValue"].iloc[0])
+        return float(self._df["defaultValue"].iloc[positions[0]])
+
+    def _assets(self, category: str) -> List[str]:
+        """
+        Assets that currently have a row in `category`.
+        """
+        keys = set(self._positions) | set(self._overrides)
+        return [asset for cat, asset in keys if cat == category]
 
     # ------------------------------------------------------------------
     # Crudes
@@ -205,15 +364,13 @@ class RsmCase:
         Existing crude prices and transportation costs remain unchanged.
         """
         if zero_others:
-            self.df.loc[
-                self.df["category"] == "percentage",
-                "defaultValue",
-            ] = 0
-
-        for crude_name, pct in slate.items():
-            self.set("percentage", crude_name, pct)
+            self.set_many(
+                {("percentage", asset): 0 for asset in self._assets("percentage")}
+            )
 
-        return self
+        return self.set_many(
+            {("percentage", crude_name): pct for crude_name, pct in slate.items()}
+        )
 
     # ------------------------------------------------------------------
     # Products
@@ -258,6 +415,7 @@ class RsmCase:
 
 class Rsm:
     _scenario_manager_scenarios_v_endpoint = "scenarios"
+    _execution_endpoint = "execution"
 
     def get_scenario_manager_output(
         self,
@@ -306,12 +464,7 @@ class Rsm:
         if filter_exp is None:
             filter_exp = " AND ".join(filter_params)
         elif filter_params:
-            filter_exp = (
-                " AND ".join(filter_params)
-                + " AND ("
-                + filter_exp
-                + ")"
-            )
+            filter_exp = " AND ".join(filter_params) + " AND (" + filter_exp + ")"
 
         params = {
             "page": page,
@@ -332,9 +485,7 @@ class Rsm:
         refineryid: int,
         period: date,
         *,
-        category: Optional[
-            Union[list[str], Series[str], str]
-        ] = None,
+        category: Optional[Union[list[str], Series[str], str]] = None,
         filter_exp: Optional[str] = None,
         page: int = 1,
         page_size: int = 1000,
@@ -381,12 +532,7 @@ class Rsm:
         if filter_exp is None:
             filter_exp = " AND ".join(filter_params)
         elif filter_params:
-            filter_exp = (
-                " AND ".join(filter_params)
-                + " AND ("
-                + filter_exp
-                + ")"
-            )
+            filter_exp = " AND ".join(filter_params) + " AND (" + filter_exp + ")"
 
         params = {
             "page": page,
@@ -405,9 +551,7 @@ class Rsm:
     def get_scenario_manager_ref_data(
         self,
         *,
-        region: Optional[
-            Union[list[str], Series[str], str]
-        ] = None,
+        region: Optional[Union[list[str], Series[str], str]] = None,
         filter_exp: Optional[str] = None,
         page: int = 1,
         page_size: int = 1000,
@@ -446,12 +590,7 @@ class Rsm:
         if filter_exp is None:
             filter_exp = " AND ".join(filter_params)
         elif filter_params:
-            filter_exp = (
-                " AND ".join(filter_params)
-                + " AND ("
-                + filter_exp
-                + ")"
-            )
+            filter_exp = " AND ".join(filter_params) + " AND (" + filter_exp + ")"
 
         params = {
             "page": page,
@@ -507,10 +646,7 @@ class Rsm:
         >>> full = rsm.get_scenario(scenario_id, raw=True).json()
         """
         return get_data(
-            path=(
-                f"/{self._scenario_manager_scenarios_v_endpoint}/"
-                f"{scenario_id}"
-            ),
+            path=(f"/{self._scenario_manager_scenarios_v_endpoint}/" f"{scenario_id}"),
             params={},
             df_fn=self._convert_scenario_response_to_df,
             raw=raw,
@@ -528,9 +664,7 @@ class Rsm:
             DataFrame,
             List[Union[RsmCase, DataFrame]],
         ],
-        scenario_definition_id: str = (
-            "2bf7e599-a25a-4b56-98b0-f384c787f3ba"
-        ),
+        scenario_definition_id: str = ("2bf7e599-a25a-4b56-98b0-f384c787f3ba"),
         version: str = "1",
         name: str = "",
         tags: str = "UI Saved",
@@ -671,9 +805,9 @@ class Rsm:
                 "refinery": refinery,
                 "refineryId": refineryid,
                 "displayScenario": display_scenario,
-                "baseCaseCrudes": self._build_base_case_crudes(
-                    normalized[0].df
-                ),
+                "baseCaseCrudes": self._build_sections(normalized[0]._frame())[
+                    "baseCaseCrudes"
+                ],
                 "scenario": {
                     "cases": [
                         self._build_scenario_case(case, case_index)
@@ -700,9 +834,7 @@ class Rsm:
         scenario_id: str,
         *,
         scenario_version: str = "1",
-        scenario_definition_id: str = (
-            "2bf7e599-a25a-4b56-98b0-f384c787f3ba"
-        ),
+        scenario_definition_id: str = ("2bf7e599-a25a-4b56-98b0-f384c787f3ba"),
         scenario_definition_version: str = "1",
         product: Optional[str] = None,
         correlation: Optional[str] = None,
@@ -717,9 +849,10 @@ class Rsm:
         The response includes the `executionId` used to identify the run. The
         execution may initially be in a waiting or running state.
 
-        This class does not currently expose a status-polling method. Once the
-        execution has completed, pass both the `scenarioId` and `executionId`
-        to `get_scenario_manager_output`.
+        Check progress with `get_execution_status`, or block until the output
+        is ready with `wait_for_execution`. `RsmExecutionTracker` follows many
+        executions in one polling loop. To save, execute and collect many
+        variants at once see `run_sweep`.
 
         Parameters
         ----------
@@ -771,6 +904,278 @@ class Rsm:
             raw=raw,
         )
 
+    def get_execution_status(
+        self,
+        execution_id: str,
+        *,
+        raw: bool = False,
+    ) -> Union[DataFrame, Response]:
+        """
+        Retrieve the status of a scenario execution.
+
+        Parameters
+        ----------
+        execution_id : str
+            Identifier returned by `execute_scenario`.
+        raw : bool, optional
+            Return the raw `requests.Response`, by default false.
+
+        Returns
+        -------
+        DataFrame | Response
+            Execution status as a one-row DataFrame, or the raw response when
+            `raw=True`.
+        """
+        return get_data(
+            path=f"/{self._execution_endpoint}/{execution_id}",
+            params={},
+            df_fn=self._convert_run_status_to_df,
+            paginate_fn=self._no_pagination,
+            raw=raw,
+        )
+
+    @staticmethod
+    def sweep_grid(
+        base: RsmCase,
+        axes: Mapping[str, Iterable[Any]],
+        apply: Callable[[RsmCase, Dict[str, Any]], RsmCase],
+    ) -> List[Tuple[Dict[str, Any], RsmCase]]:
+        """
+        Build one case per combination of the parameter `axes`.
+
+        Each combination is applied by `apply` to a copy of `base`.
+
+        Examples
+        --------
+        >>> grid = Rsm.sweep_grid(
+        ...     base,
+        ...     {"wti": [10, 20, 30], "diesel": [120, 140]},
+        ...     lambda case, p: case.set_crude_slate(
+        ...         {"Wti": p["wti"], "Brent": 100 - p["wti"]}
+        ...     ).set_product("Diesel", p["diesel"]),
+        ... )
+        """
+        names = list(axes)
+        grid: List[Tuple[Dict[str, Any], RsmCase]] = []
+
+        for index, values in enumerate(
+            itertools.product(*(axes[name] for name in names)),
+            start=1,
+        ):
+            params = dict(zip(names, values))
+            case = base.copy(name=f"Sweep {index}")
+            grid.append((params, apply(case, params)))
+
+        return grid
+
+    def iter_sweep(
+        self,
+        variants: Iterable[Tuple[Dict[str, Any], RsmCase]],
+        *,
+        period: Union[date, datetime, str],
+        region: str,
+        refinery: str,
+        refineryid: int,
+        base_case: Optional[RsmCase] = None,
+        max_workers: Optional[int] = None,
+        poll_interval: float = 2.0,
+        max_poll_interval: float = 30.0,
+        timeout: float = 1800.0,
+        errors: Literal["raise", "skip"] = "raise",
+    ) -> Iterator[Tuple[Dict[str, Any], DataFrame]]:
+        """
+        Save, execute and collect many scenario variants concurrently.
+
+        Each variant is saved with `run_scenario` and executed with
+        `execute_scenario`. A shared `RsmExecutionTracker` polls every
+        execution and fetches the output once it completes. Results are
+        yielded as soon as each variant finishes, tagged with its parameters.
+
+        Parameters
+        ----------
+        variants : Iterable[tuple[dict, RsmCase]]
+            `(params, case)` pairs, for example from `sweep_grid`.
+        period, region, refinery, refineryid
+            Passed to `run_scenario` for every variant.
+        base_case : RsmCase, optional
+            Case saved ahead of every variant, which also supplies
+            `baseCaseCrudes`. By default each variant is its own base case.
+        max_workers : int, optional
+            Variants in flight at once, by default `config.parallelism`.
+        poll_interval, max_poll_interval, timeout
+            Passed to `RsmExecutionTracker`.
+        errors : {"raise", "skip"}, optional
+            Raise the first failure, or warn and continue with the remaining
+            variants. By default `"raise"`.
+
+        Yields
+        ------
+        tuple[dict, DataFrame]
+            The variant's parameters and its scenario output, with one column
+            per parameter prepended. A parameter named like an output column is
+            prepended as `param.<name>`, leaving the output column as it is.
+        """
+        workers = max_workers or spgci.config.parallelism
+        tracker = RsmExecutionTracker(
+            self,
+            poll_interval=poll_interval,
+            max_poll_interval=max_poll_interval,
+            timeout=timeout,
+            max_workers=workers,
+        )
+
+        def run(params: Dict[str, Any], case: RsmCase) -> DataFrame:
+            saved = self.run_scenario(
+                period=period,
+                region=region,
+                refinery=refinery,
+                refineryid=refineryid,
+                cases=[base_case, case] if base_case is not None else [case],
+            )
+            scenario_id = str(cast(DataFrame, saved)["scenarioId"].iloc[0])
+            status = self.execute_scenario(scenario_id)
+            execution_id = str(cast(DataFrame, status)["executionId"].iloc[0])
+
+            output = tracker.track(scenario_id, execution_id).result()
+            return self._tag(output, params)
+
+        with tracker, ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(copy_context().run, run, params, case): params
+                for params, case in variants
+            }
+
+            try:
+                for future in as_completed(futures):
+                    params = futures[future]
+                    try:
+                        yield params, future.result()
+                    except Exception as exc:
+                        if errors == "raise":
+                            raise
+                        warnings.warn(f"Sweep variant {params} failed: {exc}")
+            finally:
+                # stop queued variants when failing or when the caller stops early
+                for pending in futures:
+                    pending.cancel()
+
+    def run_sweep(
+        self,
+        variants: Iterable[Tuple[Dict[str, Any], RsmCase]],
+        **kwargs: Any,
+    ) -> DataFrame:
+        """
+        Run `iter_sweep` to completion and merge every output into one frame.
+
+        Accepts the same arguments as `iter_sweep`.
+
+        Examples
+        --------
+        >>> grid = Rsm.sweep_grid(base, {"wti": [10, 20, 30]}, apply_wti)
+        >>> results = rsm.run_sweep(
+        ...     grid,
+        ...     period=date(2026, 1, 1),
+        ...     region="North America",
+        ...     refinery="Baytown | ExxonMobil",
+        ...     refineryid=1015,
+        ... )
+        """
+        frames = [output for _, output in self.iter_sweep(variants, **kwargs)]
+
+        if not frames:
+            return DataFrame()
+
+        return pd.concat(frames, ignore_index=True)
+
+    def wait_for_execution(
+        self,
+        scenario_id: str,
+        execution_id: str,
+        *,
+        fetch_output: bool = True,
+        **kwargs: Any,
+    ) -> DataFrame:
+        """
+        Block until an execution finishes.
+
+        Parameters
+        ----------
+        scenario_id : str
+            Identifier returned by `run_scenario`.
+        execution_id : str
+            Identifier returned by `execute_scenario`.
+        fetch_output : bool, optional
+            Return the scenario output rather than the final status, by
+            default true.
+        **kwargs
+            Polling options passed to `RsmExecutionTracker`.
+
+        Returns
+        -------
+        DataFrame
+            Scenario output, or the final execution status when
+            `fetch_output=False`.
+
+        Raises
+        ------
+        RuntimeError
+            The execution failed.
+        TimeoutError
+            The execution did not finish within `timeout` seconds.
+
+        Examples
+        --------
+        >>> status = rsm.execute_scenario(scenario_id)
+        >>> execution_id = status["executionId"].iloc[0]
+        >>> output = rsm.wait_for_execution(scenario_id, execution_id)
+        """
+        with RsmExecutionTracker(
+            self,
+            fetch_output=fetch_output,
+            **kwargs,
+        ) as tracker:
+            return tracker.track(scenario_id, execution_id).result()
+
+    @staticmethod
+    def _execution_state(status: DataFrame) -> str:
+        """
+        Classify an execution status row as `completed`, `failed` or
+        `pending`.
+        """
+        if status.empty:
+            return "pending"
+
+        row = status.iloc[0]
+        value = str(row.get("status", "")).strip().lower()
+
+        if value in _FAILED_STATES:
+            return "failed"
+        if value in _COMPLETED_STATES:
+            return "completed"
+        if not value and pd.notna(row.get("completedOn")):
+            return "completed"
+
+        return "pending"
+
+    @staticmethod
+    def _tag(output: DataFrame, params: Dict[str, Any]) -> DataFrame:
+        """
+        Prepend one column per sweep parameter, as `param.<name>` when the
+        output already has a column of that name.
+        """
+        tagged = output.copy()
+
+        for position, (key, value) in enumerate(params.items()):
+            if key in output.columns:
+                key = f"param.{key}"
+            tagged.insert(position, key, [value] * len(tagged))
+
+        return tagged
+
+    @staticmethod
+    def _no_pagination(resp: Response) -> Paginator:
+        return Paginator(False, "page", 1)
+
     @staticmethod
     def _coerce_case(
         case: Union[RsmCase, DataFrame],
@@ -798,172 +1203,173 @@ class Rsm:
         """
         Convert an `RsmCase` into a Scenario Manager case payload.
         """
+        sections = self._build_sections(case._frame())
+
         return {
             "caseKey": f"Case{case_index}",
             "caseName": case.name,
             "isCaseEnabled": case.enabled,
-            "capacityAndUtilization": self._build_capacity(case.df),
-            "crudes": self._build_crudes(case.df),
-            "products": self._build_products(case.df),
+            "capacityAndUtilization": sections["capacityAndUtilization"],
+            "crudes": sections["crudes"],
+            "products": sections["products"],
         }
 
     @staticmethod
-    def _num(value: Any) -> float:
+    def _build_sections(df: DataFrame) -> Dict[str, Any]:
         """
-        Coerce a value to a finite, JSON-safe float.
+        Build the capacity, crude, product and base-case crude sections of a
+        case payload.
 
-        Missing and non-finite values become `0.0`. This prevents `NaN`,
-        positive infinity, and negative infinity from entering the JSON
-        request body.
+        Sections are cached on a hash of the `category`, `asset` and
+        `defaultValue` columns, so an unchanged case is only converted once.
+        Each call returns its own copy, so editing one payload leaves the
+        cached sections untouched.
         """
-        if value is None or pd.isna(value):
-            return 0.0
+        key = hashlib.sha1(
+            pickle.dumps(
+                [
+                    df[column].tolist()
+                    for column in ("category", "asset", "defaultValue")
+                ],
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        ).digest()
+
+        with _SECTIONS_LOCK:
+            sections = _SECTIONS_CACHE.get(key)
+            if sections is not None:
+                _SECTIONS_CACHE.move_to_end(key)
+                return copy.deepcopy(sections)
+
+        rows = Rsm._payload_rows(df)
+        sections = {
+            "capacityAndUtilization": Rsm._build_capacity(rows),
+            "crudes": Rsm._build_crudes(rows),
+            "products": Rsm._build_products(rows),
+            "baseCaseCrudes": Rsm._build_base_case_crudes(rows),
+        }
 
-        number = float(value)
+        with _SECTIONS_LOCK:
+            _SECTIONS_CACHE[key] = sections
+            while len(_SECTIONS_CACHE) > _SECTIONS_CACHE_SIZE:
+                _SECTIONS_CACHE.popitem(last=False)
 
-        if not math.isfinite(number):
-            return 0.0
+        return copy.deepcopy(sections)
 
-        return number
+    @staticmethod
+    def _payload_rows(df: DataFrame) -> "_PayloadRows":
+        """
+        Select the rows used by the payload and convert their values in bulk.
+
+        Values are converted once for the whole frame. `raw` keeps `NaN` and
+        infinities for the missing and active checks, while in `value` missing
+        and non-finite values become `0.0` so they never enter the JSON
+        request body.
+        """
+        rows = df[df["category"].isin(_PAYLOAD_CATEGORIES)]
+        raw = pd.to_numeric(
+            rows["defaultValue"].astype(object), errors="raise"
+        ).to_numpy(dtype=float, na_value=np.nan)
+
+        return _PayloadRows(
+            rows["category"].to_numpy(dtype=object),
+            rows["asset"].to_numpy(dtype=object),
+            raw,
+            np.where(np.isfinite(raw), raw, 0.0).tolist(),
+        )
 
     @staticmethod
-    def _build_capacity(df: DataFrame) -> Dict[str, float]:
+    def _first_values(
+        rows: "_PayloadRows",
+        category: str,
+    ) -> Dict[Any, int]:
         """
-        Build the capacity and utilization section of the payload.
+        Position of the first non-missing value of each asset in `category`.
         """
-        capacity = df[
-            df["category"] == "capacityAndUtilization"
+        positions = np.flatnonzero((rows.category == category) & ~np.isnan(rows.raw))[
+            ::-1
         ]
 
-        return {
-            str(asset): Rsm._num(value)
-            for asset, value in zip(
-                capacity["asset"],
-                capacity["defaultValue"],
-            )
-        }
+        # later duplicates are overwritten by earlier ones when reversed
+        return dict(zip(rows.asset[positions].tolist(), positions.tolist()))
+
+    @staticmethod
+    def _build_capacity(rows: "_PayloadRows") -> Dict[str, float]:
+        """
+        Build the capacity and utilization section of the payload.
+        """
+        positions = np.flatnonzero(rows.category == "capacityAndUtilization").tolist()
+
+        return {str(rows.asset[p]): rows.value[p] for p in positions}
 
     @staticmethod
-    def _build_crudes(df: DataFrame) -> List[Dict[str, Any]]:
+    def _build_crudes(rows: "_PayloadRows") -> List[Dict[str, Any]]:
         """
-        Build active crude records from the flat default-data DataFrame.
+        Build active crude records from the flat default-data rows.
 
         An asset is treated as a crude when it has a percentage row. Only
         crudes whose percentage is greater than zero are included.
         """
-        wide = (
-            df[
-                df["category"].isin(
-                    [
-                        "percentage",
-                        "crudePricing",
-                        "transportationCosts",
-                    ]
-                )
-            ]
-            .pivot_table(
-                index="asset",
-                columns="category",
-                values="defaultValue",
-                aggfunc="first",
-            )
-            .rename_axis(None, axis=1)
-        )
+        percentages = Rsm._first_values(rows, "percentage")
+        pricing = Rsm._first_values(rows, "crudePricing")
+        transport = Rsm._first_values(rows, "transportationCosts")
 
-        for column in (
-            "percentage",
-            "crudePricing",
-            "transportationCosts",
-        ):
-            if column not in wide.columns:
-                wide[column] = float("nan")
-
-        wide = wide[wide["percentage"].notna()]
-        active = wide[wide["percentage"] > 0]
+        def value(position: Optional[int]) -> float:
+            return 0.0 if position is None else rows.value[position]
 
         return [
             {
                 "crudeType": str(asset),
-                "percentage": Rsm._num(row["percentage"]),
-                "crudePricing": Rsm._num(row["crudePricing"]),
-                "transportationCosts": Rsm._num(
-                    row["transportationCosts"]
-                ),
+                "percentage": rows.value[position],
+                "crudePricing": value(pricing.get(asset)),
+                "transportationCosts": value(transport.get(asset)),
             }
-            for asset, row in active.iterrows()
+            for asset, position in sorted(percentages.items())
+            if rows.raw[position] > 0
         ]
 
     @staticmethod
-    def _build_products(df: DataFrame) -> List[Dict[str, Any]]:
+    def _build_products(rows: "_PayloadRows") -> List[Dict[str, Any]]:
         """
-        Build product records from the flat default-data DataFrame.
+        Build product records from the flat default-data rows.
 
         An asset is treated as a product only when it has a `productPrice`
         row. This prevents the shared `transportationCosts` category from
         creating phantom product records for crude assets.
         """
-        wide = (
-            df[
-                df["category"].isin(
-                    [
-                        "productPrice",
-                        "premiumsDiscounts",
-                        "transportationCosts",
-                    ]
-                )
-            ]
-            .pivot_table(
-                index="asset",
-                columns="category",
-                values="defaultValue",
-                aggfunc="first",
-            )
-            .rename_axis(None, axis=1)
-        )
+        prices = Rsm._first_values(rows, "productPrice")
+        premiums = Rsm._first_values(rows, "premiumsDiscounts")
+        transport = Rsm._first_values(rows, "transportationCosts")
 
-        for column in (
-            "productPrice",
-            "premiumsDiscounts",
-            "transportationCosts",
-        ):
-            if column not in wide.columns:
-                wide[column] = float("nan")
-
-        wide = wide[wide["productPrice"].notna()]
+        def value(position: Optional[int]) -> float:
+            return 0.0 if position is None else rows.value[position]
 
         return [
             {
                 "productType": str(asset),
-                "productPrice": Rsm._num(row["productPrice"]),
-                "premiumsDiscounts": Rsm._num(
-                    row["premiumsDiscounts"]
-                ),
-                "transportationCosts": Rsm._num(
-                    row["transportationCosts"]
-                ),
+                "productPrice": rows.value[position],
+                "premiumsDiscounts": value(premiums.get(asset)),
+                "transportationCosts": value(transport.get(asset)),
             }
-            for asset, row in wide.iterrows()
+            for asset, position in sorted(prices.items())
         ]
 
     @staticmethod
     def _build_base_case_crudes(
-        df: DataFrame,
+        rows: "_PayloadRows",
     ) -> List[Dict[str, Any]]:
         """
         Build `baseCaseCrudes` from active percentage rows.
         """
-        percentages = df[df["category"] == "percentage"]
+        positions = np.flatnonzero(rows.category == "percentage").tolist()
 
         return [
             {
-                "crudeType": str(asset),
-                "percentage": Rsm._num(value),
+                "crudeType": str(rows.asset[p]),
+                "percentage": rows.value[p],
             }
-            for asset, value in zip(
-                percentages["asset"],
-                percentages["defaultValue"],
-            )
-            if Rsm._num(value) > 0
+            for p in positions
+            if rows.value[p] > 0
         ]
 
     @staticmethod
@@ -985,9 +1391,7 @@ class Rsm:
         response_json = resp.json()
 
         metadata = {
-            key: value
-            for key, value in response_json.items()
-            if key != "parameters"
+            key: value for key, value in response_json.items() if key != "parameters"
         }
 
         df = pd.json_normalize(metadata)  # type: ignore
@@ -1049,4 +1453,253 @@ class Rsm:
                     errors="coerce",
                 )
 
-        return df
\ No newline at end of file
+        return df
+
+
+class _TrackedExecution:
+    def __init__(
+        self,
+        scenario_id: str,
+        execution_id: str,
+        future: "Future[DataFrame]",
+        delay: float,
+        deadline: float,
+    ):
+        self.scenario_id = scenario_id
+        self.execution_id = execution_id
+        self.future = future
+        self.delay = delay
+        self.next_poll = time.monotonic() + delay
+        self.deadline = deadline
+        self.errors = 0
+
+
+class RsmExecutionTracker:
+    """
+    Follow many Scenario Manager executions from a single polling loop.
+
+    Each tracked execution is polled through `Rsm.get_execution_status` with
+    its own exponential backoff, randomised by `jitter` so that executions
+    started together do not poll in lockstep. Outputs are fetched only for
+    executions that completed, on a small worker pool so polling carries on
+    meanwhile.
+
+    `track` returns a `concurrent.futures.Future` that resolves to the
+    output DataFrame (or the final status when `fetch_output=False`), or
+    raises `RuntimeError` when the execution failed and `TimeoutError` when
+    it did not finish within `timeout` seconds. A status request that fails
+    is retried at the next poll; the error is raised once
+    `max_status_errors` requests in a row have failed. `wait` blocks on all
+    tracked executions.
+
+    Examples
+    --------
+    >>> with RsmExecutionTracker(rsm) as tracker:
+    ...     for scenario_id, execution_id in runs:
+    ...         tracker.track(scenario_id, execution_id)
+    ...     outputs = tracker.wait()
+    """
+
+    def __init__(
+        self,
+        rsm: Optional[Rsm] = None,
+        *,
+        poll_interval: float = 2.0,
+        max_poll_interval: float = 30.0,
+        jitter: float = 0.2,
+        timeout: float = 1800.0,
+        fetch_output: bool = True,
+        max_workers: Optional[int] = None,
+        max_status_errors: int = 3,
+    ):
+        self._rsm = rsm if rsm is not None else Rsm()
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.jitter = jitter
+        self.timeout = timeout
+        self.fetch_output = fetch_output
+        self.max_status_errors = max_status_errors
+        self._cond = threading.Condition()
+        self._pending: Dict[str, _TrackedExecution] = {}
+        self._futures: Dict[str, "Future[DataFrame]"] = {}
+        self._poller: Optional[threading.Thread] = None
+        self._fetcher = ThreadPoolExecutor(
+            max_workers=max_workers or spgci.config.parallelism
+        )
+
+    def __enter__(self) -> "RsmExecutionTracker":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def track(
+        self,
+        scenario_id: str,
+        execution_id: str,
+    ) -> "Future[DataFrame]":
+        """
+        Start following an execution. Tracking the same execution twice
+        returns the same future.
+        """
+        with self._cond:
+            if execution_id in self._futures:
+                return self._futures[execution_id]
+
+            future: "Future[DataFrame]" = Future()
+            self._futures[execution_id] = future
+            self._pending[execution_id] = _TrackedExecution(
+                scenario_id,
+                execution_id,
+                future,
+                self.poll_interval,
+                time.monotonic() + self.timeout,
+            )
+
+            if self._poller is None:
+                self._poller = threading.Thread(
+                    target=copy_context().run,
+                    args=(self._poll_loop,),
+                    daemon=True,
+                )
+                self._poller.start()
+            else:
+                self._cond.notify_all()
+
+        return future
+
+    def wait(self, timeout: Optional[float] = None) -> Dict[str, DataFrame]:
+        """
+        Block until every tracked execution has finished.
+
+        Returns
+        -------
+        dict[str, DataFrame]
+            Result per `executionId`. The first failure is raised.
+        """
+        with self._cond:
+            futures = dict(self._futures)
+
+        done, not_done = futures_wait(futures.values(), timeout=timeout)
+
+        if not_done:
+            raise TimeoutError(
+                f"{len(not_done)} execution(s) still running after "
+                f"{timeout} seconds."
+            )
+
+        return {
+            execution_id: future.result() for execution_id, future in futures.items()
+        }
+
+    def close(self) -> None:
+        """
+        Wait for outputs already being fetched and release the worker pool.
+        """
+        self._fetcher.shutdown(wait=True)
+
+    def _poll_loop(self) -> None:
+        tracked: Optional[_TrackedExecution] = None
+        try:
+            while True:
+                with self._cond:
+                    if not self._pending:
+                        self._poller = None
+                        return
+
+                    now = time.monotonic()
+                    due = [
+                        tracked
+                        for tracked in self._pending.values()
+                        if tracked.next_poll <= now
+                    ]
+
+                    if not due:
+                        next_poll = min(t.next_poll for t in self._pending.values())
+                        self._cond.wait(next_poll - now)
+                        continue
+
+                for tracked in due:
+                    self._poll(tracked)
+                tracked = None
+        except BaseException as exc:
+            # fail every execution left rather than leave it to a poller that died;
+            # the next track() starts a new one
+            with self._cond:
+                failed = list(self._pending.values())
+                self._pending.clear()
+                self._poller = None
+            if tracked is not None and tracked not in failed:
+                failed.append(tracked)
+            for execution in failed:
+                if not execution.future.done():
+                    execution.future.set_exception(exc)
+
+    def _poll(self, tracked: _TrackedExecution) -> None:
+        try:
+            status = cast(
+                DataFrame,
+                self._rsm.get_execution_status(tracked.execution_id),
+            )
+            state = Rsm._execution_state(status)
+        except Exception as exc:
+            tracked.errors += 1
+            if (
+                tracked.errors >= self.max_status_errors
+                or time.monotonic() >= tracked.deadline
+            ):
+                self._finish(tracked)
+                tracked.future.set_exception(exc)
+            else:
+                self._reschedule(tracked)
+            return
+
+        tracked.errors = 0
+        if state == "completed":
+            self._finish(tracked)
+            if self.fetch_output:
+                self._fetcher.submit(
+                    copy_context().run,
+                    self._fetch_output,
+                    tracked,
+                )
+            else:
+                tracked.future.set_result(status)
+        elif state == "failed":
+            self._finish(tracked)
+            tracked.future.set_exception(
+                RuntimeError(
+                    f"Execution {tracked.execution_id} failed: "
+                    f"{status.to_dict('records')}"
+                )
+            )
+        elif time.monotonic() >= tracked.deadline:
+            self._finish(tracked)
+            tracked.future.set_exception(
+                TimeoutError(
+                    f"Execution {tracked.execution_id} did not finish "
+                    f"within {self.timeout} seconds."
+                )
+            )
+        else:
+            self._reschedule(tracked)
+
+    def _reschedule(self, tracked: _TrackedExecution) -> None:
+        tracked.delay = min(tracked.delay * 2, self.max_poll_interval)
+        spread = random.uniform(-self.jitter, self.jitter)
+        tracked.next_poll = time.monotonic() + tracked.delay * (1 + spread)
+
+    def _finish(self, tracked: _TrackedExecution) -> None:
+        with self._cond:
+            self._pending.pop(tracked.execution_id, None)
+
+    def _fetch_output(self, tracked: _TrackedExecution) -> None:
+        try:
+            output = self._rsm.get_scenario_manager_output(
+                tracked.scenario_id,
+                tracked.execution_id,
+                paginate=True,
+            )
+            tracked.future.set_result(cast(DataFrame, output))
+        except Exception as exc:
+            tracked.future.set_exception(exc)
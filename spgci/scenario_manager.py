@@ -13,13 +13,22 @@
 # limitations under the License.
 
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Union
+import inspect
+import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import copy_context
+from typing import Any, Callable, Dict, List, Optional, Union, cast
+from typing_extensions import Literal
 from requests import Response
+import spgci.config
 from spgci.api_client import get_data, post_data
+from spgci.memo import body_key
+from spgci.scheduler import Priority, explicit_priority, priority
 from spgci.utilities import list_to_filter
 from pandas import DataFrame, Series
 import pandas as pd
-from dataclasses import dataclass, asdict
+from pandas.api.types import is_scalar
+from dataclasses import dataclass, asdict, is_dataclass
 
 
 @dataclass
@@ -85,6 +94,7 @@ class ScenarioManager:
         ghg_intensity_b24: Optional[float] = None,
         ghg_intensity_ucome: Optional[float] = None,
         raw: bool = False,
+        memo: bool = False,
     ) -> Union[DataFrame, Response]:
         """
         Calculate the EU FuelEU Maritime compliance penalty for a voyage.
@@ -122,6 +132,9 @@ class ScenarioManager:
             Custom GHG intensity value for UCOME (gCO2eq/MJ), by default ``None``.
         raw : bool, optional
             Return a ``requests.Response`` instead of a ``DataFrame``, by default ``False``.
+        memo : bool, optional
+            Reuse the result of an identical request memoised by ``spgci.memo``, by
+            default ``False``.
 
         Returns
         -------
@@ -164,31 +177,24 @@ class ScenarioManager:
         ...     ghg_intensity_ucome=16.4,
         ... )
         """
-        body: Dict[str, Any] = {
-            "originPort": origin_port,
-            "destinationPort": destination_port,
-            "fuelBlends": [asdict(blend) for blend in fuel_blends],
-            "includeEUETSCost": include_eu_ets_cost,
-            "reportingPeriod": reporting_period,
-        }
-
-        ghg: Dict[str, float] = {}
-        if ghg_intensity_lng is not None:
-            ghg["lng"] = ghg_intensity_lng
-        if ghg_intensity_b30 is not None:
-            ghg["b30"] = ghg_intensity_b30
-        if ghg_intensity_b24 is not None:
-            ghg["b24"] = ghg_intensity_b24
-        if ghg_intensity_ucome is not None:
-            ghg["ucome"] = ghg_intensity_ucome
-        if ghg:
-            body["ghgIntensityValues"] = ghg
+        body = self._eu_compliance_body(
+            origin_port=origin_port,
+            destination_port=destination_port,
+            fuel_blends=fuel_blends,
+            reporting_period=reporting_period,
+            include_eu_ets_cost=include_eu_ets_cost,
+            ghg_intensity_lng=ghg_intensity_lng,
+            ghg_intensity_b30=ghg_intensity_b30,
+            ghg_intensity_b24=ghg_intensity_b24,
+            ghg_intensity_ucome=ghg_intensity_ucome,
+        )
 
         response = post_data(
             path=self._path_eu_compliance,
             body=body,
             df_fn=self._convert_to_df,
             raw=raw,
+            memo=memo,
         )
 
         return response
@@ -212,6 +218,7 @@ class ScenarioManager:
         page: int = 1,
         page_size: int = 1000,
         raw: bool = False,
+        memo: bool = False,
     ) -> Union[DataFrame, Response]:
         """
         Generate on-demand pricing for refined products.
@@ -259,6 +266,9 @@ class ScenarioManager:
             Number of rows per page, by default ``1000``.
         raw : bool, optional
             Return a ``requests.Response`` instead of a ``DataFrame``, by default ``False``.
+        memo : bool, optional
+            Reuse the result of an identical request memoised by ``spgci.memo``, by
+            default ``False``.
 
         Returns
         -------
@@ -296,6 +306,85 @@ class ScenarioManager:
         ...     pipeline_tariff=True,
         ... )
         """
+        body = self._ondemand_price_body(
+            start_date=start_date,
+            end_date=end_date,
+            commodity=commodity,
+            product_grade=product_grade,
+            origin_state=origin_state,
+            origin_city=origin_city,
+            delivery_state=delivery_state,
+            delivery_city=delivery_city,
+            rvp=rvp,
+            octane=octane,
+            line_space_code=line_space_code,
+            pipeline_tariff=pipeline_tariff,
+        )
+        path = self._ondemand_price_path(filter_exp, page, page_size)
+
+        response = post_data(
+            path=path,
+            body=body,
+            df_fn=self._convert_to_df,
+            raw=raw,
+            memo=memo,
+        )
+
+        return response
+
+    @staticmethod
+    def _eu_compliance_body(
+        origin_port: str,
+        destination_port: str,
+        fuel_blends: List[Any],
+        reporting_period: str,
+        include_eu_ets_cost: bool = True,
+        ghg_intensity_lng: Optional[float] = None,
+        ghg_intensity_b30: Optional[float] = None,
+        ghg_intensity_b24: Optional[float] = None,
+        ghg_intensity_ucome: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        body: Dict[str, Any] = {
+            "originPort": origin_port,
+            "destinationPort": destination_port,
+            # blends may also be given as plain dicts, see the examples
+            "fuelBlends": [
+                asdict(blend) if is_dataclass(blend) else blend  # type: ignore
+                for blend in fuel_blends
+            ],
+            "includeEUETSCost": include_eu_ets_cost,
+            "reportingPeriod": reporting_period,
+        }
+
+        ghg: Dict[str, float] = {}
+        if ghg_intensity_lng is not None:
+            ghg["lng"] = ghg_intensity_lng
+        if ghg_intensity_b30 is not None:
+            ghg["b30"] = ghg_intensity_b30
+        if ghg_intensity_b24 is not None:
+            ghg["b24"] = ghg_intensity_b24
+        if ghg_intensity_ucome is not None:
+            ghg["ucome"] = ghg_intensity_ucome
+        if ghg:
+            body["ghgIntensityValues"] = ghg
+
+        return body
+
+    @staticmethod
+    def _ondemand_price_body(
+        start_date: str,
+        end_date: str,
+        commodity: str,
+        product_grade: str,
+        origin_state: Optional[str] = None,
+        origin_city: Optional[str] = None,
+        delivery_state: Optional[str] = None,
+        delivery_city: Optional[str] = None,
+        rvp: Optional[float] = None,
+        octane: Optional[float] = None,
+        line_space_code: Optional[str] = None,
+        pipeline_tariff: Optional[bool] = None,
+    ) -> Dict[str, Any]:
         body: Dict[str, Any] = {
             "startDate": start_date,
             "endDate": end_date,
@@ -324,21 +413,250 @@ class ScenarioManager:
         if cost_factor_adjustments:
             body["costFactorAdjustments"] = cost_factor_adjustments
 
+        return body
+
+    def _ondemand_price_path(
+        self, filter_exp: Optional[str] = None, page: int = 1, page_size: int = 1000
+    ) -> str:
         query_params: List[str] = [f"page={page}", f"page_size={page_size}"]
 
         if filter_exp is not None:
             query_params.append(f"filter={filter_exp}")
 
-        path = f"{self._path_on_demand_price}?{'&'.join(query_params)}"
+        return f"{self._path_on_demand_price}?{'&'.join(query_params)}"
 
-        response = post_data(
-            path=path,
-            body=body,
-            df_fn=self._convert_to_df,
-            raw=raw,
+    @staticmethod
+    def _batch_kwargs(
+        inputs: DataFrame, builder: Callable[..., Dict[str, Any]], required: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Turn each input row into keyword arguments for ``builder``."""
+        missing = [c for c in required if c not in inputs.columns]
+        if missing:
+            raise ValueError(f"inputs is missing required columns: {missing}")
+
+        params = inspect.signature(builder).parameters
+        columns = [c for c in inputs.columns if c in params]
+
+        def present(value: Any) -> bool:
+            # optional columns hold NaN where a row leaves the value unset
+            return not (value is None or (is_scalar(value) and pd.isna(value)))
+
+        return [
+            {c: v for c, v in zip(columns, values) if present(v)}
+            for values in inputs[columns].itertuples(index=False, name=None)
+        ]
+
+    def _calculate_batch(
+        self,
+        path: str,
+        inputs: DataFrame,
+        bodies: List[Dict[str, Any]],
+        max_workers: Optional[int],
+        cache: bool,
+        errors: Literal["raise", "skip"],
+    ) -> DataFrame:
+        """
+        POST every body concurrently and join the results back onto ``inputs``.
+
+        Identical bodies are sent once and, with ``cache``, answered from
+        ``spgci.memo`` when sent before. Requests go through the client's usual rate
+        limiting and run as ``Priority.BULK`` unless the caller chose a priority.
+        """
+        keys = [body_key(path, body) for body in bodies]
+        results: Dict[str, DataFrame] = {}
+        pending = dict(zip(keys, bodies))
+
+        def post(body: Dict[str, Any]) -> DataFrame:
+            return cast(
+                DataFrame,
+                post_data(path=path, body=body, df_fn=self._convert_to_df, memo=cache),
+            )
+
+        failed: Dict[str, Exception] = {}
+        workers = max_workers or spgci.config.parallelism
+        level = explicit_priority()
+        with priority(Priority.BULK if level is None else level):
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(copy_context().run, post, body): key
+                    for key, body in pending.items()
+                }
+                try:
+                    for future in as_completed(futures):
+                        key = futures[future]
+                        try:
+                            results[key] = future.result()
+                        except Exception as exc:
+                            if errors == "raise":
+                                raise
+                            failed[key] = exc
+                finally:
+                    for queued in futures:
+                        queued.cancel()
+
+        frames: List[DataFrame] = []
+        rows: List[int] = []
+        for position, key in enumerate(keys):
+            if key in failed:
+                warnings.warn(
+                    f"Batch row {inputs.index[position]} failed: {failed[key]}"
+                )
+                continue
+            # an input without results keeps one row, its result columns left NaN
+            frame = results[key] if len(results[key]) else results[key].reindex([0])
+            frames.append(frame)
+            rows.extend([position] * len(frame))
+
+        if not frames:
+            return DataFrame(columns=inputs.columns)
+
+        outputs = pd.concat(frames, ignore_index=True)
+        # results keep their names, input columns sharing one are prefixed
+        passed = inputs.iloc[rows].reset_index(drop=True)
+        passed.columns = [
+            f"input.{c}" if c in outputs.columns else c for c in passed.columns
+        ]
+        joined = pd.concat([passed, outputs], axis=1)
+        joined.index = inputs.index[rows]
+        return joined
+
+    def calculate_eu_compliance_penalty_batch(
+        self,
+        inputs: DataFrame,
+        *,
+        max_workers: Optional[int] = None,
+        cache: bool = False,
+        errors: Literal["raise", "skip"] = "raise",
+    ) -> DataFrame:
+        """
+        Calculate EU FuelEU Maritime compliance penalties for many voyages at once.
+
+        Parameters
+        ----------
+        inputs : DataFrame
+            One voyage per row. Columns are named after the arguments of
+            ``calculate_eu_compliance_penalty``: ``origin_port``, ``destination_port``,
+            ``fuel_blends`` and ``reporting_period`` are required, while
+            ``include_eu_ets_cost`` and the ``ghg_intensity_*`` columns are optional
+            and may be left ``NaN``. Other columns are passed through to the output.
+        max_workers : int, optional
+            Requests in flight at once, by default ``config.parallelism``.
+        cache : bool, optional
+            Reuse results of identical voyages memoised by ``spgci.memo``, by
+            default ``False``. Duplicate rows are only sent once either way.
+        errors : {"raise", "skip"}, optional
+            Raise the first failure, or warn and leave the failed rows out. By
+            default ``"raise"``.
+
+        Returns
+        -------
+        DataFrame
+            The input columns joined to each voyage's result, with one row per
+            ``costBreakdown`` entry, or a single row of ``NaN`` results when there is
+            none. Input columns named like a result column are prefixed with
+            ``input.``. The index repeats the input row labels.
+
+        Examples
+        --------
+        >>> voyages = pd.DataFrame(
+        ...     {
+        ...         "origin_port": ["Rotterdam, Europe", "Singapore, Asia"],
+        ...         "destination_port": ["New York, Americas", "Rotterdam, Europe"],
+        ...         "fuel_blends": [
+        ...             [FuelBlend(fuels=[FuelConsumption(fuel="VLSFO", consumption=100)])],
+        ...             [FuelBlend(fuels=[FuelConsumption(fuel="LNG", consumption=100)])],
+        ...         ],
+        ...         "reporting_period": "2025-2029",
+        ...         "ghg_intensity_lng": [None, 76.08],
+        ...     }
+        ... )
+        >>> ci.ScenarioManager().calculate_eu_compliance_penalty_batch(voyages)
+        """
+        bodies = [
+            self._eu_compliance_body(**kwargs)
+            for kwargs in self._batch_kwargs(
+                inputs,
+                self._eu_compliance_body,
+                ["origin_port", "destination_port", "fuel_blends", "reporting_period"],
+            )
+        ]
+
+        return self._calculate_batch(
+            self._path_eu_compliance, inputs, bodies, max_workers, cache, errors
         )
 
-        return response
+    def calculate_ondemand_price_batch(
+        self,
+        inputs: DataFrame,
+        *,
+        page_size: int = 1000,
+        max_workers: Optional[int] = None,
+        cache: bool = False,
+        errors: Literal["raise", "skip"] = "raise",
+    ) -> DataFrame:
+        """
+        Generate on-demand prices for many product grades and routes at once.
+
+        Parameters
+        ----------
+        inputs : DataFrame
+            One request per row. Columns are named after the arguments of
+            ``calculate_ondemand_price``: ``start_date``, ``end_date``, ``commodity``
+            and ``product_grade`` are required, while the location and cost factor
+            columns (``origin_state``, ``rvp``, ``line_space_code``, ...) are optional
+            and may be left ``NaN``. Other columns are passed through to the output.
+        page_size : int, optional
+            Number of rows requested for each input, by default ``1000``.
+        max_workers : int, optional
+            Requests in flight at once, by default ``config.parallelism``.
+        cache : bool, optional
+            Reuse results of identical requests memoised by ``spgci.memo``, by
+            default ``False``. Duplicate rows are only sent once either way.
+        errors : {"raise", "skip"}, optional
+            Raise the first failure, or warn and leave the failed rows out. By
+            default ``"raise"``.
+
+        Returns
+        -------
+        DataFrame
+            The input columns joined to each request's prices, with one row per
+            ``costBreakdown`` entry, or a single row of ``NaN`` results when there is
+            none. Input columns named like a result column are prefixed with
+            ``input.``. The index repeats the input row labels.
+
+        Examples
+        --------
+        >>> grades = pd.DataFrame(
+        ...     {
+        ...         "start_date": "2026-02-15",
+        ...         "end_date": "2026-02-17",
+        ...         "commodity": "Gasoline",
+        ...         "product_grade": [
+        ...             "Gasoline Unl 87 USGC Prompt Pipeline",
+        ...             "Gasoline Prem 93 USGC Prompt Pipeline",
+        ...         ],
+        ...         "rvp": [None, 9.0],
+        ...     }
+        ... )
+        >>> ci.ScenarioManager().calculate_ondemand_price_batch(grades)
+        """
+        bodies = [
+            self._ondemand_price_body(**kwargs)
+            for kwargs in self._batch_kwargs(
+                inputs,
+                self._ondemand_price_body,
+                ["start_date", "end_date", "commodity", "product_grade"],
+            )
+        ]
+
+        return self._calculate_batch(
+            self._ondemand_price_path(page_size=page_size),
+            inputs,
+            bodies,
+            max_workers,
+            cache,
+            errors,
+        )
 
     def get_reference_data_commodities(
         self,
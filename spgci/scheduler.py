@@ -0,0 +1,149 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Prioritise interactive requests over bulk pagination.
+
+Every HTTP request takes a slot from a process-wide scheduler before it is sent. Single
+calls and the first page of a ``get_data`` call run as ``INTERACTIVE``; the remaining
+pages of a paginated call run as ``BULK``. Because each page takes its own slot, a long
+backfill yields to interactive calls between pages while still using any spare capacity.
+
+The scheduler only holds requests back once ``config.max_concurrent_requests`` or a
+per-class limit in ``config.priority_concurrency`` is set.
+
+>>> import spgci as ci
+>>> ci.config.max_concurrent_requests = 8
+>>> ci.config.priority_concurrency = {"bulk": 6}
+>>> with ci.scheduler.priority(ci.scheduler.Priority.BULK):
+...     ci.MarketData().get_assessments_by_mdc_history(mdc="ET", paginate=True)
+"""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any, Dict, Iterator, Optional
+
+import spgci.config as config
+import spgci.deadline as deadline
+from spgci.exceptions import DeadlineExceededError
+
+
+class Priority(IntEnum):
+    """Request classes, lower values are served first."""
+
+    INTERACTIVE = 0
+    BULK = 1
+
+
+_priority: "ContextVar[Optional[Priority]]" = ContextVar("spgci_priority", default=None)
+
+
+@contextmanager
+def priority(level: Priority) -> Iterator[None]:
+    """Run the SDK calls made inside the block, including all their pages, at ``level``."""
+    token = _priority.set(Priority(level))
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def explicit_priority() -> Optional[Priority]:
+    """Priority set through :func:`priority`, ``None`` when the caller did not choose one."""
+    return _priority.get()
+
+
+def current_priority() -> Priority:
+    p = _priority.get()
+    return Priority.INTERACTIVE if p is None else p
+
+
+class RequestScheduler:
+    """
+    Grants request slots by priority.
+
+    A request may start when the total and its class are below their limits and no
+    higher priority request that could start is waiting. Limits are read from ``config``
+    on every decision so they can be tuned at runtime.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._active: Dict[Priority, int] = {p: 0 for p in Priority}
+        self._waiting: Dict[Priority, int] = {p: 0 for p in Priority}
+        self._served: Dict[Priority, int] = {p: 0 for p in Priority}
+
+    @staticmethod
+    def _class_limit(level: Priority) -> int:
+        limits = config.priority_concurrency or {}
+        return int(limits.get(level.name.lower(), 0))
+
+    def _class_full(self, level: Priority) -> bool:
+        limit = self._class_limit(level)
+        return bool(limit) and self._active[level] >= limit
+
+    def _can_start(self, level: Priority) -> bool:
+        total = config.max_concurrent_requests
+        if total and sum(self._active.values()) >= total:
+            return False
+        if self._class_full(level):
+            return False
+        return not any(
+            self._waiting[p] and not self._class_full(p) for p in Priority if p < level
+        )
+
+    @contextmanager
+    def slot(self, level: Optional[Priority] = None) -> Iterator[None]:
+        """Hold a request slot for the duration of the block."""
+        level = current_priority() if level is None else level
+        with self._cond:
+            self._waiting[level] += 1
+            try:
+                while not self._can_start(level):
+                    left = deadline.remaining()
+                    if left == 0:
+                        raise DeadlineExceededError(
+                            "Deadline exceeded waiting for a request slot"
+                        )
+                    self._cond.wait(left)
+            finally:
+                self._waiting[level] -= 1
+                # lower priority waiters may have been held back only by this one
+                self._cond.notify_all()
+            self._active[level] += 1
+            self._served[level] += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active[level] -= 1
+                self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        """Active, waiting and served request counts per priority class."""
+        with self._cond:
+            return {
+                p.name.lower(): {
+                    "active": self._active[p],
+                    "waiting": self._waiting[p],
+                    "served": self._served[p],
+                }
+                for p in Priority
+            }
+
+
+#: process-wide scheduler used by the API client
+scheduler = RequestScheduler()
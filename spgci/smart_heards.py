@@ -16,11 +16,14 @@ from __future__ import annotations
 from typing import Union, Optional, List
 from requests import Response
 from spgci.api_client import get_data, Paginator
-from spgci.utilities import list_to_filter, convert_date_to_filter_exp
+from spgci.utilities import (
+    list_to_filter,
+    convert_date_to_filter_exp,
+    strip_html_columns,
+)
 from pandas import Series, DataFrame, to_datetime  # type: ignore
 from datetime import date
 from functools import partial
-import html
 
 
 class SmartHeards:
@@ -59,9 +62,7 @@ class SmartHeards:
                 df["rtpTimestamp"] = to_datetime(df["rtpTimestamp"], format="ISO8601")
 
         if strip_html:
-            if "body" in df.columns:
-                df["body"] = df["body"].str.replace(r"<.*?>", " ", regex=True)  # type: ignore
-                df["body"] = df["body"].apply(lambda s: html.unescape(str(s)).replace("\n", " "))  # type: ignore
+            strip_html_columns(df, ["body"])
 
         return df
 
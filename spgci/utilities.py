@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from typing import (
+    TYPE_CHECKING,
     List,
     Union,
     Any,
@@ -23,13 +24,30 @@ from typing import (
     Callable,
     Tuple,
 )
-from pandas import Series
+from pandas import DataFrame, Series
+from pandas.api.types import (
+    CategoricalDtype,
+    infer_dtype,
+    is_bool_dtype,
+    is_datetime64_any_dtype,
+    is_numeric_dtype,
+)
 from typing_extensions import TypeGuard
 from enum import Enum
 from datetime import date
-from functools import partial
+from functools import partial, lru_cache
 from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from contextvars import copy_context
+import html
+import re
+import threading
 import spgci.config
+import spgci.deadline
+from spgci.exceptions import DeadlineExceededError
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
 
 T = TypeVar("T", bound=Enum)
 
@@ -86,17 +104,18 @@ def list_to_filter(
     delim = ":" if strategy == "platts" else " eq"
     quote = f"{double_quote if strategy == 'platts' else single_quote}"
     if isinstance(items, Series):
-        return convert_series_to_filterexp(field_name, items, quote)
+        return convert_series_to_filterexp(field_name, items, quote, strategy)
 
     if not isinstance(items, (bool)) and not items:
         return ""
 
     if isinstance(items, bool):
         return f"{field_name}{delim} {items}"
-    if isinstance(items, str):
-        return f"{field_name}{delim} {quote}{items}{quote}"
-    if isinstance(items, Enum):
-        return f"{field_name}{delim} {quote}{items.value}{quote}"
+    if isinstance(items, (str, Enum)):
+        value = f"{items.value if isinstance(items, Enum) else items}"
+        if strategy == "odata":
+            value = value.replace("'", "''")
+        return f"{field_name}{delim} {quote}{value}{quote}"
     if isinstance(items, float) or isinstance(items, int):
         return f"{field_name}{delim} {items}"
     if isinstance(items, date):
@@ -105,24 +124,7 @@ def list_to_filter(
         else:
             return f"{field_name}{delim} {quote}{items}{quote}"
 
-    if is_enum_list(items):
-        n_items: List[str] = [x.value for x in items]
-        n_items = [f"{quote}{x}{quote}" for x in n_items]
-    elif is_str_list(items):
-        n_items = [f"{quote}{x}{quote}" for x in items]
-    elif is_bool_list(items):
-        n_items = [f"{x}" for x in items]
-    elif is_int_list(items):
-        n_items = [str(x) for x in items]
-    elif is_date_list(items):
-        # if strategy == "odata":
-        #     n_items = [str(x) for x in items]
-        # else:
-        n_items = [f"{quote}{x}{quote}" for x in items]
-    else:
-        raise TypeError("not supported")
-
-    return f"{field_name} in ({','.join(n_items)})"
+    return _collection_to_filter(field_name, items, quote, strategy)
 
 
 def odata_list_to_filter(
@@ -143,17 +145,114 @@ def odata_list_to_filter(
     return list_to_filter(field_name, items, strategy="odata")
 
 
-def convert_series_to_filterexp(field_name: str, s: "Series[Any]", quote: str) -> str:
-    if is_int_list(s):
-        l = [str(x) for x in s]
-    elif is_str_list(s):
-        l = [f"{quote}{x}{quote}" for x in s]
-    elif is_date_list(s):
-        l = [f"{quote}{x}{quote}" for x in s]
-    else:
+def convert_series_to_filterexp(
+    field_name: str, s: "Series[Any]", quote: str, strategy: Optional[str] = None
+) -> str:
+    if strategy is None:
+        strategy = "odata" if quote == "'" else "platts"
+
+    _reject_missing(s)
+    kind = _infer_kind(s)
+    if kind not in ("bool", "num", "str", "date"):
         raise TypeError("series type unsupported")
 
-    return f"{field_name} in ({','.join(l)})"
+    return f"{field_name} in ({_join_values(s, kind, quote, strategy)})"
+
+
+#: longest collection whose filter is cached, longer ones are rarely repeated
+_CACHED_FILTER_SIZE = 64
+
+
+def _collection_to_filter(
+    field_name: str, items: Collection[Any], quote: str, strategy: str
+) -> str:
+    if len(items) > _CACHED_FILTER_SIZE:
+        return _build_in_filter(field_name, list(items), quote, strategy)
+    try:
+        # 1, 1.0 and True hash alike but render differently, so the type is keyed too
+        key = tuple((type(x), x) for x in items)
+        hash(key)
+    except TypeError:
+        return _build_in_filter(field_name, list(items), quote, strategy)
+
+    return _cached_in_filter(field_name, key, quote, strategy)
+
+
+def _build_in_filter(
+    field_name: str, items: Collection[Any], quote: str, strategy: str
+) -> str:
+    values = Series(list(items), dtype=object)
+    _reject_missing(values)
+    kind = _infer_kind(values)
+    if kind == "enum":
+        values = Series([f"{x.value}" for x in items], dtype=object)
+        kind = "str"
+    elif kind == "other":
+        raise TypeError("not supported")
+
+    return f"{field_name} in ({_join_values(values, kind, quote, strategy)})"
+
+
+@lru_cache(maxsize=256)
+def _cached_in_filter(
+    field_name: str, key: Tuple[Tuple[type, Any], ...], quote: str, strategy: str
+) -> str:
+    """Compiled ``in (...)`` expression of a hashable collection, by typed values."""
+    return _build_in_filter(field_name, [x for _, x in key], quote, strategy)
+
+
+def _reject_missing(values: "Series[Any]") -> None:
+    # str() would render them as nan/None/NaT inside the expression
+    if values.hasnans:
+        raise ValueError("filter values must not be missing (None, NaN or NaT)")
+
+
+def _infer_kind(values: "Series[Any]") -> str:
+    """
+    Classify a collection as ``bool``, ``num``, ``str``, ``date``, ``enum`` or ``other``.
+
+    Uses the pandas dtype when it is specific, otherwise a single ``infer_dtype`` pass.
+    """
+    dtype = values.dtype
+    if isinstance(dtype, CategoricalDtype):
+        # the values render as their categories would
+        return _infer_kind(Series(dtype.categories))
+    if is_bool_dtype(dtype):
+        return "bool"
+    if is_numeric_dtype(dtype):
+        return "num"
+    if is_datetime64_any_dtype(dtype):
+        return "date"
+
+    inferred = infer_dtype(values, skipna=False)
+    if inferred == "string":
+        return "str"
+    if inferred == "boolean":
+        return "bool"
+    if inferred in ("integer", "floating", "mixed-integer-float", "decimal", "empty"):
+        return "num"
+    if inferred in ("date", "datetime"):
+        return "date"
+    if inferred == "mixed" and all(isinstance(x, Enum) for x in values):
+        return "enum"
+    return "other"
+
+
+def _join_values(values: "Series[Any]", kind: str, quote: str, strategy: str) -> str:
+    """Render the comma separated value list of an ``in (...)`` expression."""
+    if kind == "str":
+        rendered: List[str] = values.tolist()
+    else:
+        rendered = list(map(str, values.tolist()))
+
+    if kind in ("bool", "num"):
+        return ",".join(rendered)
+
+    # odata escapes a single quote inside a literal by doubling it
+    if strategy == "odata" and "'" in "".join(rendered):
+        rendered = [x.replace("'", "''") for x in rendered]
+
+    return quote + f"{quote},{quote}".join(rendered) + quote
 
 
 def convert_date_to_filter_exp(
@@ -233,17 +332,143 @@ def profile_data(df):
 
 
 def parallel(
-    *funcs: Callable[[], Any], max_workers: Optional[int] = None
+    *funcs: Callable[[], Any],
+    max_workers: Optional[int] = None,
+    timeout_total: Optional[float] = None,
 ) -> Tuple[Any, ...]:
     """
     Executes multiple SDK calls concurrently and returns their results as a tuple.
+
+    With ``timeout_total``, all the calls share that many seconds (see
+    ``spgci.deadline``) and ``DeadlineExceededError`` is raised once they run out,
+    without waiting for the calls still running.
     """
     if max_workers is None:
         # Fall back to config, or a hard fallback of 5 if parallelism isn't defined
         max_workers = getattr(spgci.config, "parallelism", 5)
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all lambdas
-        futures = [executor.submit(f) for f in funcs]
-        # Return results in the exact same order they were passed
-        return tuple(future.result() for future in futures)
+    with spgci.deadline.within(timeout_total):
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        expired = False
+        try:
+            # Submit all lambdas, each in a copy of the caller's context so settings
+            # such as ``scheduler.priority``, ``config.set_token`` and the deadline
+            # carry over to the workers
+            futures = [executor.submit(copy_context().run, f) for f in funcs]
+            # Return results in the exact same order they were passed
+            return tuple(
+                future.result(timeout=spgci.deadline.remaining()) for future in futures
+            )
+        except FuturesTimeoutError:
+            if spgci.deadline.remaining() != 0:
+                raise
+            expired = True
+            raise DeadlineExceededError(
+                "Deadline exceeded before every call completed"
+            ) from None
+        finally:
+            executor.shutdown(wait=not expired, cancel_futures=expired)
+
+
+#: matches exactly what the former ``<.*?>`` did, without backtracking
+_HTML_TAG = re.compile(r"<[^>\n]*>")
+#: well formed entities, which decode the same on their own as within the text
+_HTML_ENTITY = re.compile(r"&(#[0-9]+|#[xX][0-9a-fA-F]+|[A-Za-z][A-Za-z0-9]{0,30});")
+#: below this many characters a process pool costs more than it saves
+_HTML_PROCESS_MIN_CHARS = 4_000_000
+
+_html_pool: Optional["ProcessPoolExecutor"] = None
+_html_pool_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4096)
+def _html_entity(name: str) -> str:
+    return html.unescape(f"&{name};")
+
+
+def _strip_html_text(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+
+    text = _HTML_TAG.sub(" ", value)
+    if "&" in text:
+        parts = _HTML_ENTITY.split(text)
+        # decode entity by entity unless some ``&`` is not part of a well formed one
+        if text.count("&") == len(parts) // 2:
+            parts[1::2] = [_html_entity(name) for name in parts[1::2]]
+            text = "".join(parts)
+        else:
+            text = html.unescape(text)
+
+    return text.replace("\n", " ")
+
+
+def _strip_html_values(values: List[Any]) -> List[Any]:
+    return [_strip_html_text(v) for v in values]
+
+
+def _html_process_pool(processes: int) -> "ProcessPoolExecutor":
+    global _html_pool
+    with _html_pool_lock:
+        if _html_pool is None:
+            # imported here, multiprocessing is only needed for very large pulls
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            # spawn: page conversion runs on worker threads, where fork is unsafe
+            _html_pool = ProcessPoolExecutor(
+                max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _html_pool
+
+
+def strip_html(values: List[Any], processes: Optional[int] = None) -> List[Any]:
+    """
+    Remove html tags, decode html entities and replace newlines with spaces.
+
+    Tags are replaced by a space. Non-string values such as ``None`` are returned
+    unchanged.
+
+    Parameters
+    ----------
+    values : List[Any]
+        texts to clean
+    processes : int, optional
+        spread large inputs over this many processes, by default
+        ``config.html_strip_processes``. The calling script must guard its entry point
+        with ``if __name__ == "__main__":`` when this is used.
+    """
+    if processes is None:
+        processes = spgci.config.html_strip_processes
+
+    if processes > 1:
+        size = sum(len(v) for v in values if isinstance(v, str))
+        if size >= _HTML_PROCESS_MIN_CHARS:
+            step = -(-len(values) // (processes * 4))
+            chunks = [values[i : i + step] for i in range(0, len(values), step)]
+            pool = _html_process_pool(processes)
+            return [v for chunk in pool.map(_strip_html_values, chunks) for v in chunk]
+
+    return _strip_html_values(values)
+
+
+def strip_html_columns(
+    df: DataFrame, columns: List[str], processes: Optional[int] = None
+) -> DataFrame:
+    """
+    Apply :func:`strip_html` to the ``columns`` of ``df`` that exist, in place.
+
+    All columns are cleaned in one batch so a process pool is only entered once.
+    """
+    present = [c for c in columns if c in df.columns]
+    if not present or df.empty:
+        return df
+
+    values = [v for c in present for v in df[c].tolist()]
+    cleaned = strip_html(values, processes)
+
+    n = len(df)
+    for i, column in enumerate(present):
+        df[column] = Series(cleaned[i * n : (i + 1) * n], index=df.index)
+
+    return df
@@ -16,6 +16,8 @@ from __future__ import annotations
 from typing import List, Optional, Union, Literal
 from requests import Response
 from spgci.api_client import get_data
+from spgci.facets import unique_values
+from spgci.jsonstream import read_frame
 from spgci.utilities import list_to_filter
 from pandas import DataFrame, Series
 from datetime import date, datetime
@@ -104,8 +106,7 @@ class Weather:
             params["filter"] = filter_exp
 
         def to_df(resp: Response) -> DataFrame:
-            response_json = resp.json()
-            df = pd.json_normalize(response_json["aggResultValue"])
+            df = read_frame(resp, "aggResultValue", pd.json_normalize)
 
             date_columns = [
                 "weatherDate",
@@ -129,11 +130,16 @@ class Weather:
 
             return df
 
-        return get_data(
-            path=dataset_to_path[dataset],
-            params=params,
-            df_fn=to_df,
-            paginate=True,
+        return unique_values(
+            dataset_to_path[dataset],
+            columns,
+            filter_exp,
+            lambda: get_data(
+                path=dataset_to_path[dataset],
+                params=params,
+                df_fn=to_df,
+                paginate=True,
+            ),
         )
 
     def get_actual(
@@ -0,0 +1,372 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Keep weather forecast vintages locally and query the latest forecast per location.
+
+``Weather.get_forecast`` returns one row per ``recordedDate`` vintage of every
+(market, city, location, weatherDate). The store ingests those rows incrementally into
+a SQLite file indexed by location and target date, so "latest forecast as of T" and
+"how did this forecast change" are answered without downloading every vintage again.
+
+>>> store = WeatherForecastStore("weather.db", retention=timedelta(days=30))
+>>> store.update(market="United States")
+>>> store.latest(city="Boston", weather_date_gte="2026-01-01")
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, cast
+
+import pandas as pd
+from pandas import DataFrame
+from spgci.memo import canonical
+from spgci.weather import Weather
+
+_KEYS = ["market", "city", "location", "weatherDate"]
+_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+DateLike = Union[date, datetime, str]
+
+
+def _stamp(value: Any) -> str:
+    """Sortable UTC text form of a date or timestamp."""
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert("UTC").tz_localize(None)
+    return ts.strftime(_TIME_FORMAT)
+
+
+class WeatherForecastStore:
+    """
+    Local, indexed store of weather forecast vintages.
+
+    Parameters
+    ----------
+    path : str, optional
+        SQLite file holding the store, by default an in-memory database.
+    retention : timedelta, optional
+        Vintages recorded longer ago than this are pruned after every ingest. The
+        latest vintage of each forecast is always kept. By default nothing is pruned.
+    client : Weather, optional
+        Client used by :meth:`update`, by default a new ``Weather``.
+    lookback : timedelta, optional
+        Window re-read before the last ``modifiedDate`` seen by :meth:`update`, so
+        rows published late with an earlier or equal timestamp are not missed, by
+        default 5 minutes.
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        *,
+        retention: Optional[timedelta] = None,
+        client: Optional[Weather] = None,
+        lookback: timedelta = timedelta(minutes=5),
+    ) -> None:
+        self.path = path
+        self.retention = retention
+        self.lookback = pd.Timedelta(lookback)
+        self._client = client if client is not None else Weather()
+        # one connection guarded by a lock, so an in-memory store is shared by threads
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS forecast ("
+                " market TEXT NOT NULL, city TEXT NOT NULL, location TEXT NOT NULL,"
+                " weather_date TEXT NOT NULL, recorded_date TEXT NOT NULL,"
+                " modified_date TEXT, data TEXT NOT NULL,"
+                " PRIMARY KEY (market, city, location, weather_date, recorded_date))"
+            )
+            # retention deletes scan by recording date
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS forecast_recorded"
+                " ON forecast (recorded_date)"
+            )
+            # latest modifiedDate downloaded by update() per set of filters
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS watermark (filters TEXT PRIMARY KEY,"
+                " modified_date TEXT NOT NULL)"
+            )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "WeatherForecastStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def ingest(self, df: DataFrame) -> int:
+        """
+        Add forecast rows as returned by ``Weather.get_forecast``.
+
+        Rows replace a stored row with the same location, ``weatherDate`` and
+        ``recordedDate``. Returns the number of rows written.
+        """
+        if df.empty:
+            return 0
+        missing = [c for c in _KEYS + ["recordedDate"] if c not in df.columns]
+        if missing:
+            raise ValueError(f"Forecast rows are missing columns: {missing}")
+
+        keys = df[["market", "city", "location"]].astype(object)
+        keys = keys.where(keys.notna(), "").astype(str)
+        weather_dates = df["weatherDate"].map(_stamp)
+        recorded_dates = df["recordedDate"].map(_stamp)
+        modified_dates = (
+            df["modifiedDate"].map(_stamp, na_action="ignore")
+            if "modifiedDate" in df.columns
+            else pd.Series(None, index=df.index, dtype=object)
+        )
+        values = df.drop(
+            columns=[*_KEYS, "recordedDate", "modifiedDate"], errors="ignore"
+        )
+        data = [
+            json.dumps(row, default=str)
+            for row in values.astype(object)
+            .where(values.notna(), None)
+            .to_dict("records")
+        ]
+
+        rows = list(
+            zip(
+                keys["market"],
+                keys["city"],
+                keys["location"],
+                weather_dates,
+                recorded_dates,
+                modified_dates.where(modified_dates.notna(), None),
+                data,
+            )
+        )
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO forecast VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+        if self.retention is not None:
+            self.prune(older_than=self.retention)
+        return len(rows)
+
+    def last_modified(self) -> Optional[pd.Timestamp]:
+        """Most recent ``modifiedDate`` in the store, in UTC."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MAX(modified_date) FROM forecast"
+            ).fetchone()
+        return pd.Timestamp(row[0], tz="UTC") if row[0] else None
+
+    def update(self, **filters: Any) -> int:
+        """
+        Download forecast rows modified since the last update and ingest them.
+
+        ``filters`` are passed to ``Weather.get_forecast``, e.g. ``market=...``. The
+        first update with a set of filters downloads everything that matches them,
+        later ones only the rows modified since the last update with the same
+        filters, less ``lookback``. Rows read again are replaced, not duplicated.
+        """
+        scope = json.dumps(canonical(filters), sort_keys=True, default=str)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT modified_date FROM watermark WHERE filters = ?", (scope,)
+            ).fetchone()
+        if row is not None:
+            since = pd.Timestamp(row[0]) - self.lookback
+            filters.setdefault(
+                "modified_date_gte", since.strftime("%Y-%m-%dT%H:%M:%SZ")
+            )
+        df = cast(DataFrame, self._client.get_forecast(paginate=True, **filters))
+        written = self.ingest(df)
+
+        if "modifiedDate" in df.columns and df["modifiedDate"].notna().any():
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT INTO watermark VALUES (?, ?) ON CONFLICT (filters)"
+                    " DO UPDATE SET modified_date"
+                    " = MAX(modified_date, excluded.modified_date)",
+                    (scope, _stamp(df["modifiedDate"].max())),
+                )
+        return written
+
+    @staticmethod
+    def _where(
+        market: Optional[Union[str, Iterable[str]]],
+        city: Optional[Union[str, Iterable[str]]],
+        location: Optional[Union[str, Iterable[str]]],
+        weather_date_gte: Optional[DateLike],
+        weather_date_lte: Optional[DateLike],
+    ) -> Tuple[List[str], List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        for column, value in (
+            ("market", market),
+            ("city", city),
+            ("location", location),
+        ):
+            if value is None:
+                continue
+            values = [value] if isinstance(value, str) else list(value)
+            clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+        if weather_date_gte is not None:
+            clauses.append("weather_date >= ?")
+            params.append(_stamp(weather_date_gte))
+        if weather_date_lte is not None:
+            clauses.append("weather_date <= ?")
+            params.append(_stamp(weather_date_lte))
+        return clauses, params
+
+    @staticmethod
+    def _to_df(rows: List[Tuple[Any, ...]]) -> DataFrame:
+        records: List[Dict[str, Any]] = []
+        for market, city, location, weather, recorded, modified, data in rows:
+            record = {
+                "market": market or None,
+                "city": city or None,
+                "location": location or None,
+                "weatherDate": weather,
+                "recordedDate": recorded,
+                "modifiedDate": modified,
+            }
+            record.update(json.loads(data))
+            records.append(record)
+
+        df = DataFrame.from_records(
+            records,
+            columns=None if records else [*_KEYS, "recordedDate", "modifiedDate"],
+        )
+        for column in ("weatherDate", "recordedDate"):
+            df[column] = pd.to_datetime(df[column], format=_TIME_FORMAT)
+        df["modifiedDate"] = pd.to_datetime(
+            df["modifiedDate"], format=_TIME_FORMAT, utc=True
+        )
+        return df
+
+    def latest(
+        self,
+        as_of: Optional[DateLike] = None,
+        *,
+        market: Optional[Union[str, Iterable[str]]] = None,
+        city: Optional[Union[str, Iterable[str]]] = None,
+        location: Optional[Union[str, Iterable[str]]] = None,
+        weather_date_gte: Optional[DateLike] = None,
+        weather_date_lte: Optional[DateLike] = None,
+    ) -> DataFrame:
+        """
+        Latest forecast of every (market, city, location, weatherDate).
+
+        Parameters
+        ----------
+        as_of : date or datetime, optional
+            Only consider vintages recorded at or before this time, by default all.
+        market, city, location : str or list of str, optional
+            Restrict the locations returned.
+        weather_date_gte, weather_date_lte : date, optional
+            Restrict the target dates returned.
+        """
+        clauses, params = self._where(
+            market, city, location, weather_date_gte, weather_date_lte
+        )
+        if as_of is not None:
+            clauses.append("recorded_date <= ?")
+            params.append(_stamp(as_of))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        # SQLite returns the other columns from the row holding the MAX()
+        query = (
+            "SELECT market, city, location, weather_date, MAX(recorded_date),"
+            f" modified_date, data FROM forecast {where}"
+            " GROUP BY market, city, location, weather_date"
+            " ORDER BY market, city, location, weather_date"
+        )
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return self._to_df(rows)
+
+    def revisions(
+        self,
+        *,
+        market: Optional[Union[str, Iterable[str]]] = None,
+        city: Optional[Union[str, Iterable[str]]] = None,
+        location: Optional[Union[str, Iterable[str]]] = None,
+        weather_date_gte: Optional[DateLike] = None,
+        weather_date_lte: Optional[DateLike] = None,
+    ) -> DataFrame:
+        """
+        Every stored vintage of the matching forecasts, oldest first.
+
+        A ``revision`` column numbers the vintages of each forecast from 0, so the
+        change between vintages is a ``groupby(...).diff()`` away.
+        """
+        clauses, params = self._where(
+            market, city, location, weather_date_gte, weather_date_lte
+        )
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        query = (
+            f"SELECT * FROM forecast {where}"
+            " ORDER BY market, city, location, weather_date, recorded_date"
+        )
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        df = self._to_df(rows)
+        df.insert(5, "revision", df.groupby(_KEYS, dropna=False).cumcount())
+        return df
+
+    def prune(
+        self,
+        older_than: Optional[timedelta] = None,
+        keep_vintages: Optional[int] = None,
+    ) -> int:
+        """
+        Delete old vintages, always keeping the latest one of every forecast.
+
+        Parameters
+        ----------
+        older_than : timedelta, optional
+            Delete vintages recorded longer ago than this.
+        keep_vintages : int, optional
+            Keep at most this many of the most recent vintages per forecast.
+
+        Returns
+        -------
+        int
+            Number of vintages deleted.
+        """
+        # vintages of the same forecast recorded after the candidate row
+        newer = (
+            "FROM forecast AS n WHERE n.market = forecast.market"
+            " AND n.city = forecast.city AND n.location = forecast.location"
+            " AND n.weather_date = forecast.weather_date"
+            " AND n.recorded_date > forecast.recorded_date"
+        )
+        deleted = 0
+        with self._lock, self._conn:
+            if older_than is not None:
+                cutoff = _stamp(pd.Timestamp.now(tz="UTC") - older_than)
+                deleted += self._conn.execute(
+                    "DELETE FROM forecast WHERE recorded_date < ?"
+                    f" AND EXISTS (SELECT 1 {newer})",
+                    (cutoff,),
+                ).rowcount
+            if keep_vintages is not None:
+                deleted += self._conn.execute(
+                    f"DELETE FROM forecast WHERE (SELECT COUNT(*) {newer}) >= ?",
+                    (max(keep_vintages, 1),),
+                ).rowcount
+        return deleted
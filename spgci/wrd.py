@@ -13,10 +13,16 @@
 # limitations under the License.
 
 from __future__ import annotations
+import numpy as np
+import pandas as pd
+from packaging.version import parse
+from itertools import chain
 from typing import Union, Optional, Literal
 from requests import Response
 from pandas import Series, DataFrame, to_datetime, json_normalize  # type: ignore
 from spgci.api_client import get_data, Paginator
+from spgci.facets import unique_values
+from spgci.jsonstream import read_frame
 from spgci.utilities import odata_list_to_filter, list_to_filter
 from urllib.parse import urlencode, quote, parse_qs, urlparse
 from datetime import date
@@ -215,12 +221,17 @@ class WorldRefineryData:
             df = df[df.columns.drop("@odata.id")]
             return df
 
-        return get_data(
-            f"{path}?{qs}",
-            params={},
-            df_fn=to_df,
-            paginate=True,
-            paginate_fn=self._paginate,
+        return unique_values(
+            path,
+            columns,
+            filter_exp,
+            lambda: get_data(
+                f"{path}?{qs}",
+                params={},
+                df_fn=to_df,
+                paginate=True,
+                paginate_fn=self._paginate,
+            ),
         )
 
     def get_capacity(
@@ -660,28 +671,51 @@ class WorldRefineryData:
 
         return Paginator(True, "page", total_pages)
 
+    #: outage fields repeated on each of its alerts
+    _alert_meta = [
+        "outageId",
+        "refineryId",
+        "operatorname",
+        "countryName",
+        "cityName",
+        "latitude",
+        "longitude",
+        "createdDate",
+    ]
+
     @staticmethod
-    def _outage_alerts_to_df(resp: Response) -> DataFrame:
-        j = resp.json()
+    def _flatten_alerts(outages: list) -> DataFrame:
+        # same frame as json_normalize(record_path="alerts", meta=_alert_meta), but
+        # built from whole columns instead of one record at a time
+        counts = [len(o["alerts"] or ()) for o in outages]
+        alerts = [a for o in outages for a in o["alerts"] or ()]
+        types = set(map(type, chain.from_iterable(map(dict.values, alerts))))
+        df = json_normalize(alerts) if dict in types else DataFrame.from_records(alerts)
+
+        fields = WorldRefineryData._alert_meta
+        for field in fields:
+            if field in df.columns:
+                raise ValueError(
+                    f"Conflicting metadata name {field}, need distinguishing prefix"
+                )
+        meta = DataFrame({f: [o.get(f) for o in outages] for f in fields})
+        meta = meta.take(np.repeat(np.arange(len(outages)), counts))
+        return df.join(meta.reset_index(drop=True))
 
-        df = json_normalize(
-            j["results"],
-            meta=[
-                "outageId",
-                "refineryId",
-                "operatorname",
-                "countryName",
-                "cityName",
-                "latitude",
-                "longitude",
-                "createdDate",
-            ],
-            record_path="alerts",
-        )
-        df["createdDate"] = to_datetime(df["createdDate"], utc=True)
-        df["modifiedDate"] = to_datetime(df["modifiedDate"], utc=True)
-        df["startDate"] = to_datetime(df["startDate"])
-        df["endDate"] = to_datetime(df["endDate"])
+    @staticmethod
+    def _outage_alerts_to_df(resp: Response) -> DataFrame:
+        df = read_frame(resp, "results", WorldRefineryData._flatten_alerts)
+        # pandas 1 does not know format="ISO8601" and infers the format instead
+        if parse(pd.__version__) >= parse("2"):
+            iso = {"format": "ISO8601"}
+        else:
+            iso = {}
+        for column in ("createdDate", "modifiedDate"):
+            if column in df.columns:
+                df[column] = to_datetime(df[column], utc=True, **iso)
+        for column in ("startDate", "endDate"):
+            if column in df.columns:
+                df[column] = to_datetime(df[column], **iso)
         return df
 
     def get_outage_alerts(
@@ -0,0 +1,517 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Keep World Refinery Data locally and join the datasets with SQL.
+
+The store downloads capacity, runs, yields, outages and ownership from
+``WorldRefineryData`` in parallel into a SQLite file. Each table is indexed on
+refinery, period, country and process unit, so joins such as capacity against runs
+per refinery and quarter come back as DataFrames without downloading and merging the
+datasets again. Later updates only download rows modified since the last one.
+
+>>> store = WorldRefineryStore("wrd.db")
+>>> store.update(year_gte=2020)
+>>> store.join("capacity", "runs", country="India", year=2024)
+>>> store.table("outages", refinery=[1021, 1043])
+"""
+
+import json
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from datetime import date, datetime
+from typing import (
+    Any,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
+
+import pandas as pd
+import spgci.config as config
+from pandas import DataFrame
+from spgci.memo import canonical
+from spgci.scheduler import Priority, explicit_priority, priority
+from spgci.wrd import WorldRefineryData
+
+Dataset = Literal["capacity", "runs", "yields", "outages", "ownership"]
+
+#: client method downloading each dataset
+_METHODS: Dict[str, str] = {
+    "capacity": "get_capacity",
+    "runs": "get_runs",
+    "yields": "get_yields",
+    "outages": "get_outages",
+    "ownership": "get_ownership",
+}
+#: columns identifying a row, the first one present in a dataset is used
+_ROW_IDS: Dict[str, Tuple[str, ...]] = {
+    "capacity": ("CapacityId", "Id"),
+    "runs": ("RunId", "RunsId", "Id"),
+    "yields": ("YieldId", "YieldsId", "Id"),
+    "outages": ("OutageId", "Id"),
+    "ownership": ("OwnershipId", "Id"),
+}
+#: columns playing the same role across datasets, the first one present is used
+_ROLES: Dict[str, Tuple[str, ...]] = {
+    "refinery": ("Refinery.Id", "RefineryId"),
+    "year": ("Year",),
+    "quarter": ("Quarter",),
+    "country": (
+        "Refinery.Country.Name",
+        "Country.Name",
+        "Refinery.CountryId",
+        "CountryId",
+    ),
+    "process_unit": ("ProcessUnit.Name", "ProcessUnitId"),
+    "owner": ("Owner.Name", "OwnerId"),
+    "product": ("Product.Name", "ProductId"),
+}
+#: names of the role columns in join results
+_ROLE_NAMES = {
+    "refinery": "RefineryId",
+    "year": "Year",
+    "quarter": "Quarter",
+    "country": "Country",
+    "process_unit": "ProcessUnit",
+    "owner": "Owner",
+    "product": "Product",
+}
+#: roles identifying a row of a dataset without an id column
+_NATURAL_KEY = ("refinery", "year", "quarter", "process_unit", "product", "owner")
+#: filter suffixes comparing a role, e.g. ``year_gte``
+_RANGES = {"_gte": ">=", "_gt": ">", "_lte": "<=", "_lt": "<"}
+_DATE_COLUMNS = ("ModifiedDate", "Date")
+_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _stamp(value: Any) -> str:
+    """Sortable UTC text form of a date or timestamp."""
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert("UTC").tz_localize(None)
+    return ts.strftime(_TIME_FORMAT)
+
+
+def _scope(filters: Dict[str, Any]) -> str:
+    """Stable text form of the filters an update was made with."""
+    return json.dumps(canonical(filters), sort_keys=True, default=str)
+
+
+def _cell(value: Any) -> Any:
+    """SQLite value of a DataFrame cell."""
+    if value is None:
+        return None
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, default=str)
+    if isinstance(value, (pd.Timestamp, datetime, date)):
+        return _stamp(value)
+    if pd.isna(value):
+        return None
+    return value.item() if hasattr(value, "item") else value
+
+
+class WorldRefineryStore:
+    """
+    Local, indexed copy of World Refinery Data.
+
+    Parameters
+    ----------
+    path : str, optional
+        SQLite file holding the store, by default an in-memory database.
+    client : WorldRefineryData, optional
+        Client used by :meth:`update`, by default a new ``WorldRefineryData``.
+    """
+
+    def __init__(
+        self, path: str = ":memory:", *, client: Optional[WorldRefineryData] = None
+    ) -> None:
+        self.path = path
+        self._client = client if client is not None else WorldRefineryData()
+        # one connection guarded by a lock, so an in-memory store is shared by threads
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS dataset (name TEXT PRIMARY KEY,"
+                " key TEXT NOT NULL, roles TEXT NOT NULL, updated TEXT NOT NULL)"
+            )
+            # latest ModifiedDate downloaded per dataset and set of update filters
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS watermark (dataset TEXT NOT NULL,"
+                " filters TEXT NOT NULL, modified TEXT NOT NULL,"
+                " PRIMARY KEY (dataset, filters))"
+            )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "WorldRefineryStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _meta(self, dataset: str) -> Optional[Tuple[List[str], Dict[str, str]]]:
+        row = self._conn.execute(
+            "SELECT key, roles FROM dataset WHERE name = ?", (dataset,)
+        ).fetchone()
+        return None if row is None else (json.loads(row[0]), json.loads(row[1]))
+
+    def _columns(self, dataset: str) -> List[str]:
+        rows = self._conn.execute(f"PRAGMA table_info({_quote(dataset)})")
+        return [row[1] for row in rows]
+
+    def ingest(self, dataset: Dataset, df: DataFrame, *, replace: bool = False) -> int:
+        """
+        Add rows as returned by the matching ``WorldRefineryData`` method.
+
+        Rows replace the stored row with the same id, e.g. ``CapacityId``. Datasets
+        without an id column are keyed on refinery, period, process unit, product
+        and owner, whichever of them they have. ``replace`` drops every stored row
+        first. Returns the number of rows written.
+        """
+        if dataset not in _METHODS:
+            raise ValueError(f"Unknown dataset {dataset!r}, one of {list(_METHODS)}")
+        table = _quote(dataset)
+        columns = [str(c) for c in df.columns]
+        if not columns:
+            return 0
+        roles = {
+            role: next(c for c in candidates if c in columns)
+            for role, candidates in _ROLES.items()
+            if any(c in columns for c in candidates)
+        }
+        row_id = next((c for c in _ROW_IDS[dataset] if c in columns), None)
+        key = [row_id] if row_id else [roles[r] for r in _NATURAL_KEY if r in roles]
+        rows = [tuple(map(_cell, row)) for row in df.itertuples(index=False)]
+
+        with self._lock, self._conn:
+            conn = self._conn
+            meta = self._meta(dataset)
+            if meta is not None and not replace:
+                # keep the key and roles picked by the first load
+                key = meta[0] if set(meta[0]) <= set(columns) else key
+                roles = {**roles, **meta[1]}
+            if not key:
+                raise ValueError(f"No column identifies the rows of {dataset!r}")
+            at = [columns.index(c) for c in key]
+            keys = [tuple(row[i] for i in at) for row in rows]
+            if len(set(keys)) != len(keys):
+                raise ValueError(f"{key} do not identify the rows of {dataset!r}")
+
+            if replace:
+                conn.execute(f"DROP TABLE IF EXISTS {table}")
+                conn.execute("DELETE FROM watermark WHERE dataset = ?", (dataset,))
+            existing = self._columns(dataset)
+            if not existing:
+                conn.execute(
+                    f"CREATE TABLE {table} ({', '.join(map(_quote, columns))})"
+                )
+            for column in columns:
+                if existing and column not in existing:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN {_quote(column)}")
+            self._index(dataset, key, roles)
+            conn.execute(
+                "INSERT OR REPLACE INTO dataset VALUES (?, ?, ?, ?)",
+                (
+                    dataset,
+                    json.dumps(key),
+                    json.dumps(roles),
+                    _stamp(pd.Timestamp.now("UTC")),
+                ),
+            )
+            if not rows:
+                return 0
+
+            # IS also matches keys with missing parts, which UNIQUE lets through
+            matches = " AND ".join(f"{_quote(c)} IS ?" for c in key)
+            conn.executemany(f"DELETE FROM {table} WHERE {matches}", keys)
+            marks = ", ".join("?" * len(columns))
+            conn.executemany(
+                f"INSERT INTO {table} ({', '.join(map(_quote, columns))})"
+                f" VALUES ({marks})",
+                rows,
+            )
+        return len(rows)
+
+    def _index(self, dataset: str, key: List[str], roles: Dict[str, str]) -> None:
+        table = _quote(dataset)
+        self._conn.execute(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS {_quote(dataset + '_key')}"
+            f" ON {table} ({', '.join(map(_quote, key))})"
+        )
+        # joins look rows up by refinery and period, filters by the other roles
+        period = [roles[r] for r in ("refinery", "year", "quarter") if r in roles]
+        indexes = [("period", period)] + [
+            (role, [roles[role]])
+            for role in ("year", "country", "process_unit", "owner")
+            if role in roles
+        ]
+        if "ModifiedDate" in self._columns(dataset):
+            indexes.append(("modified", ["ModifiedDate"]))
+        for name, columns in indexes:
+            if columns:
+                self._conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {_quote(f'{dataset}_{name}')}"
+                    f" ON {table} ({', '.join(map(_quote, columns))})"
+                )
+
+    def last_modified(self, dataset: Dataset, **filters: Any) -> Optional[pd.Timestamp]:
+        """
+        Latest ``ModifiedDate`` downloaded by :meth:`update` with these ``filters``.
+
+        ``None`` when the dataset was never updated with exactly these filters.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT modified FROM watermark WHERE dataset = ? AND filters = ?",
+                (dataset, _scope(filters)),
+            ).fetchone()
+        return pd.Timestamp(row[0], tz="UTC") if row else None
+
+    def _advance(self, dataset: str, filters: Dict[str, Any], df: DataFrame) -> None:
+        if "ModifiedDate" not in df.columns or df["ModifiedDate"].isna().all():
+            return
+        newest = _stamp(df["ModifiedDate"].max())
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO watermark VALUES (?, ?, ?)"
+                " ON CONFLICT (dataset, filters)"
+                " DO UPDATE SET modified = MAX(modified, excluded.modified)",
+                (dataset, _scope(filters), newest),
+            )
+
+    def update(
+        self,
+        datasets: Optional[Sequence[Dataset]] = None,
+        *,
+        full: bool = False,
+        max_workers: Optional[int] = None,
+        **filters: Any,
+    ) -> Dict[str, int]:
+        """
+        Download the datasets in parallel and ingest them.
+
+        An update only downloads rows modified since the last update made with the
+        same ``filters``. The first update with a set of filters downloads every
+        row matching them. Rows deleted upstream are only dropped by a ``full``
+        reload.
+
+        Parameters
+        ----------
+        datasets : list of str, optional
+            Datasets to update, by default all of them.
+        full : bool, optional
+            Download everything and replace the stored rows, by default False.
+        max_workers : int, optional
+            Datasets downloaded at once, by default ``config.parallelism``.
+        filters
+            Passed to every ``WorldRefineryData`` method, e.g. ``year_gte=2020``.
+
+        Returns
+        -------
+        dict
+            Rows written per dataset.
+        """
+        names = list(datasets) if datasets is not None else list(_METHODS)
+
+        def download(dataset: str) -> DataFrame:
+            kwargs = dict(filters)
+            since = (
+                None if full else self.last_modified(cast(Dataset, dataset), **filters)
+            )
+            if since is not None:
+                modified = f"ModifiedDate gt {since.strftime('%Y-%m-%dT%H:%M:%SZ')}"
+                if kwargs.get("filter_exp"):
+                    modified = f"{modified} AND ({kwargs['filter_exp']})"
+                kwargs["filter_exp"] = modified
+            method = getattr(self._client, _METHODS[dataset])
+            return cast(DataFrame, method(paginate=True, **kwargs))
+
+        level = explicit_priority()
+        workers = max_workers or config.parallelism
+        with priority(Priority.BULK if level is None else level):
+            with ThreadPoolExecutor(max_workers=min(workers, len(names))) as executor:
+                futures = [
+                    executor.submit(copy_context().run, download, name)
+                    for name in names
+                ]
+                frames = [future.result() for future in futures]
+        written = {}
+        for name, df in zip(names, frames):
+            written[name] = self.ingest(cast(Dataset, name), df, replace=full)
+            self._advance(name, filters, df)
+        return written
+
+    def _where(
+        self,
+        aliases: Dict[str, Tuple[str, Dict[str, str]]],
+        filters: Dict[str, Any],
+    ) -> Tuple[List[str], List[Any]]:
+        """SQL conditions on the first of ``aliases`` having each filtered role."""
+        clauses: List[str] = []
+        params: List[Any] = []
+        for name, value in filters.items():
+            if value is None:
+                continue
+            role, op = name, "IN"
+            for suffix, comparison in _RANGES.items():
+                if name.endswith(suffix):
+                    role, op = name[: -len(suffix)], comparison
+                    break
+            if role not in _ROLES:
+                raise ValueError(f"Cannot filter on {name!r}, one of {list(_ROLES)}")
+            column = next(
+                (
+                    f"{alias}.{_quote(roles[role])}"
+                    for alias, (_, roles) in aliases.items()
+                    if role in roles
+                ),
+                None,
+            )
+            if column is None:
+                raise ValueError(f"None of the datasets has a {role} column")
+            if op != "IN":
+                clauses.append(f"{column} {op} ?")
+                params.append(value)
+            else:
+                values = [value] if isinstance(value, (str, int)) else list(value)
+                clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+                params.extend(values)
+        return clauses, params
+
+    @staticmethod
+    def _to_df(cursor: sqlite3.Cursor) -> DataFrame:
+        columns = [d[0] for d in cursor.description]
+        df = DataFrame.from_records(cursor.fetchall(), columns=columns)
+        for column in df.columns:
+            # joins prefix clashing columns with their dataset
+            prefix, _, rest = str(column).partition(".")
+            if (rest if prefix in _METHODS else column) in _DATE_COLUMNS:
+                df[column] = pd.to_datetime(df[column], format=_TIME_FORMAT, utc=True)
+        return df
+
+    def _dataset(self, dataset: str) -> Tuple[List[str], Dict[str, str]]:
+        meta = self._meta(dataset)
+        if meta is None:
+            raise ValueError(f"{dataset!r} has not been loaded, call update() first")
+        return meta
+
+    def table(self, dataset: Dataset, **filters: Any) -> DataFrame:
+        """
+        Stored rows of one dataset, by refinery and period.
+
+        ``filters`` restrict a role to a value or a list of values: ``refinery``,
+        ``year``, ``quarter``, ``country``, ``process_unit``, ``owner`` or
+        ``product``. Suffixes ``_gt``, ``_gte``, ``_lt`` and ``_lte`` compare
+        instead, e.g. ``year_gte``.
+        """
+        with self._lock:
+            key, roles = self._dataset(dataset)
+            clauses, params = self._where({"t0": (dataset, roles)}, filters)
+            where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+            order = [roles[r] for r in ("refinery", "year", "quarter") if r in roles]
+            order += [c for c in key if c not in order]
+            order_by = f" ORDER BY {', '.join(map(_quote, order))}" if order else ""
+            cursor = self._conn.execute(
+                f"SELECT * FROM {_quote(dataset)} AS t0{where}{order_by}", params
+            )
+            return self._to_df(cursor)
+
+    def join(
+        self,
+        *datasets: Dataset,
+        on: Sequence[str] = ("refinery", "year", "quarter"),
+        how: Literal["inner", "left"] = "inner",
+        **filters: Any,
+    ) -> DataFrame:
+        """
+        Join datasets on refinery and period with SQL.
+
+        Parameters
+        ----------
+        datasets : str
+            Datasets to join, e.g. ``"capacity", "runs"``. Each one is joined to the
+            first on the roles of ``on`` that both of them have.
+        on : list of str, optional
+            Roles to join on, by default refinery, year and quarter. ``country``,
+            ``process_unit`` and ``owner`` may be added.
+        how : {"inner", "left"}, optional
+            Keep only matching rows, or every row of the first dataset.
+        filters
+            Restrict the rows as in :meth:`table`.
+
+        Returns
+        -------
+        DataFrame
+            The join roles under ``RefineryId``, ``Year``, ``Quarter``..., then the
+            other columns of each dataset. Columns found in several datasets are
+            prefixed with the dataset name from their second occurrence on.
+        """
+        if len(datasets) < 2:
+            raise ValueError("join() needs at least two datasets")
+        with self._lock:
+            aliases = {
+                f"t{i}": (dataset, self._dataset(dataset)[1])
+                for i, dataset in enumerate(datasets)
+            }
+            first, (_, base) = next(iter(aliases.items()))
+            keys = [role for role in on if role in base]
+            select = [
+                f"{first}.{_quote(base[role])} AS {_quote(_ROLE_NAMES[role])}"
+                for role in keys
+            ]
+            seen = set(_ROLE_NAMES[role] for role in keys)
+            joins = []
+            for alias, (dataset, roles) in aliases.items():
+                shared = [role for role in keys if role in roles]
+                if alias != first:
+                    if not shared:
+                        raise ValueError(f"{dataset!r} has none of the roles {keys}")
+                    condition = " AND ".join(
+                        f"{alias}.{_quote(roles[r])} = {first}.{_quote(base[r])}"
+                        for r in shared
+                    )
+                    joins.append(
+                        f" {how.upper()} JOIN {_quote(dataset)} AS {alias}"
+                        f" ON {condition}"
+                    )
+                skip = {roles[role] for role in shared}
+                for column in self._columns(dataset):
+                    if column in skip:
+                        continue
+                    name = column if column not in seen else f"{dataset}.{column}"
+                    seen.add(name)
+                    select.append(f"{alias}.{_quote(column)} AS {_quote(name)}")
+
+            clauses, params = self._where(aliases, filters)
+            where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+            query = (
+                f"SELECT {', '.join(select)} FROM {_quote(datasets[0])} AS {first}"
+                f"{''.join(joins)}{where}"
+            )
+            if keys:
+                query += f" ORDER BY {', '.join(str(i + 1) for i in range(len(keys)))}"
+            return self._to_df(self._conn.execute(query, params))
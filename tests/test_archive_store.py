@@ -0,0 +1,188 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import warnings
+from unittest.mock import Mock
+
+import pandas as pd
+from pandas import DataFrame
+from spgci.archive_store import ArchiveSource, ArchiveVintageStore
+
+_DATES = ["2026-01-01", "2026-02-01", "2026-03-01"]
+
+
+def _prices(modified_date, category_id, paginate):
+    # every vintage publishes the same points, only the latest one revises a price
+    month = pd.Timestamp(modified_date).month
+    return DataFrame(
+        {
+            "priceSymbol": ["AAA", "AAA", "BBB"],
+            "year": [2027, 2028, 2027],
+            "modifiedDate": pd.Timestamp(modified_date),
+            "value": [10.0, 11.0, 20.0 if month < 3 else 21.5],
+        }
+    )
+
+
+def _epf_client(dates=_DATES, fetch=_prices):
+    client = Mock()
+    client.get_archive_dates.return_value = DataFrame(
+        {
+            "modifiedDate": pd.to_datetime(dates),
+            "categoryId": 1,
+            "categoryName": "Oil",
+        }
+    )
+    client.get_prices_shortterm_archive.side_effect = fetch
+    return client
+
+
+class ArchiveVintageStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.store = ArchiveVintageStore()
+        self.client = _epf_client()
+        self.source = ArchiveSource.epf("short", "Oil", client=self.client)
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_only_deltas_are_stored(self):
+        self.assertEqual(self.store.sync(self.source), 3)
+
+        vintages = self.store.vintages(self.source)
+        self.assertEqual(vintages["rows"].tolist(), [3, 3, 3])
+        self.assertEqual(vintages["deltas"].tolist(), [3, 0, 1])
+        self.assertEqual(self.client.get_prices_shortterm_archive.call_count, 3)
+
+        # a second sync has nothing left to download
+        self.assertEqual(self.store.sync(self.source), 0)
+        self.assertEqual(self.client.get_prices_shortterm_archive.call_count, 3)
+
+    def test_snapshot_and_compare(self):
+        self.store.sync(self.source)
+
+        latest = self.store.snapshot(self.source, priceSymbol="BBB")
+        earlier = self.store.snapshot(self.source, as_of="2026-02-15")
+        self.assertEqual(latest["value"].tolist(), [21.5])
+        self.assertEqual(sorted(earlier["value"]), [10.0, 11.0, 20.0])
+
+        diff = self.store.compare(self.source, "2026-01-01", "2026-03-01")
+        changed = diff[diff["change"] != 0]
+        self.assertEqual(changed["priceSymbol"].tolist(), ["BBB"])
+        self.assertEqual(changed["change"].tolist(), [1.5])
+
+    def test_revisions(self):
+        self.store.sync(self.source)
+
+        revisions = self.store.revisions(self.source, priceSymbol="BBB")
+        self.assertEqual(revisions["status"].tolist(), ["added", "revised"])
+        self.assertEqual(revisions["previous"].tolist()[1], 20.0)
+        self.assertEqual(revisions["change"].tolist()[1], 1.5)
+        self.assertEqual(
+            revisions["modifiedDate"].tolist(), list(pd.to_datetime(_DATES[::2]))
+        )
+
+    def test_backfilled_vintage_rewrites_the_next_deltas(self):
+        self.store.sync(self.source, latest=1)
+        self.assertEqual(self.store.vintages(self.source)["deltas"].tolist(), [3])
+
+        self.assertEqual(self.store.sync(self.source), 2)
+        self.assertEqual(self.store.vintages(self.source)["deltas"].tolist(), [3, 0, 1])
+        self.assertEqual(len(self.store.snapshot(self.source)), 3)
+
+    def test_reingested_vintage_keeps_its_id_and_deltas(self):
+        self.store.sync(self.source)
+        ids = self.store._conn.execute("SELECT id FROM vintage ORDER BY id").fetchall()
+
+        vintage = self.source.list_vintages().iloc[1].to_dict()
+        rows = _prices(_DATES[1], 1, True).assign(value=[10.0, 11.0, 25.0])
+        self.assertEqual(self.store.ingest(self.source, vintage, rows), 1)
+
+        self.assertEqual(
+            self.store._conn.execute("SELECT id FROM vintage ORDER BY id").fetchall(),
+            ids,
+        )
+        orphans = self.store._conn.execute(
+            "SELECT COUNT(*) FROM delta WHERE vintage NOT IN (SELECT id FROM vintage)"
+        ).fetchone()[0]
+        self.assertEqual(orphans, 0)
+        self.assertEqual(self.store.vintages(self.source)["deltas"].tolist(), [3, 1, 1])
+        february = self.store.snapshot(self.source, as_of=_DATES[1], priceSymbol="BBB")
+        self.assertEqual(february["value"].tolist(), [25.0])
+        self.assertEqual(
+            self.store.snapshot(self.source, priceSymbol="BBB")["value"].tolist(),
+            [21.5],
+        )
+
+    def test_removed_points(self):
+        def fetch(modified_date, category_id, paginate):
+            rows = _prices(modified_date, category_id, paginate)
+            return rows[:2] if modified_date.month == 2 else rows
+
+        source = ArchiveSource.epf("short", client=_epf_client(fetch=fetch))
+        self.store.sync(source)
+
+        revisions = self.store.revisions(source, priceSymbol="BBB")
+        self.assertEqual(revisions["status"].tolist(), ["added", "removed", "added"])
+        self.assertEqual(len(self.store.snapshot(source, as_of="2026-02-01")), 2)
+
+    def test_failed_vintages_are_skipped(self):
+        def fetch(modified_date, category_id, paginate):
+            if modified_date.month == 2:
+                raise ConnectionError("boom")
+            return _prices(modified_date, category_id, paginate)
+
+        source = ArchiveSource.epf("short", client=_epf_client(fetch=fetch))
+        with self.assertRaises(ConnectionError):
+            self.store.sync(source, max_workers=1)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            self.store.sync(source, errors="skip")
+        self.assertEqual(len(caught), 1)
+        self.assertEqual(len(self.store.vintages(source)), 2)
+
+    def test_duplicate_keys_are_rejected(self):
+        source = ArchiveSource(
+            name="dupes",
+            list_vintages=lambda: DataFrame({"scenarioId": [1]}),
+            fetch=lambda vintage: DataFrame({"region": ["A", "A"], "value": [1, 2]}),
+            vintage_columns=("scenarioId",),
+            order_by="scenarioId",
+        )
+        with self.assertRaises(ValueError):
+            self.store.sync(source)
+
+    def test_scenario_archive(self):
+        client = Mock()
+        client.get_reference_data.return_value = DataFrame(
+            {"scenarioId": [7, 3], "scenarioName": ["b", "a"]}
+        )
+        client.get_production_archive.side_effect = (
+            lambda scenario_id, paginate, scenario_term_id: DataFrame(
+                {
+                    "country": ["X"],
+                    "scenarioId": [scenario_id],
+                    "value": [float(scenario_id)],
+                }
+            )
+        )
+        source = ArchiveSource.wos(client=client)
+        self.store.sync(source)
+
+        self.assertEqual(self.store.vintages(source)["scenarioId"].tolist(), [3, 7])
+        revisions = self.store.revisions(source)
+        self.assertEqual(revisions["change"].tolist()[1], 4.0)
+        self.assertEqual(self.store.snapshot(source, as_of=5)["value"].tolist(), [3.0])
@@ -14,7 +14,13 @@
 
 import unittest
 import os
+import base64
+import json
+import tempfile
+import time
+from unittest.mock import patch
 from spgci.api_client import get_token
+from spgci import auth, config
 from spgci.exceptions import AuthError
 from spgci import set_credentials, MarketData
 import pytest
@@ -43,3 +49,67 @@ class AuthTest(unittest.TestCase):
         set_credentials("un", "pw", "key")
         with pytest.raises(AuthError):
             cast(DataFrame, MarketData().get_mdcs())
+
+
+def _jwt(exp: float) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode()
+    return f"header.{payload.rstrip('=')}.signature"
+
+
+class TokenManagerTest(unittest.TestCase):
+    def test_jwt_expiry(self):
+        self.assertEqual(auth._jwt_expiry(_jwt(1700000000)), 1700000000)
+        self.assertIsNone(auth._jwt_expiry("not-a-jwt"))
+
+    def test_cached_until_stale(self):
+        manager = auth.TokenManager()
+        tokens = iter([_jwt(time.time() + 3600), _jwt(time.time() + 7200)])
+
+        def fetch(*args):
+            return auth._Token.issue(next(tokens), None)
+
+        with patch.object(auth, "_fetch_token", side_effect=fetch):
+            t1 = manager.get("un", "pw", "url")
+            self.assertEqual(t1, manager.get("un", "pw", "url"))
+            t2 = manager.get("un", "pw", "url", stale=t1)
+            self.assertNotEqual(t1, t2)
+            self.assertEqual(t2, manager.get("un", "pw", "url", stale=t1))
+
+    def test_refreshes_in_background_before_expiry(self):
+        manager = auth.TokenManager()
+        manager._tokens[("un", "pw", "url")] = auth._Token(
+            "old", time.time() + 60, time.time() - 1
+        )
+        fresh = auth._Token.issue("new", time.time() + 3600)
+        with patch.object(auth, "_fetch_token", return_value=fresh):
+            self.assertEqual(manager.get("un", "pw", "url"), "old")
+            for _ in range(50):
+                if not manager._refreshing:
+                    break
+                time.sleep(0.01)
+            self.assertEqual(manager.get("un", "pw", "url"), "new")
+
+    def test_token_shared_between_managers(self):
+        with tempfile.TemporaryDirectory() as tmp, patch.object(
+            config, "token_cache_path", os.path.join(tmp, "tokens.json")
+        ):
+            fresh = auth._Token.issue("shared", time.time() + 3600)
+            with patch.object(auth, "_fetch_token", return_value=fresh) as fetch:
+                self.assertEqual(auth.TokenManager().get("un", "pw", "url"), "shared")
+                self.assertEqual(auth.TokenManager().get("un", "pw", "url"), "shared")
+            self.assertEqual(fetch.call_count, 1)
+
+    def test_cache_clear_forces_refresh(self):
+        tokens = iter(["first", "second"])
+
+        def fetch(*args):
+            return auth._Token.issue(next(tokens), time.time() + 3600)
+
+        with tempfile.TemporaryDirectory() as tmp, patch.object(
+            config, "token_cache_path", os.path.join(tmp, "tokens.json")
+        ), patch.object(auth, "_fetch_token", side_effect=fetch):
+            self.assertEqual(get_token("un", "pw", "url"), "first")
+            self.assertEqual(get_token("un", "pw", "url"), "first")
+            get_token.cache_clear()
+            self.assertEqual(get_token("un", "pw", "url"), "second")
+            get_token.cache_clear()
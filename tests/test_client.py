@@ -15,8 +15,15 @@
 import unittest
 import pytest
 import asyncio
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from unittest.mock import Mock, patch
 from pandas import DataFrame, Series
-from spgci import MarketData
+from spgci import MarketData, api_client, config
+from spgci.exceptions import DailyLimitError, PaginationError
 from typing import cast
 
 
@@ -49,3 +56,123 @@ class APIClientTest(unittest.TestCase):
 
         result = asyncio.run(call_api())
         self.assertEqual(len(result), 60)
+
+
+class SingleFlightTest(unittest.TestCase):
+    def test_concurrent_identical_gets_share_one_call(self):
+        calls = []
+        gate = threading.Event()
+
+        def fake_get(url, params, session):
+            calls.append(url)
+            gate.wait(5)
+            return "response"
+
+        with patch.object(api_client, "_get_once", side_effect=fake_get):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [
+                    executor.submit(
+                        api_client._get, "https://x/y", {"a": 1}, api_client._session
+                    )
+                    for _ in range(4)
+                ]
+                time.sleep(0.2)
+                gate.set()
+                results = [f.result() for f in futures]
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["response"] * 4)
+
+    def test_requests_with_different_tokens_are_not_shared(self):
+        calls = []
+        started = threading.Barrier(2)
+        results = {}
+
+        def fake_get(url, params, session):
+            calls.append(config.get_token())
+            started.wait(5)
+            return config.get_token()
+
+        def get(token):
+            config.set_token(token)
+            results[token] = api_client._get(
+                "https://x/y", {"a": 1}, api_client._session
+            )
+
+        with patch.object(api_client, "_get_once", side_effect=fake_get):
+            threads = [threading.Thread(target=get, args=(t,)) for t in ("a", "b")]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(5)
+
+        self.assertEqual(sorted(calls), ["a", "b"])
+        self.assertEqual(results, {"a": "a", "b": "b"})
+
+    def test_fn_key_equal_for_equivalent_partials(self):
+        def to_df(resp, strip_html):
+            return resp
+
+        self.assertEqual(
+            api_client._fn_key(partial(to_df, strip_html=True)),
+            api_client._fn_key(partial(to_df, strip_html=True)),
+        )
+        self.assertNotEqual(
+            api_client._fn_key(partial(to_df, strip_html=True)),
+            api_client._fn_key(partial(to_df, strip_html=False)),
+        )
+
+
+class PaginationCancelTest(unittest.TestCase):
+    def test_failed_page_cancels_the_remaining_pages(self):
+        requested = []
+
+        def get(url, params, **kwargs):
+            page = params.get("page", 1)
+            requested.append(page)
+            time.sleep(0.01)
+            response = Mock(
+                status_code=200, headers={"content-type": "application/json"}
+            )
+            if page == 3:
+                response.status_code = 429
+                response.headers = {"x-ratelimit-remaining-day": "0"}
+            response.json.return_value = {
+                "results": [{"page": page}],
+                "metadata": {"totalPages": 40},
+            }
+            return response
+
+        with patch.object(config, "get_token", return_value="token"), patch.object(
+            config, "parallelism", 2
+        ), patch.object(config, "single_flight", False), patch.object(
+            api_client._session, "get", side_effect=get
+        ):
+            with self.assertRaises(PaginationError) as raised:
+                api_client.get_data("x", {}, paginate=True)
+
+        error = raised.exception
+        self.assertIsInstance(error.__cause__, DailyLimitError)
+        # handlers of the page's own error still catch it
+        self.assertIsInstance(error, DailyLimitError)
+        self.assertEqual(error.failed_page, 3)
+        self.assertIn(1, error.pages)
+        self.assertNotIn(3, error.pages)
+        self.assertEqual(error.partial()["page"].tolist(), sorted(error.pages))
+        self.assertEqual(len(error.missing_pages), 40 - len(error.pages))
+        time.sleep(0.1)
+        # at most the page running next to the failed one, nothing queued after it
+        self.assertLess(len(requested), 6)
+
+    def test_wrapped_errors_can_be_pickled(self):
+        pages = {1: DataFrame({"page": [1]})}
+        for error in (
+            PaginationError.wrap(2, 3, pages, DailyLimitError("limit")),
+            PaginationError(2, 3, pages, ValueError("bad")),
+        ):
+            restored = pickle.loads(pickle.dumps(error))
+
+            self.assertIs(type(restored), type(error))
+            self.assertEqual(str(restored), str(error))
+            self.assertEqual(restored.missing_pages, [2, 3])
+            self.assertEqual(restored.partial()["page"].tolist(), [1])
@@ -0,0 +1,105 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gzip
+import io
+import json
+import unittest
+from unittest.mock import patch
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from spgci import api_client, compression, config
+from spgci.jsonstream import read_frame
+from urllib3 import HTTPResponse
+
+BODY = json.dumps(
+    {
+        "metadata": {"totalPages": 1},
+        "results": [{"symbol": f"PCA{i:05d}", "value": i % 97} for i in range(2000)],
+    }
+).encode()
+
+
+def _gzipped(url="https://api.example/x"):
+    wire = gzip.compress(BODY)
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.url = url
+    resp.headers = CaseInsensitiveDict(
+        {"content-type": "application/json", "content-encoding": "gzip"}
+    )
+    resp.raw = HTTPResponse(
+        body=io.BytesIO(wire),
+        headers=dict(resp.headers),
+        status=200,
+        preload_content=False,
+        decode_content=True,
+    )
+    return resp, len(wire)
+
+
+class AcceptEncodingTest(unittest.TestCase):
+    def test_offers_what_can_be_decoded_best_first(self):
+        offered = compression.supported()
+        self.assertIn("gzip", offered)
+        self.assertEqual(
+            list(offered), sorted(offered, key=compression._PREFERENCE.index)
+        )
+        self.assertEqual(compression.accept_encoding(), ", ".join(offered))
+
+        with patch.object(config, "accept_encoding", "identity"):
+            self.assertEqual(compression.accept_encoding(), "identity")
+
+    def test_requests_send_the_header(self):
+        resp, _ = _gzipped()
+        with patch.object(config, "get_token", return_value="token"), patch.object(
+            api_client._session, "get", return_value=resp
+        ) as get:
+            api_client._get_once("https://api.example/x", {}, api_client._session)
+
+        headers = get.call_args.kwargs["headers"]
+        self.assertEqual(headers["Accept-Encoding"], compression.accept_encoding())
+
+
+class TransferLogTest(unittest.TestCase):
+    def test_records_wire_and_decoded_bytes_once(self):
+        log = compression.TransferLog()
+        resp, wire = _gzipped()
+
+        self.assertEqual(json.loads(resp.content), json.loads(BODY))
+        log.observe(resp)
+        log.observe(resp)
+
+        stats = log.stats()
+        self.assertEqual(stats["requests"], 1)
+        self.assertEqual(stats["wire_bytes"], wire)
+        self.assertEqual(stats["decoded_bytes"], len(BODY))
+        self.assertGreater(stats["saved"], 0.5)
+        self.assertEqual(list(stats["by_encoding"]), ["gzip"])
+        self.assertEqual(log.recent()[0]["url"], "https://api.example/x")
+
+    def test_streamed_bodies_are_counted_as_they_are_parsed(self):
+        compression.reset()
+        self.addCleanup(compression.reset)
+        resp, wire = _gzipped()
+        resp.headers["transfer-encoding"] = "chunked"
+
+        df = read_frame(resp, chunk_rows=500)
+
+        self.assertEqual(len(df), 2000)
+        entry = compression.recent()[-1]
+        self.assertEqual(
+            (entry["wire_bytes"], entry["decoded_bytes"]), (wire, len(BODY))
+        )
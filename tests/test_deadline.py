@@ -0,0 +1,79 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from spgci import api_client, config, deadline, quota
+from spgci.exceptions import DeadlineExceededError, PaginationError
+from spgci.utilities import parallel
+
+
+def _slow_pages(total_pages, seconds):
+    def get(url, params, **kwargs):
+        time.sleep(seconds)
+        response = Mock(status_code=200, headers={"content-type": "application/json"})
+        response.json.return_value = {
+            "results": [{"page": params.get("page", 1)}],
+            "metadata": {"totalPages": total_pages},
+        }
+        return response
+
+    return get
+
+
+class DeadlineTest(unittest.TestCase):
+    def test_nested_blocks_keep_the_earliest_deadline(self):
+        self.assertIsNone(deadline.remaining())
+        with deadline.within(1):
+            with deadline.within(60):
+                self.assertLessEqual(deadline.remaining(), 1)
+                self.assertLessEqual(api_client._request_timeout_seconds(), 1)
+            with deadline.within(0):
+                with self.assertRaises(DeadlineExceededError):
+                    deadline.check()
+        self.assertIsNone(deadline.remaining())
+
+    def test_paginated_call_stops_with_the_pages_it_fetched(self):
+        start = time.monotonic()
+        with patch.object(config, "get_token", return_value="token"), patch.object(
+            config, "parallelism", 2
+        ), patch.object(api_client._session, "get", side_effect=_slow_pages(100, 0.05)):
+            with self.assertRaises(PaginationError) as raised:
+                api_client.get_data("x", {}, paginate=True, timeout_total=0.4)
+
+        self.assertLess(time.monotonic() - start, 1)
+        error = raised.exception
+        self.assertIsInstance(error.__cause__, DeadlineExceededError)
+        self.assertIsInstance(error, DeadlineExceededError)
+        self.assertGreater(len(error.pages), 1)
+        self.assertLess(len(error.pages), 100)
+
+    def test_parallel_returns_once_the_budget_is_spent(self):
+        start = time.monotonic()
+        with self.assertRaises(DeadlineExceededError):
+            parallel(lambda: 1, lambda: time.sleep(2), timeout_total=0.2)
+        self.assertLess(time.monotonic() - start, 1)
+
+        self.assertEqual(parallel(lambda: 1, lambda: 2, timeout_total=5), (1, 2))
+
+    def test_rate_limit_wait_beyond_the_deadline_is_not_taken(self):
+        coordinator = quota.QuotaCoordinator(per_second=1)
+        coordinator.acquire()
+        with deadline.within(0.2):
+            with self.assertRaises(DeadlineExceededError):
+                coordinator.acquire()
+        # the slot given up is still free for the next caller
+        self.assertLess(coordinator.acquire(), 1.1)
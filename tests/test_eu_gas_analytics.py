@@ -0,0 +1,91 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import queue
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pandas as pd
+from pandas import DataFrame
+from spgci.eu_gas_analytics import EUGasFlowTail
+
+T0 = datetime(2026, 3, 1, 6, tzinfo=timezone.utc)
+
+
+def _rows(*rows):
+    return DataFrame(
+        [
+            {
+                "id": i,
+                "value": v,
+                "modifiedDate": pd.Timestamp(T0 + timedelta(minutes=m)),
+            }
+            for i, v, m in rows
+        ]
+    )
+
+
+class EUGasFlowTailTest(unittest.TestCase):
+    def test_pushes_only_new_and_revised_rows(self):
+        client = Mock()
+        client.get_hourly_nomination.side_effect = [
+            _rows((1, 10.0, 1), (2, 20.0, 2)),
+            # overlap from the lookback window plus one revision and one new row
+            _rows((1, 10.0, 1), (2, 20.0, 2), (2, 21.0, 3), (3, 30.0, 3)),
+            _rows((2, 21.0, 3), (3, 30.0, 3)),
+        ]
+        pushed = queue.Queue()
+        tail = EUGasFlowTail(
+            ["hourly_nomination"],
+            queue=pushed,
+            since=T0,
+            lookback=timedelta(minutes=10),
+            client=client,
+        )
+
+        first = tail.poll()["hourly_nomination"]
+        second = tail.poll()["hourly_nomination"]
+        third = tail.poll()["hourly_nomination"]
+
+        self.assertEqual(first["id"].tolist(), [1, 2])
+        self.assertEqual(second["value"].tolist(), [21.0, 30.0])
+        self.assertTrue(third.empty)
+        self.assertEqual(pushed.qsize(), 2)
+        self.assertEqual(
+            tail.watermarks["hourly_nomination"],
+            pd.Timestamp(T0 + timedelta(minutes=3)),
+        )
+
+        since = client.get_hourly_nomination.call_args.kwargs["modified_date_gte"]
+        self.assertEqual(since, (T0 - timedelta(minutes=7)).isoformat())
+
+    def test_failed_delivery_is_retried(self):
+        client = Mock()
+        client.get_instant_flow.return_value = _rows((1, 10.0, 1))
+        callback = Mock(side_effect=[RuntimeError("down"), None])
+        tail = EUGasFlowTail(
+            ["instant_flow"], callback=callback, since=T0, client=client
+        )
+
+        with self.assertRaises(RuntimeError):
+            tail.poll()
+        self.assertEqual(tail.poll()["instant_flow"]["id"].tolist(), [1])
+        self.assertEqual(
+            tail.watermarks["instant_flow"], pd.Timestamp(T0 + timedelta(minutes=1))
+        )
+
+    def test_rejects_unknown_sources(self):
+        with self.assertRaises(ValueError):
+            EUGasFlowTail(["storage"], client=Mock())
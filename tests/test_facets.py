@@ -0,0 +1,138 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest.mock import Mock, patch
+
+from pandas import DataFrame
+import spgci.config as config
+from spgci import facets, weather
+from spgci.facets import FacetCatalogue, parse_filter
+from spgci.weather import Weather
+
+CITIES = DataFrame(
+    {
+        "market": ["United States", "United States", "France", "France"],
+        "city": ["Boston", "Chicago", "Paris", "Lyon"],
+        "location": ["BOS", "ORD", "CDG", "LYS"],
+        "stations": [1, 2, 3, 4],
+    }
+)
+
+
+class ParseFilterTest(unittest.TestCase):
+    def test_reads_platts_and_odata_terms(self):
+        self.assertEqual(
+            parse_filter('market: "France" AND city in ("Paris","Lyon")'),
+            {"market": {"France"}, "city": {"Paris", "Lyon"}},
+        )
+        self.assertEqual(
+            parse_filter("country eq 'Cote d''Ivoire' and year in (2025,2026)"),
+            {"country": {"Cote d'Ivoire"}, "year": {2025, 2026}},
+        )
+        self.assertEqual(parse_filter(None), {})
+
+    def test_rejects_other_filters(self):
+        self.assertIsNone(parse_filter('market: "France" OR market: "Spain"'))
+        self.assertIsNone(parse_filter('date >= "2026-01-01"'))
+
+
+class FacetCatalogueTest(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(config, "facet_ttl", 900)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_answers_narrower_calls_from_a_wider_result(self):
+        catalogue = FacetCatalogue()
+        fetch = Mock(return_value=CITIES)
+        columns = ["market", "city", "location", "stations"]
+        catalogue.get("weather", columns, None, fetch)
+
+        cities = catalogue.get(
+            "weather", "market, city", 'market: "United States"', fetch
+        )
+        few = catalogue.get(
+            "weather",
+            ["city"],
+            'market: "France" AND stations in (3,9)',
+            fetch,
+        )
+        markets = catalogue.get("weather", ["market"], None, fetch)
+
+        self.assertEqual(fetch.call_count, 1)
+        self.assertEqual(cities["city"].tolist(), ["Boston", "Chicago"])
+        self.assertEqual(list(cities.columns), ["market", "city"])
+        self.assertEqual(few["city"].tolist(), ["Paris"])
+        self.assertEqual(markets["market"].tolist(), ["United States", "France"])
+        self.assertEqual(catalogue.stats(), {"hits": 0, "derived": 3, "misses": 1})
+
+    def test_results_with_other_columns_are_only_reused_as_they_are(self):
+        catalogue = FacetCatalogue()
+        fetch = Mock(return_value=CITIES)
+        catalogue.get("weather", ["market", "city", "location"], None, fetch)
+
+        catalogue.get("weather", ["city"], 'market: "France"', fetch)
+        same = catalogue.get("weather", ["market", "city", "location"], None, fetch)
+
+        self.assertEqual(fetch.call_count, 2)
+        self.assertEqual(list(same.columns), list(CITIES.columns))
+        self.assertEqual(catalogue.stats(), {"hits": 1, "derived": 0, "misses": 2})
+
+    def test_disabled_without_a_ttl(self):
+        catalogue = FacetCatalogue()
+        fetch = Mock(return_value=CITIES)
+        with patch.object(config, "facet_ttl", 0):
+            catalogue.get("weather", "city", None, fetch)
+            catalogue.get("weather", "city", None, fetch)
+
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_wider_or_unparsed_filters_go_to_the_api(self):
+        catalogue = FacetCatalogue()
+        fetch = Mock(return_value=CITIES)
+        catalogue.get("weather", ["market", "city"], 'market: "France"', fetch)
+
+        catalogue.get("weather", ["market", "city"], 'city: "Paris"', fetch)
+        catalogue.get("weather", ["market", "city"], None, fetch)
+        catalogue.get("weather", ["city"], 'city: "Paris" OR city: "Nice"', fetch)
+        catalogue.get("weather", ["city"], 'city: "Paris" OR city: "Nice"', fetch)
+
+        self.assertEqual(fetch.call_count, 4)
+        self.assertEqual(catalogue.stats(), {"hits": 1, "derived": 0, "misses": 4})
+
+    def test_results_expire(self):
+        catalogue = FacetCatalogue()
+        fetch = Mock(return_value=CITIES)
+        with patch.object(facets.time, "monotonic", side_effect=[0, 10, 100]):
+            catalogue.get("weather", "city", None, fetch, ttl=60)
+            catalogue.get("weather", "city", None, fetch, ttl=60)
+            catalogue.get("weather", "city", None, fetch, ttl=60)
+
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_prewarm_serves_client_calls(self):
+        facets.clear()
+        self.addCleanup(facets.clear)
+        columns = ["market", "city", "location"]
+        with patch.object(
+            weather, "get_data", return_value=CITIES[columns]
+        ) as get_data:
+            facets.prewarm([(Weather(), "actual", columns)])
+            df = Weather().get_unique_values(
+                "actual", "city", filter_exp='market: "France"'
+            )
+
+        self.assertEqual(get_data.call_count, 1)
+        self.assertEqual(df["city"].tolist(), ["Paris", "Lyon"])
@@ -0,0 +1,139 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from spgci import api_client, config, hedge
+from spgci.hedge import Hedger
+
+
+def _warmed(latency=0.01, samples=20):
+    hedger = Hedger()
+    for _ in range(samples):
+        hedger.call(lambda: time.sleep(latency))
+    return hedger
+
+
+def _slow_first(result="first", seconds=1.0):
+    calls = []
+
+    def send():
+        calls.append(1)
+        if len(calls) == 1:
+            time.sleep(seconds)
+            return result
+        return "hedge"
+
+    return send, calls
+
+
+class HedgerTest(unittest.TestCase):
+    def setUp(self):
+        for name, value in {"hedge_percentile": 90, "hedge_budget": 1}.items():
+            patcher = patch.object(config, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_slow_request_is_answered_by_its_hedge(self):
+        hedger = _warmed()
+        send, calls = _slow_first()
+
+        start = time.monotonic()
+        self.assertEqual(hedger.call(send), "hedge")
+        self.assertLess(time.monotonic() - start, 0.5)
+
+        stats = hedger.stats()
+        self.assertEqual(len(calls), 2)
+        self.assertEqual((stats["requests"], stats["hedged"], stats["won"]), (21, 1, 1))
+        self.assertLess(stats["delay"], 0.5)
+
+    def test_no_hedge_before_enough_latencies_are_known(self):
+        hedger = _warmed(samples=5)
+        send, calls = _slow_first(seconds=0.2)
+
+        self.assertEqual(hedger.call(send), "first")
+        self.assertEqual(len(calls), 1)
+        self.assertIsNone(hedger.stats()["delay"])
+
+    def test_no_hedge_past_the_budget_or_with_a_rate_limit_backlog(self):
+        hedger = _warmed()
+        with patch.object(config, "hedge_budget", 0):
+            send, calls = _slow_first(seconds=0.2)
+            self.assertEqual(hedger.call(send), "first")
+            self.assertEqual(len(calls), 1)
+
+        backlog = Mock()
+        backlog.usage.return_value = {"queued_seconds": 2.0, "remaining_day": None}
+        with patch.object(hedge, "get_coordinator", return_value=backlog):
+            send, calls = _slow_first(seconds=0.2)
+            self.assertEqual(hedger.call(send), "first")
+            self.assertEqual(len(calls), 1)
+        self.assertEqual(hedger.stats()["hedged"], 0)
+
+    def test_failed_hedge_leaves_the_original_answer(self):
+        hedger = _warmed()
+        calls = []
+
+        def send():
+            calls.append(1)
+            if len(calls) == 2:
+                raise ConnectionError("hedge lost")
+            time.sleep(0.2)
+            return "first"
+
+        self.assertEqual(hedger.call(send), "first")
+        self.assertEqual(hedger.stats()["won"], 0)
+
+
+class HedgedPaginationTest(unittest.TestCase):
+    def test_straggling_page_does_not_hold_up_the_call(self):
+        hedge.reset()
+        self.addCleanup(hedge.reset)
+        lock = threading.Lock()
+        seen = set()
+
+        def get(url, params, **kwargs):
+            page = params.get("page", 1)
+            with lock:
+                first_try = page not in seen
+                seen.add(page)
+            if page == 30 and first_try:
+                time.sleep(2)
+            else:
+                time.sleep(0.01)
+            response = Mock(
+                status_code=200, headers={"content-type": "application/json"}
+            )
+            response.json.return_value = {
+                "results": [{"page": page}],
+                "metadata": {"totalPages": 30},
+            }
+            return response
+
+        start = time.monotonic()
+        with patch.object(config, "get_token", return_value="token"), patch.object(
+            config, "hedge_percentile", 95
+        ), patch.object(config, "hedge_budget", 0.5), patch.object(
+            config, "parallelism", 2
+        ), patch.object(
+            api_client._session, "get", side_effect=get
+        ):
+            df = api_client.get_data("x", {}, paginate=True)
+
+        self.assertLess(time.monotonic() - start, 1.5)
+        self.assertEqual(sorted(df["page"]), list(range(1, 31)))
+        self.assertGreaterEqual(hedge.stats()["won"], 1)
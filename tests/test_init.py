@@ -0,0 +1,44 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import subprocess
+import sys
+import unittest
+
+import spgci
+
+
+class LazyImportTest(unittest.TestCase):
+    def test_import_does_not_load_clients(self):
+        code = (
+            "import sys, spgci; "
+            "print(sorted(m for m in ('pandas', 'requests', 'spgci.market_data') "
+            "if m in sys.modules))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], check=True, capture_output=True, text=True
+        ).stdout
+        self.assertEqual(out.strip(), "[]")
+
+    def test_names_resolve_on_access(self):
+        from spgci.market_data import MarketData
+
+        self.assertIs(spgci.MarketData, MarketData)
+        self.assertIn("Metals", dir(spgci))
+        self.assertTrue(callable(spgci.utilities.build_filter_expression))
+        for name in spgci.__all__:
+            self.assertIsNotNone(getattr(spgci, name))
+
+    def test_unknown_names_raise_attribute_error(self):
+        self.assertFalse(hasattr(spgci, "NoSuchClient"))
@@ -12,12 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gzip
+import hashlib
+import io
+import os
+import tempfile
+import threading
 import unittest
 import pytest
 from datetime import datetime
 from pandas import DataFrame
 from typing import cast
-from spgci import Insights
+from unittest.mock import patch
+from spgci import Insights, insights
 
 
 class InsightsTest(unittest.TestCase):
@@ -165,3 +172,132 @@ class InsightsTest(unittest.TestCase):
             ),
         )
         self.assertGreater(len(df), 0)
+
+
+DOCS = {
+    "a": b"%PDF-" + b"a" * 5000,
+    "b": b"%PDF-" + b"b" * 3000,
+}
+
+
+class _Response:
+    def __init__(self, status_code, headers, body, cut=None, wire=None):
+        self.url = "https://api.example/content"
+        self.status_code = status_code
+        self.headers = headers
+        self._body = body if cut is None else body[:cut]
+        self.raw = io.BytesIO(self._body if wire is None else wire)
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self._body), chunk_size):
+            yield self._body[start : start + chunk_size]
+        self.raw.seek(0, io.SEEK_END)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _Server:
+    """
+    Serves ``DOCS`` honouring ``Range``, optionally cutting one body short or
+    gzipping every body whatever the ``Accept-Encoding``.
+    """
+
+    def __init__(self, cut=None, compress=False):
+        self.cut = dict(cut or {})
+        self.compress = compress
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def __call__(self, url, params, session, headers=None):
+        id = url.rsplit("/", 1)[1]
+        offset = int((headers or {}).get("Range", "bytes=0-")[6:-1])
+        with self._lock:
+            self.requests.append((id, offset))
+            cut = self.cut.pop(id, None)
+        response_headers = {
+            "content-type": "application/pdf",
+            "content-disposition": f'attachment; filename="../report-{id}.pdf"',
+        }
+        if self.compress:
+            # the range applies to the compressed bytes
+            wire = gzip.compress(DOCS[id], mtime=0)[offset:]
+            response_headers["content-encoding"] = "gzip"
+            response_headers["content-length"] = str(len(wire))
+            body = DOCS[id] if not offset else wire
+            return _Response(206 if offset else 200, response_headers, body, wire=wire)
+        body = DOCS[id][offset:]
+        response_headers["content-length"] = str(len(body))
+        return _Response(206 if offset else 200, response_headers, body, cut)
+
+
+class DownloadContentsTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+
+    def _download(self, server, ids, **kwargs):
+        with patch.object(insights, "_get_stream", side_effect=server):
+            return Insights().download_contents(ids, self.dir.name, **kwargs)
+
+    def test_downloads_and_skips_completed_files(self):
+        server = _Server()
+        df = self._download(server, DataFrame({"id": ["a", "b", "a"]}), chunk_size=512)
+
+        self.assertEqual(df["status"].tolist(), ["downloaded", "downloaded"])
+        for id in DOCS:
+            path = os.path.join(self.dir.name, f"report-{id}.pdf")
+            with open(path, "rb") as fh:
+                self.assertEqual(fh.read(), DOCS[id])
+        self.assertEqual(df["sha256"][0], hashlib.sha256(DOCS["a"]).hexdigest())
+
+        again = self._download(server, ["a", "b"], verify="hash")
+        self.assertEqual(again["status"].tolist(), ["skipped", "skipped"])
+        self.assertEqual(len(server.requests), 2)
+
+    def test_resumes_an_interrupted_download(self):
+        server = _Server(cut={"a": 2048})
+        with self.assertWarns(UserWarning):
+            failed = self._download(server, ["a", "b"], errors="skip")
+        self.assertEqual(failed["status"].tolist(), ["failed", "downloaded"])
+        self.assertEqual(os.path.getsize(os.path.join(self.dir.name, "a.part")), 2048)
+
+        df = self._download(server, ["a", "b"])
+
+        self.assertEqual(df["status"].tolist(), ["resumed", "skipped"])
+        self.assertIn(("a", 2048), server.requests)
+        with open(df["path"][0], "rb") as fh:
+            self.assertEqual(fh.read(), DOCS["a"])
+        self.assertEqual(df["sha256"][0], hashlib.sha256(DOCS["a"]).hexdigest())
+        self.assertFalse(os.path.exists(os.path.join(self.dir.name, "a.part")))
+
+    def test_redownloads_a_file_that_changed_on_disk(self):
+        server = _Server()
+        self._download(server, ["b"])
+        with open(os.path.join(self.dir.name, "report-b.pdf"), "ab") as fh:
+            fh.write(b"x")
+
+        df = self._download(server, ["b"])
+
+        self.assertEqual(df["status"].tolist(), ["downloaded"])
+        self.assertEqual(os.path.getsize(df["path"][0]), len(DOCS["b"]))
+
+    def test_compressed_responses_are_checked_against_wire_bytes(self):
+        server = _Server(cut={"a": 2048})
+        with self.assertWarns(UserWarning):
+            self._download(server, ["a"], errors="skip")
+
+        server.compress = True
+        df = self._download(server, ["a", "b"])
+
+        self.assertEqual(df["status"].tolist(), ["downloaded", "downloaded"])
+        self.assertEqual(server.requests[1:], [("a", 2048), ("a", 0), ("b", 0)])
+        for id, path in zip(df["id"], df["path"]):
+            with open(path, "rb") as fh:
+                self.assertEqual(fh.read(), DOCS[id])
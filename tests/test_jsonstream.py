@@ -0,0 +1,140 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import json
+import unittest
+from functools import partial
+from unittest.mock import patch
+
+import pandas as pd
+import requests
+from pandas.testing import assert_frame_equal
+from spgci import api_client, config
+from spgci.jsonstream import iter_records, read_frame
+
+RECORDS = [
+    {"symbol": "PCAAS00", "value": 71.25, "bate": "c", "note": "Brent — dated"},
+    {"symbol": "PCAAT00", "value": -3, "bate": "h", "note": None},
+    {"symbol": "AAGZU00", "value": 1e-3, "bate": "l", "extra": [1, {"a": "}]"}]},
+]
+
+
+def _chunks(body: bytes, size: int = 3):
+    return iter([body[i : i + size] for i in range(0, len(body), size)])
+
+
+def _response(document, chunked=True):
+    body = json.dumps(document, ensure_ascii=False).encode()
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.raw = io.BytesIO(body)
+    resp.headers["content-type"] = "application/json"
+    if chunked:
+        resp.headers["transfer-encoding"] = "chunked"
+    else:
+        resp.headers["content-length"] = str(len(body))
+    return resp
+
+
+class IterRecordsTest(unittest.TestCase):
+    def test_reads_records_across_chunk_boundaries(self):
+        document = {"metadata": {"totalPages": 3}, "results": RECORDS, "count": 12}
+        body = json.dumps(document, ensure_ascii=False, indent=1).encode()
+        for size in (1, 2, 7, 64):
+            envelope = {}
+            records = list(iter_records(_chunks(body, size), "results", envelope))
+            self.assertEqual(records, RECORDS)
+            self.assertEqual(envelope, {"metadata": {"totalPages": 3}, "count": 12})
+
+    def test_reads_top_level_arrays_and_empty_results(self):
+        body = json.dumps([1, 22, 333]).encode()
+        self.assertEqual(
+            list(iter_records(_chunks(body, 1), "results", {})), [1, 22, 333]
+        )
+        body = b'{"results": [], "metadata": {}}'
+        self.assertEqual(list(iter_records(_chunks(body), "results", {})), [])
+
+    def test_missing_key_and_truncated_bodies_raise(self):
+        with self.assertRaises(KeyError):
+            list(iter_records(_chunks(b'{"metadata": {}}'), "results", {}))
+        with self.assertRaises(ValueError):
+            list(iter_records(_chunks(b'{"results": [{"a": 1}, {"a"'), "results", {}))
+
+
+class ReadFrameTest(unittest.TestCase):
+    def setUp(self):
+        # streaming is opt-in
+        patcher = patch.object(config, "stream_json_bytes", 1 << 20)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_builds_the_same_frame_in_chunks(self):
+        document = {"results": RECORDS * 5, "metadata": {"totalPages": 2}}
+        resp = _response(document)
+
+        df = read_frame(resp, "results", chunk_rows=4)
+
+        assert_frame_equal(df, pd.DataFrame(RECORDS * 5))
+        # the rest of the body is still there for the pagination functions
+        self.assertEqual(resp.json(), {"metadata": {"totalPages": 2}})
+        self.assertTrue(api_client._paginate(resp).has_more_pages)
+
+    def test_normalizes_each_chunk(self):
+        results = [
+            {"symbol": s, "data": [{"bate": "c", "value": i}]}
+            for i, s in enumerate("abcde")
+        ]
+        resp = _response({"results": results}, chunked=False)
+        to_frame = partial(pd.json_normalize, record_path=["data"], meta="symbol")
+
+        with patch.object(config, "stream_json_bytes", 1):
+            df = read_frame(resp, "results", to_frame, chunk_rows=2)
+
+        assert_frame_equal(df, to_frame(results))
+
+    def test_small_bodies_are_read_whole(self):
+        resp = _response({"results": RECORDS, "metadata": {}}, chunked=False)
+
+        df = read_frame(resp)
+
+        assert_frame_equal(df, pd.DataFrame(RECORDS))
+        self.assertEqual(resp.json()["results"], RECORDS)
+
+    def test_paginated_call_streams_every_page(self):
+        def get(url, params, stream=False, **kwargs):
+            self.assertTrue(stream)
+            page = params.get("page", 1)
+            results = [{"page": page, "row": row} for row in range(3)]
+            return _response({"metadata": {"totalPages": 4}, "results": results})
+
+        with patch.object(config, "get_token", return_value="token"), patch.object(
+            api_client._session, "get", side_effect=get
+        ):
+            df = api_client.get_data("x", {}, paginate=True)
+
+        self.assertEqual(len(df), 12)
+        self.assertEqual(sorted(set(df["page"])), [1, 2, 3, 4])
+
+    def test_requests_are_not_streamed_when_disabled(self):
+        def get(url, params, stream=False, **kwargs):
+            self.assertFalse(stream)
+            return _response({"metadata": {"totalPages": 1}, "results": RECORDS})
+
+        with patch.object(config, "stream_json_bytes", 0), patch.object(
+            config, "get_token", return_value="token"
+        ), patch.object(api_client._session, "get", side_effect=get):
+            df = api_client.get_data("x", {})
+
+        assert_frame_equal(df, pd.DataFrame(RECORDS))
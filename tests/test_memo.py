@@ -0,0 +1,99 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import requests
+from spgci import config
+from spgci.memo import MemoryMemoStore, PostMemo, SQLiteMemoStore, body_key
+from spgci.scenario_manager import FuelBlend, FuelConsumption
+
+URL = "https://api.example.com/calc"
+
+
+def _response(payload: bytes = b'{"penalty": 1}') -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["content-type"] = "application/json"
+    response._content = payload
+    return response
+
+
+class BodyKeyTest(unittest.TestCase):
+    def test_dataclasses_and_key_order_do_not_matter(self):
+        blend = FuelBlend(fuels=[FuelConsumption(fuel="VLSFO", consumption=50)])
+        a = {"fuelBlends": [blend], "reportingPeriod": "2025-2029"}
+        b = {
+            "reportingPeriod": "2025-2029",
+            "fuelBlends": [{"fuels": [{"consumption": 50, "fuel": "VLSFO"}]}],
+        }
+
+        self.assertEqual(body_key(URL, a), body_key(URL, b))
+        self.assertNotEqual(body_key(URL, a), body_key(URL + "2", a))
+
+    def test_tokens_do_not_share_keys(self):
+        with patch.object(config, "get_token", return_value="a"):
+            a = body_key(URL, {"x": 1})
+        with patch.object(config, "get_token", return_value="b"):
+            b = body_key(URL, {"x": 1})
+
+        self.assertNotEqual(a, b)
+
+
+class PostMemoTest(unittest.TestCase):
+    def test_hits_misses_and_expiry(self):
+        memo = PostMemo(MemoryMemoStore())
+        calls = []
+
+        def send():
+            calls.append(1)
+            return _response()
+
+        with patch("spgci.memo.time.time", return_value=1000.0):
+            memo.fetch(URL, {"a": 1}, send, ttl=60)
+            cached = memo.fetch(URL, {"a": 1}, send, ttl=60)
+        with patch("spgci.memo.time.time", return_value=1100.0):
+            memo.fetch(URL, {"a": 1}, send, ttl=60)
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(cached.json(), {"penalty": 1})
+        self.assertEqual(
+            memo.stats(), {"hits": 1, "misses": 1, "expired": 1, "stored": 2}
+        )
+
+    def test_failures_are_not_stored(self):
+        memo = PostMemo(MemoryMemoStore())
+        failed = _response(b"{}")
+        failed.status_code = 500
+
+        memo.fetch(URL, {}, lambda: failed, ttl=60)
+        memo.fetch(URL, {}, lambda: failed, ttl=60)
+
+        self.assertEqual(memo.stats()["misses"], 2)
+
+    def test_sqlite_store_is_shared(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "memo.db")
+            PostMemo(SQLiteMemoStore(path)).fetch(URL, {"a": 1}, _response, ttl=60)
+
+            other = PostMemo(SQLiteMemoStore(path))
+            response = other.fetch(
+                URL, {"a": 1}, lambda: self.fail("sent again"), ttl=60
+            )
+
+        self.assertEqual(response.headers["Content-Type"], "application/json")
+        self.assertEqual(other.stats()["hits"], 1)
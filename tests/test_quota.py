@@ -0,0 +1,114 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import time
+import unittest
+from contextlib import contextmanager
+from unittest.mock import Mock, patch
+from requests import Response
+from spgci import api_client, config, quota
+from spgci.exceptions import DailyLimitError
+
+
+def _response(remaining_day: int) -> Response:
+    resp = Response()
+    resp.headers["x-ratelimit-remaining-day"] = str(remaining_day)
+    return resp
+
+
+class QuotaTest(unittest.TestCase):
+    def test_slots_spaced_per_second(self):
+        coordinator = quota.QuotaCoordinator(per_second=20)
+        start = time.time()
+        for _ in range(5):
+            coordinator.acquire()
+
+        self.assertGreaterEqual(time.time() - start, 0.19)
+        self.assertEqual(coordinator.usage()["used_today"], 5)
+
+    def test_daily_budget_fails_fast(self):
+        coordinator = quota.QuotaCoordinator(per_second=0)
+        coordinator.observe(_response(1))
+        coordinator.acquire()
+
+        with self.assertRaises(DailyLimitError):
+            coordinator.acquire()
+
+    def test_spent_budget_is_probed_and_raised_by_the_server(self):
+        coordinator = quota.QuotaCoordinator(per_second=0)
+        coordinator.probe_seconds = 0.05
+        coordinator.observe(_response(0))
+        # an older response arriving late does not restore the budget
+        coordinator.observe(_response(5))
+        with self.assertRaises(DailyLimitError):
+            coordinator.acquire()
+
+        time.sleep(0.1)
+        coordinator.acquire()
+        with self.assertRaises(DailyLimitError):
+            coordinator.acquire()
+
+        # once no response can be in flight any more, the server's value wins
+        with patch.object(config, "timeout", 0.05, create=True):
+            coordinator.observe(_response(1000))
+        self.assertEqual(coordinator.usage()["remaining_day"], 1000)
+
+    def test_sqlite_budget_shared(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "quota.db")
+            first = quota.QuotaCoordinator(quota.SQLiteQuotaBackend(path), per_second=0)
+            second = quota.QuotaCoordinator(
+                quota.SQLiteQuotaBackend(path), per_second=0
+            )
+
+            first.observe(_response(10))
+            second.acquire()
+            first.acquire()
+
+            self.assertEqual(second.usage()["used_today"], 2)
+            self.assertEqual(first.usage()["remaining_day"], 8)
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(quota.get_coordinator())
+        self.assertEqual(quota.usage(), {})
+
+    def test_quota_is_spent_inside_the_scheduler_slot(self):
+        events = []
+
+        @contextmanager
+        def slot():
+            events.append("slot")
+            yield
+            events.append("release")
+
+        def get(**kwargs):
+            events.append("get")
+            response = _response(100)
+            response.status_code = 200
+            return response
+
+        coordinator = Mock()
+        coordinator.acquire.side_effect = lambda: events.append("acquire")
+        with patch.object(
+            api_client, "get_coordinator", return_value=coordinator
+        ), patch.object(api_client.scheduler, "slot", slot), patch.object(
+            config, "get_token", return_value="token"
+        ), patch.object(
+            api_client._session, "get", side_effect=get
+        ):
+            api_client._get_once("https://x/y", {}, api_client._session)
+
+        self.assertEqual(events, ["slot", "acquire", "get", "release"])
@@ -0,0 +1,243 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest.mock import patch
+from pandas import DataFrame
+from spgci.rsm import Rsm, RsmCase, RsmExecutionTracker
+
+
+def _defaults() -> DataFrame:
+    return DataFrame(
+        [
+            {"category": "percentage", "asset": "Wti", "defaultValue": 60.0},
+            {"category": "percentage", "asset": "Brent", "defaultValue": 40.0},
+            {"category": "percentage", "asset": "Agbami", "defaultValue": 0.0},
+            {"category": "crudePricing", "asset": "Wti", "defaultValue": 70.0},
+            {"category": "crudePricing", "asset": "Brent", "defaultValue": 75.0},
+            {"category": "transportationCosts", "asset": "Wti", "defaultValue": 1.0},
+            {"category": "productPrice", "asset": "Diesel", "defaultValue": 120.0},
+            {
+                "category": "capacityAndUtilization",
+                "asset": "aps",
+                "defaultValue": 500.0,
+            },
+        ]
+    )
+
+
+class RsmCaseTest(unittest.TestCase):
+    def test_set_updates_and_appends(self):
+        case = RsmCase(_defaults()).set_crude("Wti", 50).set_product("Jet", 130)
+
+        self.assertEqual(case.get("percentage", "Wti"), 50)
+        self.assertEqual(case.get("productPrice", "Jet"), 130)
+        self.assertIsNone(case.get("productPrice", "Gasoline"))
+        self.assertEqual(len(case.df), 9)
+        self.assertEqual(
+            case.df.loc[case.df["asset"] == "Wti", "defaultValue"].iloc[0], 50
+        )
+
+    def test_df_edits_do_not_reach_case(self):
+        case = RsmCase(_defaults())
+        df = case.df
+        df.drop(index=df.index[0], inplace=True)
+        df.sort_values("asset", ascending=False, inplace=True)
+
+        case.set_many({("percentage", "Wti"): 50})
+
+        self.assertEqual(len(case.df), len(_defaults()))
+        keys = ["category", "asset"]
+        self.assertTrue(case.df[keys].equals(_defaults()[keys]))
+        self.assertEqual(case.get("percentage", "Wti"), 50)
+        self.assertEqual(
+            case.df.loc[case.df["asset"] == "Wti", "defaultValue"].iloc[0], 50
+        )
+
+    def test_set_crude_slate_zeroes_others(self):
+        case = RsmCase(_defaults()).set_crude_slate({"Agbami": 100})
+        crudes = Rsm._build_sections(case.df)["crudes"]
+
+        self.assertEqual([c["crudeType"] for c in crudes], ["Agbami"])
+        self.assertEqual(case.get("percentage", "Wti"), 0)
+
+    def test_payload_sections_clean_values_and_are_cached(self):
+        case = RsmCase(_defaults()).set("crudePricing", "Brent", float("inf"))
+        sections = Rsm._build_sections(case.df)
+
+        self.assertEqual(
+            sections["crudes"],
+            [
+                {
+                    "crudeType": "Brent",
+                    "percentage": 40.0,
+                    "crudePricing": 0.0,
+                    "transportationCosts": 0.0,
+                },
+                {
+                    "crudeType": "Wti",
+                    "percentage": 60.0,
+                    "crudePricing": 70.0,
+                    "transportationCosts": 1.0,
+                },
+            ],
+        )
+        self.assertEqual(sections["products"][0]["transportationCosts"], 0.0)
+        sections["crudes"][0]["percentage"] = 100.0
+        sections["products"].clear()
+
+        with patch.object(Rsm, "_payload_rows") as rows:
+            cached = Rsm._build_sections(case.copy().df)
+        rows.assert_not_called()
+        self.assertEqual(cached["crudes"][0]["percentage"], 40.0)
+        self.assertEqual(len(cached["products"]), 1)
+
+    def test_set_many_from_frame(self):
+        overrides = DataFrame(
+            {
+                "category": ["productPrice", "crudePricing"],
+                "asset": ["Diesel", "Brent"],
+                "defaultValue": [140.0, 80.0],
+            }
+        )
+        base = RsmCase(_defaults())
+        case = base.copy(name="Case 2").set_many(overrides)
+
+        self.assertEqual(case.get("productPrice", "Diesel"), 140)
+        self.assertEqual(case.get("crudePricing", "Brent"), 80)
+        self.assertEqual(base.get("productPrice", "Diesel"), 120)
+
+
+class RsmSweepTest(unittest.TestCase):
+    def test_run_sweep_tags_outputs(self):
+        rsm = Rsm()
+        statuses = {}
+
+        def run_scenario(**kwargs):
+            pct = kwargs["cases"][0].get("percentage", "Wti")
+            return DataFrame({"scenarioId": [f"s{pct:g}"]})
+
+        def execute_scenario(scenario_id):
+            statuses[f"e{scenario_id}"] = iter(["Running", "Completed"])
+            return DataFrame({"executionId": [f"e{scenario_id}"]})
+
+        def get_execution_status(execution_id):
+            return DataFrame({"status": [next(statuses[execution_id])]})
+
+        def get_output(scenario_id, execution_id, paginate):
+            return DataFrame({"scenarioId": [scenario_id], "margin": [1.0]})
+
+        grid = Rsm.sweep_grid(
+            RsmCase(_defaults()),
+            {"wti": [10, 20]},
+            lambda case, p: case.set_crude("Wti", p["wti"]),
+        )
+
+        with patch.multiple(
+            rsm,
+            run_scenario=run_scenario,
+            execute_scenario=execute_scenario,
+            get_execution_status=get_execution_status,
+            get_scenario_manager_output=get_output,
+        ):
+            result = rsm.run_sweep(
+                grid,
+                period="01/01/2026",
+                region="North America",
+                refinery="Baytown | ExxonMobil",
+                refineryid=1015,
+                poll_interval=0.01,
+            )
+
+        self.assertEqual(sorted(result["wti"]), [10, 20])
+        self.assertEqual(
+            dict(zip(result["wti"], result["scenarioId"])), {10: "s10", 20: "s20"}
+        )
+        self.assertEqual(list(result.columns), ["wti", "scenarioId", "margin"])
+
+    def test_tag_keeps_output_columns(self):
+        output = DataFrame({"margin": [1.0, 2.0], "wti": ["a", "b"]})
+        tagged = Rsm._tag(output, {"wti": 10, "brent": 20})
+
+        self.assertEqual(list(tagged.columns), ["param.wti", "brent", "margin", "wti"])
+        self.assertEqual(tagged["wti"].tolist(), ["a", "b"])
+        self.assertEqual(tagged["param.wti"].tolist(), [10, 10])
+
+
+class RsmExecutionTrackerTest(unittest.TestCase):
+    def test_tracks_many_executions(self):
+        rsm = Rsm()
+        polls = {"e1": iter(["Queued", "Running", "Completed"]), "e2": iter(["Failed"])}
+        fetched = []
+
+        def get_execution_status(execution_id):
+            return DataFrame({"status": [next(polls[execution_id])]})
+
+        def get_output(scenario_id, execution_id, paginate):
+            fetched.append(execution_id)
+            return DataFrame({"executionId": [execution_id]})
+
+        with patch.multiple(
+            rsm,
+            get_execution_status=get_execution_status,
+            get_scenario_manager_output=get_output,
+        ):
+            with RsmExecutionTracker(rsm, poll_interval=0.01) as tracker:
+                ok = tracker.track("s1", "e1")
+                failed = tracker.track("s2", "e2")
+
+                self.assertIs(tracker.track("s1", "e1"), ok)
+                self.assertEqual(ok.result(5)["executionId"].iloc[0], "e1")
+                with self.assertRaises(RuntimeError):
+                    failed.result(5)
+
+        self.assertEqual(fetched, ["e1"])
+
+    def test_status_errors_are_retried(self):
+        rsm = Rsm()
+        polls = {
+            "e1": iter([ConnectionError("reset"), "Running", "Completed"]),
+            "e2": iter([ConnectionError("reset")] * 2),
+        }
+
+        def get_execution_status(execution_id):
+            status = next(polls[execution_id])
+            if isinstance(status, Exception):
+                raise status
+            return DataFrame({"status": [status]})
+
+        with patch.object(rsm, "get_execution_status", get_execution_status):
+            with RsmExecutionTracker(
+                rsm, poll_interval=0.01, fetch_output=False, max_status_errors=2
+            ) as tracker:
+                ok = tracker.track("s1", "e1")
+                broken = tracker.track("s2", "e2")
+
+                self.assertEqual(ok.result(5)["status"].iloc[0], "Completed")
+                with self.assertRaises(ConnectionError):
+                    broken.result(5)
+
+    def test_poller_errors_fail_the_executions(self):
+        rsm = Rsm()
+        status = DataFrame({"status": ["Completed"]})
+
+        with patch.object(rsm, "get_execution_status", return_value=status):
+            tracker = RsmExecutionTracker(rsm, poll_interval=0.01)
+            # outputs can no longer be fetched once the tracker is closed
+            tracker.close()
+            with self.assertRaises(RuntimeError):
+                tracker.track("s1", "e1").result(5)
+
+            tracker.fetch_output = False
+            self.assertIs(tracker.track("s2", "e2").result(5), status)
@@ -0,0 +1,155 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+import requests
+from pandas import DataFrame
+from spgci import api_client, memo, scenario_manager
+from spgci.scenario_manager import FuelBlend, FuelConsumption, ScenarioManager
+
+
+def _penalty(path, body, df_fn):
+    fuel = json.loads(json.dumps(body))["fuelBlends"][0]["fuels"][0]["fuel"]
+    response = Mock()
+    response.json.return_value = {
+        "penalty": len(fuel),
+        "costBreakdown": [
+            {"component": "fuel", "cost": 1.0},
+            {"component": "ets", "cost": 2.0},
+        ],
+    }
+    return df_fn(response)
+
+
+class ScenarioManagerBatchTest(unittest.TestCase):
+    def setUp(self):
+        memo.clear()
+
+    def _voyages(self):
+        vlsfo = [FuelBlend(fuels=[FuelConsumption(fuel="VLSFO", consumption=100)])]
+        lng = [{"fuels": [{"fuel": "LNG", "consumption": 100}]}]
+        return DataFrame(
+            {
+                "voyage": ["a", "b", "c"],
+                "origin_port": ["Rotterdam, Europe"] * 3,
+                "destination_port": ["New York, Americas"] * 3,
+                "fuel_blends": [vlsfo, lng, vlsfo],
+                "reporting_period": "2025-2029",
+                "ghg_intensity_lng": [np.nan, 76.08, np.nan],
+            },
+            index=[10, 11, 12],
+        )
+
+    def test_batch_dedupes_and_joins_breakdown(self):
+        bodies = []
+        lock = threading.Lock()
+
+        def post(path, body, df_fn, memo):
+            with lock:
+                bodies.append(body)
+            return _penalty(path, body, df_fn)
+
+        with patch.object(scenario_manager, "post_data", side_effect=post):
+            df = ScenarioManager().calculate_eu_compliance_penalty_batch(
+                self._voyages()
+            )
+
+        self.assertEqual(len(bodies), 2)
+        lng = next(b for b in bodies if "ghgIntensityValues" in b)
+        self.assertEqual(lng["ghgIntensityValues"], {"lng": 76.08})
+        self.assertEqual(len(df), 6)
+        self.assertEqual(list(df.index), [10, 10, 11, 11, 12, 12])
+        self.assertEqual(list(df["component"][:2]), ["fuel", "ets"])
+        self.assertEqual(df.loc[11, "penalty"].tolist(), [3, 3])
+        self.assertIn("voyage", df.columns)
+
+    def test_batch_reuses_memoised_results(self):
+        def post(url, body, session):
+            response = requests.Response()
+            response.status_code = 200
+            response.headers["content-type"] = "application/json"
+            response._content = json.dumps(
+                {"penalty": 1, "costBreakdown": [{"component": "fuel"}]}
+            ).encode()
+            return response
+
+        with patch.object(api_client, "_post", side_effect=post) as sent:
+            first = ScenarioManager().calculate_eu_compliance_penalty_batch(
+                self._voyages(), cache=True
+            )
+            second = ScenarioManager().calculate_eu_compliance_penalty_batch(
+                self._voyages(), cache=True
+            )
+
+        self.assertEqual(sent.call_count, 2)
+        self.assertEqual(memo.stats()["hits"], 2)
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_batch_keeps_one_row_per_input(self):
+        def post(path, body, df_fn, memo):
+            self.assertFalse(memo)
+            if "ghgIntensityValues" in body:
+                return DataFrame(columns=["penalty", "component"])
+            return _penalty(path, body, df_fn)
+
+        voyages = self._voyages().assign(penalty=["x", "y", "z"])
+        with patch.object(scenario_manager, "post_data", side_effect=post):
+            df = ScenarioManager().calculate_eu_compliance_penalty_batch(voyages)
+
+        self.assertEqual(list(df.index), [10, 10, 11, 12, 12])
+        self.assertTrue(df.loc[[11], "penalty"].isna().all())
+        self.assertEqual(df.loc[[11], "input.penalty"].tolist(), ["y"])
+        self.assertEqual(df["penalty"].tolist()[:2], [5, 5])
+
+    def test_single_calls_are_memoised_on_request(self):
+        blends = [FuelBlend(fuels=[FuelConsumption(fuel="VLSFO", consumption=100)])]
+        args = ("Rotterdam, Europe", "New York, Americas", blends, "2025-2029")
+
+        with patch.object(scenario_manager, "post_data") as post:
+            ScenarioManager().calculate_eu_compliance_penalty(*args)
+            self.assertFalse(post.call_args.kwargs["memo"])
+            ScenarioManager().calculate_eu_compliance_penalty(*args, memo=True)
+            self.assertTrue(post.call_args.kwargs["memo"])
+            ScenarioManager().calculate_ondemand_price(
+                "2026-02-15", "2026-02-17", "Gasoline", "Unl 87"
+            )
+            self.assertFalse(post.call_args.kwargs["memo"])
+
+    def test_batch_skips_failures(self):
+        def post(path, body, df_fn, memo):
+            if "ghgIntensityValues" in body:
+                raise RuntimeError("boom")
+            return _penalty(path, body, df_fn)
+
+        with patch.object(scenario_manager, "post_data", side_effect=post):
+            with self.assertRaises(RuntimeError):
+                ScenarioManager().calculate_eu_compliance_penalty_batch(self._voyages())
+            with self.assertWarns(UserWarning):
+                df = ScenarioManager().calculate_eu_compliance_penalty_batch(
+                    self._voyages(), errors="skip"
+                )
+
+        self.assertEqual(sorted(set(df.index)), [10, 12])
+
+    def test_ondemand_batch_requires_columns(self):
+        with self.assertRaises(ValueError):
+            ScenarioManager().calculate_ondemand_price_batch(
+                DataFrame({"commodity": ["Gasoline"]})
+            )
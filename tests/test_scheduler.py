@@ -0,0 +1,57 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import unittest
+from unittest.mock import patch
+from spgci import config
+from spgci.scheduler import Priority, RequestScheduler, current_priority, priority
+
+
+class SchedulerTest(unittest.TestCase):
+    def test_interactive_served_before_queued_bulk(self):
+        sched = RequestScheduler()
+        order = []
+
+        def run(level):
+            with sched.slot(level):
+                order.append(level)
+
+        with patch.object(config, "max_concurrent_requests", 1):
+            with sched.slot(Priority.BULK):
+                bulk = threading.Thread(target=run, args=(Priority.BULK,))
+                bulk.start()
+                time.sleep(0.05)
+                interactive = threading.Thread(target=run, args=(Priority.INTERACTIVE,))
+                interactive.start()
+                time.sleep(0.05)
+            bulk.join(2)
+            interactive.join(2)
+
+        self.assertEqual(order, [Priority.INTERACTIVE, Priority.BULK])
+        self.assertEqual(sched.stats()["bulk"]["served"], 2)
+
+    def test_class_limit_leaves_capacity_for_interactive(self):
+        sched = RequestScheduler()
+        with patch.object(config, "priority_concurrency", {"bulk": 1}):
+            with sched.slot(Priority.BULK):
+                self.assertFalse(sched._can_start(Priority.BULK))
+                self.assertTrue(sched._can_start(Priority.INTERACTIVE))
+
+    def test_priority_context(self):
+        self.assertEqual(current_priority(), Priority.INTERACTIVE)
+        with priority(Priority.BULK):
+            self.assertEqual(current_priority(), Priority.BULK)
+        self.assertEqual(current_priority(), Priority.INTERACTIVE)
@@ -14,7 +14,7 @@
 
 import unittest
 from spgci import utilities, market_data
-from pandas import Series
+from pandas import DataFrame, Series
 from datetime import date
 
 
@@ -37,6 +37,26 @@ class UtilitiesTest(unittest.TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_cached_filters_keep_value_types(self):
+        self.assertEqual(utilities.list_to_filter("x", [1]), "x in (1)")
+        self.assertEqual(utilities.list_to_filter("x", [True]), "x in (True)")
+        self.assertEqual(utilities.list_to_filter("x", [1.0]), "x in (1.0)")
+
+    def test_categorical_series_to_filter(self):
+        ser = Series(["abc", "def", "abc"], dtype="category")
+        actual = utilities.list_to_filter("curve_codes", ser)
+
+        self.assertEqual(actual, 'curve_codes in ("abc","def","abc")')
+        self.assertEqual(
+            utilities.list_to_filter("id", Series([1, 2], dtype="category")),
+            "id in (1,2)",
+        )
+
+    def test_missing_values_are_rejected(self):
+        for values in (["ABC", None], [1, float("nan")], Series([1.5, None])):
+            with self.assertRaises(ValueError):
+                utilities.list_to_filter("curve_codes", values)
+
     def test_list_enum_to_filter(self):
         expected = 'curve_codes in ("future","swap")'
         actual = utilities.list_to_filter(
@@ -103,3 +123,58 @@ class UtilitiesTest(unittest.TestCase):
         actual = utilities.list_to_filter("curve_codes", ser)
 
         self.assertEqual(expected, actual)
+
+    def test_series_bool_to_filter(self):
+        expected = "active in (True,False)"
+        actual = utilities.list_to_filter("active", Series([True, False]))
+
+        self.assertEqual(expected, actual)
+
+    def test_large_series_to_filter(self):
+        ser: Series[int] = Series(range(100_000))
+        actual = utilities.list_to_filter("id", ser)
+
+        self.assertTrue(actual.startswith("id in (0,1,2,"))
+        self.assertTrue(actual.endswith(",99999)"))
+
+    def test_odata_quote_escaped(self):
+        expected = "owner in ('O''Brien','Shell')"
+        actual = utilities.odata_list_to_filter("owner", ["O'Brien", "Shell"])
+
+        self.assertEqual(expected, actual)
+
+    def test_list_filter_cached(self):
+        utilities._cached_in_filter.cache_clear()
+        utilities.list_to_filter("curve_codes", ["ABC", "XYZ"])
+        utilities.list_to_filter("curve_codes", ["ABC", "XYZ"])
+
+        self.assertEqual(utilities._cached_in_filter.cache_info().hits, 1)
+
+        # long collections are not kept alive by the cache
+        utilities.list_to_filter("curve_codes", [str(i) for i in range(1000)])
+        self.assertEqual(utilities._cached_in_filter.cache_info().currsize, 1)
+
+    def test_unsupported_list_to_filter(self):
+        with self.assertRaises(TypeError):
+            utilities.list_to_filter("curve_codes", [object()])
+
+    def test_strip_html(self):
+        texts = [
+            "<p>Brent&nbsp;&ndash; OPEC&#39;s &amp;lt;cut&gt;</p>\n",
+            "R&D <a\nhref='x'>link</a> &copy",
+            None,
+        ]
+        expected = [
+            " Brent\xa0\u2013 OPEC's &lt;cut>  ",
+            "R&D <a href='x'>link  \xa9",
+            None,
+        ]
+
+        self.assertEqual(utilities.strip_html(texts), expected)
+
+    def test_strip_html_columns(self):
+        df = DataFrame({"body": ["<b>a</b>", None], "id": [1, 2]})
+        utilities.strip_html_columns(df, ["headline", "body"])
+
+        self.assertEqual(df["body"].tolist()[0], " a ")
+        self.assertTrue(df["body"].isna().iloc[1])
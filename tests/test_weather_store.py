@@ -0,0 +1,96 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from datetime import timedelta
+from unittest.mock import Mock
+
+import pandas as pd
+from pandas import DataFrame
+from spgci.weather_store import WeatherForecastStore
+
+
+def _forecasts(recorded_dates):
+    rows = []
+    for recorded in recorded_dates:
+        for weather_date in ("2026-01-05", "2026-01-06"):
+            for market, city in (("United States", "Boston"), ("France", "Paris")):
+                rows.append(
+                    {
+                        "market": market,
+                        "city": city,
+                        "location": None,
+                        "weatherDate": pd.Timestamp(weather_date),
+                        "recordedDate": pd.Timestamp(recorded),
+                        "modifiedDate": pd.Timestamp(f"{recorded}T06:00Z"),
+                        "tempMax": float(len(rows)),
+                    }
+                )
+    return DataFrame(rows)
+
+
+class WeatherForecastStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.store = WeatherForecastStore()
+        self.store.ingest(_forecasts(["2026-01-01", "2026-01-02", "2026-01-03"]))
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_latest_as_of(self):
+        latest = self.store.latest()
+        as_of = self.store.latest("2026-01-02", city="Boston")
+
+        self.assertEqual(len(latest), 4)
+        self.assertTrue((latest["recordedDate"] == "2026-01-03").all())
+        self.assertEqual(as_of["tempMax"].tolist(), [4.0, 6.0])
+        self.assertTrue(as_of["location"].isna().all())
+
+    def test_revisions_are_numbered(self):
+        revisions = self.store.revisions(city="Paris", weather_date_lte="2026-01-05")
+
+        self.assertEqual(revisions["revision"].tolist(), [0, 1, 2])
+        self.assertEqual(revisions["tempMax"].tolist(), [1.0, 5.0, 9.0])
+
+    def test_prune_keeps_latest_vintage(self):
+        self.assertEqual(self.store.prune(keep_vintages=2), 4)
+        self.assertEqual(self.store.prune(older_than=timedelta(days=1)), 4)
+
+        remaining = self.store.revisions()
+        self.assertEqual(len(remaining), 4)
+        self.assertTrue((remaining["recordedDate"] == "2026-01-03").all())
+
+    def test_update_fetches_rows_modified_since_last_update(self):
+        client = Mock()
+        client.get_forecast.return_value = _forecasts(["2026-01-03"])
+        store = WeatherForecastStore(client=client)
+
+        self.assertEqual(store.update(market="France"), 4)
+        client.get_forecast.assert_called_with(paginate=True, market="France")
+
+        client.get_forecast.return_value = _forecasts(["2026-01-04"])
+        self.assertEqual(store.update(market="France"), 4)
+        client.get_forecast.assert_called_with(
+            paginate=True, market="France", modified_date_gte="2026-01-03T05:55:00Z"
+        )
+        self.assertTrue((store.latest()["recordedDate"] == "2026-01-04").all())
+
+        # rows read again inside the lookback window replace themselves
+        stored = len(store.revisions())
+        store.update(market="France")
+        self.assertEqual(len(store.revisions()), stored)
+
+        # other filters have their own watermark and start with a full download
+        store.update(market="United States")
+        client.get_forecast.assert_called_with(paginate=True, market="United States")
@@ -12,11 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import unittest
 import pytest
+from unittest.mock import patch
+from spgci import wrd
 from spgci.wrd import WorldRefineryData
 import spgci.config
-from pandas import Series, DataFrame
+from pandas import Series, DataFrame, Timestamp, json_normalize
+from requests import Response
 from typing import cast
 from datetime import date
 
@@ -234,3 +238,53 @@ class WRDTest(unittest.TestCase):
         print()
         df = cast(DataFrame, self.wrd.get_outages_grouped(country="United States"))
         self.assertGreater(len(df), 1)
+
+    def test_outage_alerts_to_df(self):
+        outages = [
+            {
+                "outageId": 1,
+                "refineryId": 10,
+                "operatorname": "Operator",
+                "countryName": "India",
+                "cityName": "Jamnagar",
+                "latitude": 22.3,
+                "longitude": 70.0,
+                "createdDate": "2026-01-02T08:00:00Z",
+                "alerts": [
+                    {
+                        "alertId": 100 + a,
+                        "unit": {"name": f"Unit {a}"},
+                        "startDate": "2026-01-03T00:00:00",
+                        "endDate": "2026-01-09T00:00:00",
+                        "modifiedDate": "2026-01-02T09:00:00.123Z",
+                    }
+                    for a in range(2)
+                ],
+            },
+            {"outageId": 2, "alerts": []},
+        ]
+        resp = Response()
+        resp._content = json.dumps({"results": outages}).encode()
+
+        df = self.wrd._outage_alerts_to_df(resp)
+        expected = json_normalize(
+            outages, "alerts", self.wrd._alert_meta, errors="ignore"
+        )
+        self.assertEqual(df.columns.tolist(), expected.columns.tolist())
+        self.assertEqual(df["unit.name"].tolist(), ["Unit 0", "Unit 1"])
+        self.assertEqual(df["outageId"].tolist(), [1, 1])
+        self.assertEqual(str(df["createdDate"].dt.tz), "UTC")
+        self.assertEqual(df["startDate"][0], Timestamp("2026-01-03"))
+
+        resp._content = b'{"results": []}'
+        self.assertTrue(self.wrd._outage_alerts_to_df(resp).empty)
+
+        # pandas 1 is given no format, it does not know "ISO8601"
+        with patch.object(wrd.pd, "__version__", "1.5.3"), patch.object(
+            wrd, "to_datetime", side_effect=lambda values, **kwargs: values
+        ) as parsed:
+            resp._content = json.dumps({"results": outages}).encode()
+            self.wrd._outage_alerts_to_df(resp)
+        self.assertEqual(parsed.call_count, 4)
+        for call in parsed.call_args_list:
+            self.assertNotIn("format", call.kwargs)
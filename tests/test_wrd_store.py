@@ -0,0 +1,168 @@
+# Copyright 2026 S&P Global Energy (previously S&P Global Commodity Insights)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest.mock import Mock
+
+import pandas as pd
+from pandas import DataFrame
+from spgci.wrd_store import WorldRefineryStore
+
+_MODIFIED = pd.Timestamp("2026-01-01T00:00Z")
+
+
+def _capacity(**kwargs):
+    return DataFrame(
+        {
+            "CapacityId": [1, 2, 3],
+            "Year": [2024, 2024, 2025],
+            "Quarter": [1, 2, 1],
+            "Capacity": [100.0, 110.0, 120.0],
+            "ModifiedDate": _MODIFIED,
+            "Refinery.Id": [10, 10, 20],
+            "Refinery.Name": ["Alpha", "Alpha", "Beta"],
+            "Refinery.Country.Name": ["India", "India", "Japan"],
+            "ProcessUnit.Name": "Atmos Distillation",
+        }
+    )
+
+
+def _runs(**kwargs):
+    return DataFrame(
+        {
+            "Year": [2024, 2024, 2025],
+            "Quarter": [1, 2, 1],
+            "Runs": [90.0, 95.0, 80.0],
+            "ModifiedDate": _MODIFIED,
+            "Refinery.Id": [10, 10, 20],
+            "Refinery.Name": ["Alpha", "Alpha", "Beta"],
+        }
+    )
+
+
+def _yields(**kwargs):
+    return DataFrame(
+        {
+            "Year": 2024,
+            "Quarter": 1,
+            "Yield": [40.0, 30.0],
+            "ModifiedDate": _MODIFIED,
+            "Refinery.Id": 10,
+            "Product.Name": ["Gasoline", "Diesel"],
+        }
+    )
+
+
+def _client():
+    client = Mock()
+    for method in ("get_outages", "get_ownership"):
+        getattr(client, method).return_value = DataFrame()
+    client.get_capacity.side_effect = _capacity
+    client.get_runs.side_effect = _runs
+    client.get_yields.side_effect = _yields
+    return client
+
+
+class WorldRefineryStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.client = _client()
+        self.store = WorldRefineryStore(client=self.client)
+        self.written = self.store.update(year_gte=2024)
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_update_loads_every_dataset(self):
+        self.assertEqual(
+            self.written,
+            {"capacity": 3, "runs": 3, "yields": 2, "outages": 0, "ownership": 0},
+        )
+        self.client.get_capacity.assert_called_once_with(paginate=True, year_gte=2024)
+        table = self.store.table("capacity", country="India", year_gte=2024)
+        self.assertEqual(table["CapacityId"].tolist(), [1, 2])
+        self.assertEqual(table["ModifiedDate"].tolist(), [_MODIFIED, _MODIFIED])
+
+    def test_join_on_refinery_and_period(self):
+        joined = self.store.join("capacity", "runs", country="India", quarter=2)
+
+        self.assertEqual(joined.columns[:3].tolist(), ["RefineryId", "Year", "Quarter"])
+        self.assertEqual(joined["Capacity"].tolist(), [110.0])
+        self.assertEqual(joined["Runs"].tolist(), [95.0])
+        self.assertEqual(joined["runs.Refinery.Name"].tolist(), ["Alpha"])
+
+        # the join is answered from the indexes
+        plan = self.store._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM capacity AS c JOIN runs AS r"
+            ' ON r."Refinery.Id" = c."Refinery.Id" AND r.Year = c.Year'
+            " AND r.Quarter = c.Quarter"
+        ).fetchall()
+        self.assertIn("USING INDEX runs_", " ".join(str(row) for row in plan))
+
+    def test_incremental_update(self):
+        revised = pd.Timestamp("2026-02-01T00:00Z")
+        self.client.get_capacity.side_effect = None
+        self.client.get_capacity.return_value = _capacity()[1:2].assign(
+            Capacity=115.0, ModifiedDate=revised
+        )
+        self.client.get_runs.side_effect = None
+        self.client.get_runs.return_value = _runs()[:1].assign(
+            Runs=91.0, ModifiedDate=revised
+        )
+
+        self.store.update(year_gte=2024)
+        _, kwargs = self.client.get_capacity.call_args
+        self.assertEqual(kwargs["filter_exp"], "ModifiedDate gt 2026-01-01T00:00:00Z")
+
+        # rows are replaced by id, or by refinery and period without one
+        capacity = self.store.table("capacity")
+        runs = self.store.table("runs")
+        self.assertEqual(capacity["Capacity"].tolist(), [100.0, 115.0, 120.0])
+        self.assertEqual(sorted(runs["Runs"]), [80.0, 91.0, 95.0])
+        self.assertEqual(self.store.last_modified("runs", year_gte=2024), revised)
+
+    def test_rows_without_id_are_upserted_on_their_natural_key(self):
+        revised = pd.Timestamp("2026-02-01T00:00Z")
+        self.client.get_yields.side_effect = None
+        self.client.get_yields.return_value = _yields()[:1].assign(
+            Yield=42.0, ModifiedDate=revised
+        )
+
+        self.store.update(["yields"], year_gte=2024)
+        yields = self.store.table("yields").set_index("Product.Name")["Yield"]
+        self.assertEqual(yields.to_dict(), {"Gasoline": 42.0, "Diesel": 30.0})
+
+    def test_watermark_is_kept_per_filter_set(self):
+        self.store.update(["capacity"], year_gte=2015)
+        # an update with other filters starts with a full download of them
+        _, kwargs = self.client.get_capacity.call_args
+        self.assertEqual(kwargs, {"paginate": True, "year_gte": 2015})
+        self.assertIsNone(self.store.last_modified("capacity", year_gte=2000))
+
+        self.store.update(["capacity"], year_gte=2015)
+        _, kwargs = self.client.get_capacity.call_args
+        self.assertIn("filter_exp", kwargs)
+
+    def test_full_reload_drops_deleted_rows(self):
+        self.client.get_capacity.side_effect = None
+        self.client.get_capacity.return_value = _capacity()[:1]
+
+        self.store.update(["capacity"], full=True)
+        self.assertEqual(self.store.table("capacity")["CapacityId"].tolist(), [1])
+        self.assertNotIn("filter_exp", self.client.get_capacity.call_args.kwargs)
+
+    def test_unloaded_dataset(self):
+        with self.assertRaises(ValueError):
+            WorldRefineryStore(client=Mock()).table("capacity")
+        with self.assertRaises(ValueError):
+            self.store.table("capacity", operator="x")